@@ -0,0 +1,92 @@
+"""
+Benchmark de arranque en frío y reruns de cada página de la app Streamlit.
+
+Para cada página lanza un proceso nuevo que ejecuta la app con el
+AppTest de Streamlit: mide el primer render (arranque en frío con la
+página de Inicio), la primera visita a la página (import diferido de su
+módulo y carga de sus datos) y la mediana de varios reruns posteriores.
+También lista qué librerías pesadas quedaron importadas tras el primer
+render y tras visitar la página.
+
+Uso:
+    python benchmarks/bench_app.py [--reruns 5]
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(PROJECT_ROOT, 'streamlit', 'app.py')
+
+PAGES = ["🏠 Inicio", "📊 EDA", "🤖 Modelo", "🔮 Predicción"]
+HEAVY_MODULES = ['pandas', 'plotly', 'sklearn', 'matplotlib', 'seaborn']
+
+# >> Plantilla ejecutada en cada proceso hijo <<
+PROBE = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+from streamlit.testing.v1 import AppTest
+
+def heavy():
+    return [m for m in {heavy!r} if m in sys.modules]
+
+at = AppTest.from_file({app!r}, default_timeout=120)
+t0 = time.perf_counter()
+at.run()
+cold = time.perf_counter() - t0
+heavy_cold = heavy()
+
+t0 = time.perf_counter()
+at.sidebar.radio[0].set_value({page!r}).run()
+first_visit = time.perf_counter() - t0
+
+reruns = []
+for _ in range({reruns}):
+    t0 = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - t0)
+assert not at.exception, at.exception
+print(json.dumps({{'cold_s': cold, 'first_visit_s': first_visit,
+                  'rerun_s': sorted(reruns)[len(reruns) // 2],
+                  'heavy_cold': heavy_cold, 'heavy_page': heavy()}}))
+"""
+
+
+def medir(page, reruns):
+    """
+    Ejecuta la sonda de una página en un proceso nuevo.
+
+    Parámetros de entrada:
+        page (str): Etiqueta de la página en la navegación.
+        reruns (int): Reruns medidos tras la primera visita.
+
+    Salida:
+        dict: Tiempos de arranque, primera visita y rerun, y librerías importadas.
+    """
+    codigo = PROBE.format(app=APP_PATH, page=page, reruns=reruns, heavy=HEAVY_MODULES)
+    salida = subprocess.run([sys.executable, '-c', codigo], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--reruns', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Página':<16}{'Arranque (s)':>14}{'1ª visita (s)':>15}{'Rerun (s)':>11}  Librerías importadas")
+    print('=' * 96)
+    for page in PAGES:
+        r = medir(page, args.reruns)
+        print(f"{page:<16}{r['cold_s']:>14.2f}{r['first_visit_s']:>15.2f}{r['rerun_s']:>11.3f}  "
+              f"{', '.join(r['heavy_page']) or '-'}")
+    print(f"\nTras el primer render (Inicio): {', '.join(r['heavy_cold']) or 'ninguna'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark de la puntuación por lotes en varios procesos.
+
+Puntúa el mismo conjunto sintético de filas con 1, 4, 16 y 32 workers y
+reporta el rendimiento (filas/s, aceleración frente a 1 worker) y la
+memoria de cada worker: RSS privada (RssAnon) y PSS, que reparte entre los
+procesos las páginas compartidas del modelo heredado del padre.
+
+Uso:
+    python benchmarks/bench_batch.py [--workers 1 4 16 32] [--rows 500000] [--chunksize 20000]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from croprec.batch import start_pool, score_chunks_parallel  # noqa: E402
+from croprec.features import RAW_FEATURES  # noqa: E402
+from croprec.lookup import DATA_PATH  # noqa: E402
+
+
+def filas_sinteticas(n_rows, seed=42):
+    """
+    Filas del dataset remuestreadas con ruido en las variables climáticas.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.read_csv(DATA_PATH, usecols=RAW_FEATURES)
+    X = df.iloc[rng.integers(0, len(df), n_rows)].reset_index(drop=True)
+    for col in ['temperature', 'humidity', 'ph', 'rainfall']:
+        X[col] = X[col] * rng.uniform(0.98, 1.02, n_rows)
+    return X
+
+
+def medir(X, n_workers, chunksize):
+    """
+    Puntúa X con n_workers procesos.
+
+    Parámetros de entrada:
+        X (DataFrame): Filas a puntuar.
+        n_workers (int): Procesos del pool.
+        chunksize (int): Filas por bloque enviado a un worker.
+
+    Salida:
+        dict: Segundos, filas/s y memoria media/máxima por worker.
+    """
+    chunks = (X.iloc[i:i + chunksize] for i in range(0, len(X), chunksize))
+    worker_stats = {}
+    with start_pool(n_workers) as pool:
+        t0 = time.perf_counter()
+        for _ in score_chunks_parallel(chunks, pool, n_workers, keep_inputs=False,
+                                       worker_stats=worker_stats):
+            pass
+        elapsed = time.perf_counter() - t0
+    stats = list(worker_stats.values())
+    return {
+        'elapsed_s': elapsed, 'rows_per_s': len(X) / elapsed, 'active': len(stats),
+        'anon_mb': np.mean([s.get('rss_anon_mb', np.nan) for s in stats]),
+        'pss_mb': np.mean([s.get('pss_mb', np.nan) for s in stats]),
+        'pss_max_mb': np.max([s.get('pss_mb', np.nan) for s in stats]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, nargs='*', default=[1, 4, 16, 32])
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--chunksize', type=int, default=20_000)
+    args = parser.parse_args()
+
+    X = filas_sinteticas(args.rows)
+    print(f"{args.rows:,} filas, bloques de {args.chunksize:,}, {os.cpu_count()} núcleos disponibles\n")
+    print(f"{'Workers':>8}{'Activos':>9}{'Tiempo (s)':>12}{'Filas/s':>12}{'Aceleración':>13}"
+          f"{'RssAnon (MB)':>14}{'PSS (MB)':>10}{'PSS máx.':>10}")
+    print('=' * 88)
+    base = None
+    for n_workers in args.workers:
+        r = medir(X, n_workers, args.chunksize)
+        base = base or r['rows_per_s']
+        print(f"{n_workers:>8}{r['active']:>9}{r['elapsed_s']:>12.2f}{r['rows_per_s']:>12,.0f}"
+              f"{r['rows_per_s'] / base:>12.2f}×{r['anon_mb']:>14.1f}{r['pss_mb']:>10.1f}"
+              f"{r['pss_max_mb']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark del formato compacto del bosque (croprec.forest.CompactForest).
+
+Compara el pickle de joblib, el .npz de FlatForest y el formato compacto
+(hojas uint8 y float16) en tamaño en disco, tiempo de carga, primera
+predicción tras cargar y acuerdo con el pipeline original, sobre las filas
+del dataset y sobre puntos uniformes del dominio de los sliders. Con
+--scales mayores que 1 entrena además bosques con max_depth=None sobre el
+dataset replicado con ruido, para ver cómo crece cada formato.
+
+Uso:
+    python benchmarks/bench_compact.py [--scales 1 10] [--rows 20000] [--repeats 5]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from croprec.features import RAW_FEATURES, build_features  # noqa: E402
+from croprec.forest import CompactForest, FlatForest, compare_with_pipeline  # noqa: E402
+from croprec.lookup import DATA_PATH, SLIDER_DOMAIN  # noqa: E402
+from croprec.model import MODEL_PATH  # noqa: E402
+from croprec.train import build_pipeline, split_dataset  # noqa: E402
+
+
+def modelo_escalado(scale, seed=42):
+    """
+    Pipeline guardado (scale=1) o entrenado sobre el dataset replicado scale veces con ruido.
+    """
+    if scale == 1:
+        return joblib.load(MODEL_PATH)
+    rng = np.random.default_rng(seed)
+    df = pd.concat([pd.read_csv(DATA_PATH)] * scale, ignore_index=True)
+    for col in RAW_FEATURES:
+        df[col] = df[col] * rng.uniform(0.95, 1.05, len(df))
+    df['N_over_PK'] = df['N'] / (df['P'] + df['K'] + 1e-6)
+    X_train, _, y_train, _, _ = split_dataset(df)
+    return build_pipeline(n_jobs=-1).fit(X_train, y_train)
+
+
+def tamano_mb(path):
+    """
+    Tamaño en disco de un fichero o de todos los ficheros de un directorio.
+    """
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)) / 2**20
+    return os.path.getsize(path) / 2**20
+
+
+def medir_carga(cargar, path, X_one, repeats):
+    """
+    Mediana del tiempo de carga y de la primera predicción tras cada carga.
+
+    Salida:
+        tuple: (objeto cargado, segundos de carga, segundos de la primera predicción).
+    """
+    cargas, primeras = [], []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        modelo = cargar(path)
+        t1 = time.perf_counter()
+        modelo.predict_proba(X_one)
+        cargas.append(t1 - t0)
+        primeras.append(time.perf_counter() - t1)
+    return modelo, float(np.median(cargas)), float(np.median(primeras))
+
+
+def puntos_uniformes(n_rows, seed=42):
+    """
+    Filas uniformes en el dominio de los sliders (fuera de las zonas del dataset).
+    """
+    rng = np.random.default_rng(seed)
+    raw = np.column_stack([rng.uniform(*SLIDER_DOMAIN[col], n_rows) for col in RAW_FEATURES])
+    return build_features(raw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scales', type=int, nargs='*', default=[1, 10])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    X = np.vstack([build_features(pd.read_csv(DATA_PATH)), puntos_uniformes(args.rows)])
+    X_one = X[:1]
+
+    for scale in args.scales:
+        pipeline = modelo_escalado(scale)
+        clf = pipeline[-1]
+        n_nodes = sum(e.tree_.node_count for e in clf.estimators_)
+        print(f"\nEscala ×{scale}: {clf.n_estimators} árboles, {n_nodes:,} nodos, "
+              f"profundidad máx. {max(e.tree_.max_depth for e in clf.estimators_)}")
+        print(f"{'Formato':<22}{'Disco (MB)':>11}{'Carga (ms)':>12}{'1ª pred. (ms)':>15}"
+              f"{'Error máx.':>12}{'Acuerdo':>10}")
+        print('=' * 82)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {'joblib': os.path.join(tmp, 'rf.joblib'), 'flat': os.path.join(tmp, 'rf_flat.npz'),
+                     'uint8': os.path.join(tmp, 'rf_uint8'), 'float16': os.path.join(tmp, 'rf_float16')}
+            joblib.dump(pipeline, paths['joblib'])
+            FlatForest.from_pipeline(pipeline).save(paths['flat'])
+            formatos = [
+                ('joblib (pickle)', joblib.load, paths['joblib']),
+                ('FlatForest .npz', FlatForest.load, paths['flat']),
+            ]
+            for leaf_dtype in ('uint8', 'float16'):
+                try:
+                    CompactForest.from_pipeline(pipeline, leaf_dtype=leaf_dtype).save(paths[leaf_dtype])
+                except ValueError as exc:
+                    print(f"⚠️ Compacto {leaf_dtype}: {exc}")
+                    continue
+                formatos.append((f'Compacto {leaf_dtype} (mmap)', CompactForest.load, paths[leaf_dtype]))
+            for nombre, cargar, path in formatos:
+                modelo, t_load, t_first = medir_carga(cargar, path, X_one, args.repeats)
+                result = compare_with_pipeline(modelo, pipeline, X)
+                print(f"{nombre:<22}{tamano_mb(path):>11.2f}{t_load * 1000:>12.1f}{t_first * 1000:>15.1f}"
+                      f"{result['max_abs_error']:>12.1e}{result['agreement']:>10.4%}")
+    print(f"\nAcuerdo top-1 sobre {len(X) - args.rows:,} filas del dataset y {args.rows:,} puntos uniformes.")
+
+
+if __name__ == '__main__':
+    main()
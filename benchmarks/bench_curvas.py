@@ -0,0 +1,106 @@
+"""
+Benchmark de functions.func_util.curvas_multiclase.
+
+Compara las curvas ROC/PR uno-contra-resto de los 22 cultivos calculadas
+con sklearn (roc_curve, precision_recall_curve, roc_auc_score y
+average_precision_score por clase, más micro y macro) con el cálculo
+vectorizado sobre la matriz de predict_proba. Las probabilidades son
+sintéticas: softmax con ruido redondeado a --decimales (con 2 hay empates
+como en un bosque; con más, muchos umbrales distintos). Comprueba que las
+áreas coinciden y mide también el guardado de la figura con y sin
+reducción de umbrales.
+
+Uso:
+    python benchmarks/bench_curvas.py [--filas 10000 200000] [--decimales 4] [--max-umbrales 200]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np  # noqa: E402
+from sklearn.metrics import (  # noqa: E402
+    average_precision_score, precision_recall_curve, roc_auc_score, roc_curve
+)
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from functions.func_util import curvas_multiclase, dibuja_curvas_multiclase  # noqa: E402
+
+N_CLASES = 22
+
+
+def probabilidades_sinteticas(n_filas, decimales, seed=42):
+    """
+    Etiquetas 0..21 y una matriz de probabilidades con la clase verdadera favorecida.
+    """
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, N_CLASES, n_filas)
+    logits = rng.normal(size=(n_filas, N_CLASES))
+    logits[np.arange(n_filas), y] += 2.5
+    P = np.exp(logits)
+    return y, np.round(P / P.sum(axis=1, keepdims=True), decimales)
+
+
+def curvas_sklearn(y, P):
+    """
+    Una llamada de sklearn por clase y curva, más las áreas micro y macro.
+    """
+    Y = np.eye(N_CLASES, dtype=bool)[y]
+    areas = {}
+    for j in range(N_CLASES):
+        roc_curve(Y[:, j], P[:, j])
+        precision_recall_curve(Y[:, j], P[:, j])
+        areas[j] = (roc_auc_score(Y[:, j], P[:, j]), average_precision_score(Y[:, j], P[:, j]))
+    roc_curve(Y.ravel(), P.ravel())
+    precision_recall_curve(Y.ravel(), P.ravel())
+    for media in ('micro', 'macro'):
+        areas[media] = (roc_auc_score(Y, P, average=media), average_precision_score(Y, P, average=media))
+    return areas
+
+
+def areas_vectorizadas(y, P, max_umbrales=None):
+    curvas = curvas_multiclase(y, P, max_umbrales=max_umbrales)
+    return curvas, {k: (curvas['roc'][k]['auc'], curvas['pr'][k]['ap']) for k in curvas['roc']}
+
+
+def cronometra(funcion, *args):
+    t0 = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--filas', type=int, nargs='*', default=[10000, 200000])
+    parser.add_argument('--decimales', type=int, default=4)
+    parser.add_argument('--max-umbrales', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'Filas':>9}{'sklearn (s)':>13}{'Vectorizado (s)':>17}{'Speed-up':>10}{'Dif. áreas máx.':>17}"
+          f"{'Guardar PNG (s)':>17}{'reducido (s)':>14}")
+    print('=' * 97)
+    for n_filas in args.filas:
+        y, P = probabilidades_sinteticas(n_filas, args.decimales)
+        ref, t_ref = cronometra(curvas_sklearn, y, P)
+        (curvas, areas), t_vec = cronometra(areas_vectorizadas, y, P)
+        diferencia = max(abs(a - b) for k in ref for a, b in zip(ref[k], areas[k]))
+
+        reducidas = curvas_multiclase(y, P, max_umbrales=args.max_umbrales)
+        with tempfile.TemporaryDirectory() as tmp:
+            _, t_png = cronometra(dibuja_curvas_multiclase, curvas, os.path.join(tmp, 'completas.png'))
+            _, t_png_reducido = cronometra(dibuja_curvas_multiclase, reducidas, os.path.join(tmp, 'reducidas.png'))
+        print(f"{n_filas:>9,}{t_ref:>13.2f}{t_vec:>17.2f}{t_ref / t_vec:>9.1f}×{diferencia:>17.1e}"
+              f"{t_png:>17.2f}{t_png_reducido:>14.2f}")
+    print(f"\nreducido = curvas de como máximo {args.max_umbrales} umbrales (áreas con todos los umbrales).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark de carga del dataset: CSV frente a la caché columnar memmap.
+
+Mide, en procesos limpios, el tiempo de carga en frío y la memoria (RSS)
+de pd.read_csv y de croprec.data.load_cached_dataset sobre el dataset original y
+sobre una versión sintética 100× mayor (filas replicadas con ruido). Antes
+de cada carga se expulsan los ficheros de la caché de páginas del sistema
+con posix_fadvise cuando está disponible.
+
+Uso:
+    python benchmarks/bench_data.py [--scale 100] [--repeats 3]
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from croprec.data import DATA_PATH, build_cache, cache_dir_for  # noqa: E402
+
+# >> Plantilla ejecutada en cada proceso hijo <<
+PROBE = """
+import json, os, resource, sys, time
+sys.path.insert(0, {root!r})
+import numpy, pandas
+from croprec.data import load_cached_dataset
+
+def rss_mb():
+    # >> RSS actual (no el pico) para que el coste de los imports no oculte la carga <<
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+rss_base = rss_mb()
+t0 = time.perf_counter()
+df = {loader}
+total = float(df['N'].sum()) + float(df['rainfall'].sum())
+t_load = time.perf_counter() - t0
+print(json.dumps({{'load_s': t_load, 'rss_mb': rss_mb() - rss_base, 'rows': len(df)}}))
+"""
+
+LOADERS = {
+    'CSV (pd.read_csv)': 'pandas.read_csv({path!r})',
+    'Caché columnar': 'load_cached_dataset({path!r})',
+}
+
+
+def dataset_sintetico(path, scale, seed=42):
+    """
+    Escribe un CSV scale× mayor replicando filas con ruido en las variables climáticas.
+
+    Parámetros de entrada:
+        path (str): CSV de salida.
+        scale (int): Veces que se replica el dataset original.
+        seed (int): Semilla del ruido.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.read_csv(DATA_PATH)
+    big = pd.concat([df] * scale, ignore_index=True)
+    for col in ['temperature', 'humidity', 'ph', 'rainfall']:
+        big[col] = big[col] * rng.uniform(0.98, 1.02, len(big))
+    big.to_csv(path, index=False)
+
+
+def expulsar_de_cache(paths):
+    """
+    Pide al sistema que descarte las páginas cacheadas de los ficheros (carga en frío).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def medir(loader, csv_path, repeats):
+    """
+    Ejecuta la sonda en procesos nuevos y devuelve la mediana de cada medida.
+
+    Parámetros de entrada:
+        loader (str): Expresión de carga a medir.
+        csv_path (str): CSV de origen (su caché ya debe existir).
+        repeats (int): Número de procesos a lanzar.
+
+    Salida:
+        dict: Medianas de tiempo de carga y RSS.
+    """
+    cache_dir = cache_dir_for(csv_path)
+    ficheros = [csv_path] + [os.path.join(cache_dir, f) for f in os.listdir(cache_dir)]
+    codigo = PROBE.format(root=PROJECT_ROOT, loader=loader.format(path=csv_path))
+    muestras = []
+    for _ in range(repeats):
+        expulsar_de_cache(ficheros)
+        salida = subprocess.run([sys.executable, '-c', codigo], capture_output=True,
+                                text=True, check=True)
+        muestras.append(json.loads(salida.stdout.strip().splitlines()[-1]))
+    return {
+        clave: sorted(m[clave] for m in muestras)[len(muestras) // 2]
+        for clave in muestras[0]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', type=int, default=100)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='croprec_data_') as tmp:
+        sintetico = os.path.join(tmp, f'crop_x{args.scale}.csv')
+        dataset_sintetico(sintetico, args.scale)
+
+        print(f"{'Dataset':<16}{'Filas':>12}{'Cargador':>22}{'Carga (s)':>12}{'RSS (MB)':>12}")
+        print('=' * 74)
+        for nombre, path in [('original', DATA_PATH), (f'sintético ×{args.scale}', sintetico)]:
+            build_cache(path)
+            for cargador, expr in LOADERS.items():
+                r = medir(expr, path, args.repeats)
+                print(f"{nombre:<16}{r['rows']:>12,}{cargador:>22}{r['load_s']:>12.4f}{r['rss_mb']:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
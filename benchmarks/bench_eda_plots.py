@@ -0,0 +1,100 @@
+"""
+Benchmark de las gráficas de distribución del EDA: datos crudos frente a agregados.
+
+Para el dataset original y versiones sintéticas mayores construye las dos
+figuras de la pestaña de distribuciones (histograma con boxplot y violín)
+con plotly sobre todas las filas y con croprec.plots sobre los agregados, y
+reporta el tamaño del JSON que Streamlit envía al navegador y el tiempo de
+construir y serializar la figura. El coste de dibujar en el navegador crece
+con ese JSON y no se mide aquí.
+
+Uso:
+    python benchmarks/bench_eda_plots.py [--scales 1 100 1000] [--var rainfall]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from croprec.data import DATA_PATH  # noqa: E402
+from croprec.eda import POINT_BUDGET, compute_aggregates  # noqa: E402
+from croprec.plots import histogram_box_figure, violin_figure  # noqa: E402
+
+
+def dataset_sintetico(scale, seed=42):
+    """
+    Dataset replicado scale veces con ruido en las variables climáticas.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.read_csv(DATA_PATH)
+    if scale == 1:
+        return df
+    big = pd.concat([df] * scale, ignore_index=True)
+    for col in ['temperature', 'humidity', 'ph', 'rainfall']:
+        big[col] = big[col] * rng.uniform(0.98, 1.02, len(big))
+    return big
+
+
+def figuras_crudas(df, var):
+    """
+    Figuras actuales de la app: plotly recibe todas las filas.
+    """
+    return [px.histogram(df, x=var, nbins=40, marginal='box', color_discrete_sequence=['#2ecc71']),
+            px.violin(df, y=var, box=True, color_discrete_sequence=['#3498db'])]
+
+
+def figuras_agregadas(agg, var):
+    """
+    Figuras nuevas: histograma agrupado, cuantiles del boxplot y muestra estratificada.
+    """
+    return [histogram_box_figure(agg['histograms'][var], agg['box_stats'][var], var),
+            violin_figure(agg['sample'], var)]
+
+
+def medir(construir, *args):
+    """
+    Construye y serializa las figuras.
+
+    Salida:
+        tuple: (bytes del JSON, segundos).
+    """
+    t0 = time.perf_counter()
+    size = sum(len(fig.to_json()) for fig in construir(*args))
+    return size, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scales', type=int, nargs='*', default=[1, 100, 1000])
+    parser.add_argument('--var', default='rainfall')
+    parser.add_argument('--budget', type=int, default=POINT_BUDGET)
+    args = parser.parse_args()
+
+    print(f"{'Filas':>12}{'Crudo (KB)':>13}{'Crudo (s)':>11}{'Agregado (KB)':>15}"
+          f"{'Agregado (s)':>14}{'Agregados (s)':>15}")
+    print('=' * 80)
+    for scale in args.scales:
+        df = dataset_sintetico(scale)
+        t0 = time.perf_counter()
+        agg = compute_aggregates(df, point_budget=args.budget)
+        t_agg = time.perf_counter() - t0
+        raw_size, raw_time = medir(figuras_crudas, df, args.var)
+        new_size, new_time = medir(figuras_agregadas, agg, args.var)
+        print(f"{len(df):>12,}{raw_size / 1024:>13,.0f}{raw_time:>11.2f}{new_size / 1024:>15,.0f}"
+              f"{new_time:>14.3f}{t_agg:>15.2f}")
+    print(f"\nPresupuesto de puntos: {args.budget:,}. 'Agregados (s)' es el coste único por versión "
+          f"del dataset (se guarda en disco).")
+
+
+if __name__ == '__main__':
+    main()
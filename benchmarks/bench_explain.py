@@ -0,0 +1,108 @@
+"""
+Benchmark de las explicaciones por predicción (croprec.explain).
+
+Comprueba que base + contribuciones reproduce pipeline.predict_proba y mide:
+    - una consulta de la app (explain_crop) sobre puntos aleatorios del
+      dominio de los sliders, incluida la construcción del bosque aplanado
+      que la app hace una vez por versión del modelo;
+    - el modo por lotes (explain_batch, solo la clase predicha) frente a
+      predecir el mismo lote, en microsegundos por fila;
+    - el CLI completo sobre un CSV (lectura, explicación y escritura).
+
+Uso:
+    python benchmarks/bench_explain.py [--queries 200] [--rows 20000]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from croprec.explain import base_values, explain_batch, explain_crop, explain_file, path_contributions  # noqa: E402
+from croprec.features import RAW_FEATURES, build_features  # noqa: E402
+from croprec.forest import FlatForest  # noqa: E402
+from croprec.lookup import SLIDER_DOMAIN  # noqa: E402
+from croprec.model import load_model  # noqa: E402
+
+
+def puntos_uniformes(n_rows, seed=42):
+    """
+    Filas uniformes en el dominio de los sliders (variables de entrada, sin N_over_PK).
+    """
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(*SLIDER_DOMAIN[col], n_rows) for col in RAW_FEATURES])
+
+
+def percentiles_ms(tiempos):
+    return np.percentile(tiempos, [50, 95, 100]) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=20000)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    pipeline, le = load_model()
+    t0 = time.perf_counter()
+    forest = FlatForest.from_pipeline(pipeline, fold_scaler=True)
+    t_build = time.perf_counter() - t0
+
+    # >> exactitud: base + suma de contribuciones = predict_proba <<
+    X = build_features(puntos_uniformes(args.rows))
+    muestra = X[:1000]
+    error = np.abs(base_values(forest) + path_contributions(forest, muestra).sum(axis=1)
+                   - pipeline.predict_proba(muestra)).max()
+    print(f"Error máx. de base + contribuciones frente a predict_proba (1.000 filas): {error:.1e}")
+    print(f"Construcción del bosque aplanado (una vez por modelo): {t_build * 1000:.0f} ms\n")
+
+    # >> consultas individuales como en la app <<
+    consultas = puntos_uniformes(args.queries, seed=7)
+    tiempos_explicacion, tiempos_prediccion = [], []
+    for fila in consultas:
+        t0 = time.perf_counter()
+        explain_crop(forest, le, *fila)
+        tiempos_explicacion.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        pipeline.predict_proba(build_features([fila]))
+        tiempos_prediccion.append(time.perf_counter() - t0)
+    print(f"{'Una consulta':<34}{'p50 (ms)':>10}{'p95 (ms)':>10}{'máx. (ms)':>11}")
+    print('=' * 65)
+    for nombre, tiempos in (('explain_crop (22 clases)', tiempos_explicacion),
+                            ('pipeline.predict_proba', tiempos_prediccion)):
+        p50, p95, maximo = percentiles_ms(tiempos)
+        print(f"{nombre:<34}{p50:>10.2f}{p95:>10.2f}{maximo:>11.2f}")
+
+    # >> lotes <<
+    print(f"\n{'Lote de ' + format(args.rows, ',') + ' filas':<34}{'Total (s)':>10}{'µs/fila':>10}")
+    print('=' * 54)
+    for nombre, funcion in (('explain_batch (clase predicha)', lambda: explain_batch(forest, X)),
+                            ('FlatForest.predict_proba', lambda: forest.predict_proba(X)),
+                            ('pipeline.predict_proba', lambda: pipeline.predict_proba(X))):
+        t0 = time.perf_counter()
+        funcion()
+        segundos = time.perf_counter() - t0
+        print(f"{nombre:<34}{segundos:>10.2f}{segundos / args.rows * 1e6:>10.1f}")
+
+    # >> CLI completo sobre un CSV <<
+    with tempfile.TemporaryDirectory() as tmp:
+        entrada, salida = os.path.join(tmp, 'suelos.csv'), os.path.join(tmp, 'explicaciones.csv')
+        pd.DataFrame(puntos_uniformes(args.rows, seed=3), columns=RAW_FEATURES).to_csv(entrada, index=False)
+        report = explain_file(entrada, salida, forest, le)
+        print(f"\nexplain_file: {report['rows']:,} filas en {report['elapsed_s']:.2f}s "
+              f"({report['rows_per_s']:,.0f} filas/s, {1e6 / report['rows_per_s']:.1f} µs/fila)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark del evaluador de bosque aplanado (croprec.forest) frente al pipeline.
+
+Verifica que las probabilidades coinciden con pipeline.predict_proba (1e-9)
+y mide la latencia para una fila y para un lote de 10.000 filas, con y sin
+el StandardScaler plegado en los umbrales.
+
+Uso:
+    python benchmarks/bench_forest.py [--rows 10000] [--repeats 50]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from croprec import build_features, load_model
+from croprec.forest import FlatForest, numba
+
+# >> Tolerancia exigida frente al pipeline original <<
+TOLERANCE = 1e-9
+
+
+def cronometrar(funcion, X, repeats):
+    """
+    Mediana del tiempo de ejecución de funcion(X) en segundos.
+    """
+    tiempos = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        funcion(X)
+        tiempos.append(time.perf_counter() - t0)
+    return float(np.median(tiempos))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del bosque aplanado')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeats', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore', message='X does not have valid feature names')
+
+    pipeline, _ = load_model()
+    t0 = time.perf_counter()
+    forest = FlatForest.from_pipeline(pipeline)
+    print(f"Export: {forest.n_trees} árboles, {len(forest.feature):,} nodos "
+          f"en {time.perf_counter() - t0:.2f}s")
+
+    # >> dataset real + lote sintético perturbado alrededor de él <<
+    df = pd.read_csv(os.path.join(os.path.dirname(__file__), '..', 'data', 'Crop_recommendation.csv'))
+    X = build_features(df)
+    rng = np.random.default_rng(args.seed)
+    X_batch = build_features(
+        df.drop(columns='label').to_numpy()[rng.integers(0, len(df), args.rows)]
+        * rng.uniform(0.8, 1.2, (args.rows, 7))
+    )
+
+    folded = forest.fold_scaler()
+    evaluadores = {'sklearn pipeline': pipeline.predict_proba,
+                   'FlatForest (NumPy)': lambda Z: forest.predict_proba(Z, use_numba=False),
+                   'Plegado (NumPy)': lambda Z: folded.predict_proba(Z, use_numba=False)}
+    if numba is not None:
+        evaluadores['FlatForest (numba)'] = lambda Z: forest.predict_proba(Z, use_numba=True)
+        evaluadores['Plegado (numba)'] = lambda Z: folded.predict_proba(Z, use_numba=True)
+        # >> compilación fuera de la medida <<
+        evaluadores['FlatForest (numba)'](X[:1])
+        evaluadores['Plegado (numba)'](X[:1])
+
+    # >> equivalencia numérica <<
+    referencia = pipeline.predict_proba(np.vstack([X, X_batch]))
+    for nombre, funcion in list(evaluadores.items())[1:]:
+        error = np.abs(funcion(np.vstack([X, X_batch])) - referencia).max()
+        estado = '✅' if error <= TOLERANCE else '❌'
+        print(f"{estado} {nombre}: error máximo {error:.2e}")
+
+    # >> latencias <<
+    print(f"\n{'Evaluador':<22}{'1 fila (ms)':>13}{'Speedup':>9}"
+          f"{f'{args.rows:,} filas (s)':>18}{'Speedup':>9}")
+    print('=' * 71)
+    base_one = base_batch = None
+    for nombre, funcion in evaluadores.items():
+        t_one = cronometrar(funcion, X[:1], args.repeats)
+        t_batch = cronometrar(funcion, X_batch, max(3, args.repeats // 10))
+        base_one, base_batch = base_one or t_one, base_batch or t_batch
+        print(f"{nombre:<22}{t_one * 1000:>13.3f}{base_one / t_one:>8.1f}x"
+              f"{t_batch:>18.3f}{base_batch / t_batch:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark de functions.func_util.dibuja_frontera_decision.
+
+Compara la rejilla completa de la versión anterior (meshgrid de resolución²
+puntos y una sola llamada a modelo.predict) con el refinamiento adaptativo
+de frontera_adaptativa, en tiempo, pico de memoria (tracemalloc), puntos
+evaluados por el modelo y píxeles distintos. Usa un RandomForest de 200
+árboles entrenado sobre dos variables del dataset: un caso binario (dos
+cultivos, como en la firma de dibuja_frontera_decision) y los 22 cultivos.
+
+Uso:
+    python benchmarks/bench_frontera.py [--resolucion 1000] [--paso 8] [--procesos 2]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from croprec.lookup import DATA_PATH  # noqa: E402
+from functions.func_util import frontera_adaptativa  # noqa: E402
+
+CASOS = [
+    ('Binario rice/jute', ['humidity', 'rainfall'], ['rice', 'jute']),
+    ('22 cultivos', ['humidity', 'rainfall'], None),
+]
+
+
+def rejilla(X, n_puntos):
+    """
+    Coordenadas de la rejilla con el mismo margen del 20% que dibuja_frontera_decision.
+    """
+    margen = (X.max(axis=0) - X.min(axis=0)) * 0.2
+    x1 = np.linspace(X[:, 0].min() - margen[0], X[:, 0].max() + margen[0], n_puntos)
+    x2 = np.linspace(X[:, 1].min() - margen[1], X[:, 1].max() + margen[1], n_puntos)
+    return x1, x2
+
+
+def frontera_completa(modelo, x1, x2):
+    """
+    Implementación anterior: todos los puntos de la rejilla en una sola llamada.
+    """
+    X1, X2 = np.meshgrid(x1, x2)
+    return modelo.predict(np.c_[X1.ravel(), X2.ravel()]).reshape(X1.shape)
+
+
+def medir(funcion, *args):
+    """
+    Ejecuta funcion(*args) midiendo tiempo y pico de memoria de Python/NumPy.
+
+    Salida:
+        tuple: (resultado, segundos, pico en MB).
+    """
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    resultado = funcion(*args)
+    segundos = time.perf_counter() - t0
+    pico = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--resolucion', type=int, default=1000)
+    parser.add_argument('--paso', type=int, default=8)
+    parser.add_argument('--bloque', type=int, default=65536)
+    parser.add_argument('--procesos', type=int, default=0, help='0 = sin pool')
+    args = parser.parse_args()
+
+    df = pd.read_csv(DATA_PATH)
+    n_puntos = -(-(args.resolucion - 1) // args.paso) * args.paso + 1
+    for nombre, columnas, cultivos in CASOS:
+        datos = df if cultivos is None else df[df['label'].isin(cultivos)]
+        X, y = datos[columnas].to_numpy(), datos['label'].to_numpy()
+        modelo = RandomForestClassifier(n_estimators=200, random_state=42).fit(X, y)
+        x1, x2 = rejilla(X, n_puntos)
+
+        Y_ref, t_ref, mem_ref = medir(frontera_completa, modelo, x1, x2)
+        (Y, n_eval), t_ada, mem_ada = medir(frontera_adaptativa, modelo, x1, x2, args.paso,
+                                           args.bloque, args.procesos or None)
+        distintos = np.count_nonzero(Y != Y_ref)
+
+        print(f"\n{nombre} ({' × '.join(columnas)}), rejilla {n_puntos}×{n_puntos}")
+        print(f"{'Método':<22}{'Tiempo (s)':>12}{'Pico (MB)':>12}{'Puntos evaluados':>19}{'Píxeles distintos':>19}")
+        print('=' * 84)
+        print(f"{'Rejilla completa':<22}{t_ref:>12.2f}{mem_ref:>12.1f}{Y_ref.size:>19,}{'-':>19}")
+        print(f"{'Adaptativa':<22}{t_ada:>12.2f}{mem_ada:>12.1f}{n_eval:>19,}"
+              f"{f'{distintos:,} ({distintos / Y.size:.3%})':>19}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark de tiempo de importación y memoria (RSS) de la inferencia.
+
+Compara, en procesos limpios, el coste de importar el paquete headless
+`croprec` frente al conjunto de imports de la aplicación Streamlit, y el
+de cargar el modelo y hacer una predicción con cada uno.
+
+Uso:
+    python benchmarks/bench_import.py [--repeats 5]
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# >> Imports que ejecuta streamlit/app.py antes de predecir <<
+APP_IMPORTS = """
+import streamlit, pandas, numpy, joblib
+import matplotlib.pyplot, seaborn
+import plotly.express, plotly.graph_objects, plotly.subplots
+import croprec
+"""
+
+HEADLESS_IMPORTS = """
+import croprec
+"""
+
+# >> Plantilla ejecutada en cada proceso hijo <<
+PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+{imports}
+t_import = time.perf_counter() - t0
+rss_import = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+pipeline, le = croprec.load_model()
+croprec.predict_crop(90, 42, 43, 20.8, 82, 6.5, 202, pipeline, le)
+t_predict = time.perf_counter() - t0
+rss_total = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'import_s': t_import, 'predict_s': t_predict,
+                  'rss_import_mb': rss_import / 1024, 'rss_total_mb': rss_total / 1024}}))
+"""
+
+
+def medir(imports, repeats):
+    """
+    Ejecuta la sonda en procesos nuevos y devuelve la mediana de cada medida.
+    
+    Parámetros de entrada:
+        imports (str): Bloque de imports a medir.
+        repeats (int): Número de procesos a lanzar.
+    
+    Variables de proceso:
+        muestras: Resultados JSON de cada proceso hijo.
+    
+    Salida:
+        dict: Medianas de tiempo de import, predicción y RSS.
+    """
+    codigo = PROBE.format(root=PROJECT_ROOT, imports=imports)
+    muestras = []
+    for _ in range(repeats):
+        salida = subprocess.run(
+            [sys.executable, '-c', codigo], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        )
+        muestras.append(json.loads(salida.stdout.strip().splitlines()[-1]))
+    return {
+        clave: sorted(m[clave] for m in muestras)[len(muestras) // 2]
+        for clave in muestras[0]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+    
+    resultados = {
+        'croprec (headless)': medir(HEADLESS_IMPORTS, args.repeats),
+        'streamlit/app.py': medir(APP_IMPORTS, args.repeats),
+    }
+    
+    # >> tabla de resultados <<
+    print(f"{'Escenario':<22}{'Import (s)':>12}{'RSS import (MB)':>18}"
+          f"{'Carga+pred (s)':>16}{'RSS total (MB)':>16}")
+    print('=' * 84)
+    for nombre, r in resultados.items():
+        print(f"{nombre:<22}{r['import_s']:>12.3f}{r['rss_import_mb']:>18.1f}"
+              f"{r['predict_s']:>16.3f}{r['rss_total_mb']:>16.1f}")
+    
+    base = resultados['streamlit/app.py']
+    headless = resultados['croprec (headless)']
+    print(f"\n✅ Ahorro de import: {base['import_s'] - headless['import_s']:.3f}s, "
+          f"RSS: {base['rss_total_mb'] - headless['rss_total_mb']:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+Benchmark de CPU del servidor por interacción en la página de Predicción.
+
+Lanza `streamlit run` en modo headless y se conecta a su websocket como lo
+haría el navegador: envía los mismos mensajes BackMsg (rerun_script con el
+estado de los widgets) y espera a script_finished. Para cada interacción
+mide el tiempo de CPU del proceso servidor (utime + stime de /proc) y el
+tiempo de respuesta. Los cambios de widgets dentro de un st.form no envían
+nada al servidor hasta pulsar el botón, y los de un st.fragment solo
+vuelven a ejecutar el fragmento, igual que en el navegador.
+
+Para comparar con otra versión de la app basta con apuntar --app a su
+streamlit/app.py (por ejemplo en un git worktree).
+
+Uso:
+    python benchmarks/bench_interaction.py [--app streamlit/app.py] [--repeats 10]
+"""
+
+# >> Imports <<
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(PROJECT_ROOT, 'streamlit', 'app.py')
+
+PAGE = "🔮 Predicción"
+SLIDER = "Nitrógeno (N)"
+BUTTON = "🌾 Predecir Cultivo Recomendado"
+LIVE_TOGGLE = "🔴 Predicción en vivo"
+WIDGET_TYPES = ('slider', 'radio', 'checkbox', 'button')
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+
+
+def cpu_segundos(pid):
+    """
+    Tiempo de CPU (usuario + sistema) consumido por un proceso.
+    """
+    with open(f'/proc/{pid}/stat') as f:
+        campos = f.read().rsplit(')', 1)[1].split()
+    return (int(campos[11]) + int(campos[12])) / CLK_TCK
+
+
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class Sesion:
+    """
+    Cliente mínimo del protocolo de Streamlit que mantiene el estado de los widgets.
+
+    Variables de proceso:
+        widgets: label → (tipo, proto del widget, fragment_id del delta).
+        values: id → valor actual de cada widget (como lo enviaría el navegador).
+    """
+
+    def __init__(self, ws, pid):
+        self.ws = ws
+        self.pid = pid
+        self.widgets = {}
+        self.values = {}
+
+    async def rerun(self, trigger=None, fragment_id=''):
+        """
+        Envía un rerun_script y espera a script_finished.
+
+        Salida:
+            tuple: (segundos de CPU del servidor, segundos de respuesta).
+        """
+        msg = BackMsg()
+        msg.rerun_script.fragment_id = fragment_id
+        states = msg.rerun_script.widget_states.widgets
+        for widget_id, (kind, value) in self.values.items():
+            state = states.add(id=widget_id)
+            if kind == 'slider':
+                state.double_array_value.data.append(value)
+            elif kind == 'radio':
+                state.string_value = value
+            else:
+                state.bool_value = value
+        if trigger is not None:
+            states.add(id=trigger, trigger_value=True)
+
+        cpu0, t0 = cpu_segundos(self.pid), time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            raw = await self.ws.recv()
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof('type')
+            if kind == 'script_finished':
+                break
+            if kind == 'delta' and fwd.delta.WhichOneof('type') == 'new_element':
+                self._registrar(fwd.delta.new_element, fwd.delta.fragment_id)
+        return cpu_segundos(self.pid) - cpu0, time.perf_counter() - t0
+
+    def _registrar(self, element, fragment_id):
+        kind = element.WhichOneof('type')
+        if kind not in WIDGET_TYPES:
+            return
+        proto = getattr(element, kind)
+        self.widgets[proto.label] = (kind, proto, fragment_id)
+        if kind != 'button' and proto.id not in self.values:
+            if kind == 'slider':
+                default = proto.default[0]
+            elif kind == 'radio':
+                default = proto.options[proto.default]
+            else:
+                default = proto.default
+            self.values[proto.id] = (kind, default)
+
+    async def interactuar(self, label, value=None):
+        """
+        Cambia un widget o pulsa un botón como lo haría el navegador.
+
+        Salida:
+            tuple | None: (CPU, respuesta) o None si el widget está en un formulario
+            y el cambio no llega al servidor.
+        """
+        kind, proto, fragment_id = self.widgets[label]
+        if kind == 'button':
+            return await self.rerun(trigger=proto.id, fragment_id=fragment_id)
+        self.values[proto.id] = (kind, value)
+        if proto.form_id:
+            return None
+        return await self.rerun(fragment_id=fragment_id)
+
+
+def mediana(valores):
+    valores = sorted(valores)
+    return valores[len(valores) // 2]
+
+
+async def escenario(port, pid, repeats):
+    """
+    Navega a Predicción y mide: mover un slider, pulsar Predecir y, si la app
+    lo ofrece, mover un slider en modo en vivo.
+
+    Salida:
+        dict: interacción → lista de (CPU, respuesta) o None por repetición.
+    """
+    ws = await connect(f'ws://127.0.0.1:{port}/_stcore/stream', subprotocols=['streamlit'],
+                       max_size=None)
+    sesion = Sesion(ws, pid)
+    await sesion.rerun()
+    radio = sesion.widgets[next(label for label, w in sesion.widgets.items() if w[0] == 'radio')][1]
+    await sesion.interactuar(radio.label, PAGE)
+    # >> primera predicción fuera de la medida (carga del modelo) <<
+    await sesion.interactuar(BUTTON)
+
+    resultados = {'Mover slider': [], 'Pulsar Predecir': []}
+    for i in range(repeats):
+        resultados['Mover slider'].append(await sesion.interactuar(SLIDER, 51 + i))
+        resultados['Pulsar Predecir'].append(await sesion.interactuar(BUTTON))
+
+    if LIVE_TOGGLE in sesion.widgets:
+        await sesion.interactuar(LIVE_TOGGLE, True)
+        resultados['Slider en vivo'] = [await sesion.interactuar(SLIDER, 80 + i) for i in range(repeats)]
+    await ws.close()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--app', default=APP_PATH)
+    parser.add_argument('--repeats', type=int, default=10)
+    args = parser.parse_args()
+
+    app = os.path.abspath(args.app)
+    root = os.path.dirname(os.path.dirname(app))
+    port = puerto_libre()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', app, '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(300):
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        resultados = asyncio.run(escenario(port, server.pid, args.repeats))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"App: {app}")
+    print(f"{'Interacción':<18}{'Reruns':>8}{'CPU servidor (ms)':>20}{'Respuesta (ms)':>17}")
+    print('=' * 63)
+    for nombre, medidas in resultados.items():
+        enviadas = [m for m in medidas if m is not None]
+        if not enviadas:
+            print(f"{nombre:<18}{0:>8}{'0 (sin rerun)':>20}{'-':>17}")
+            continue
+        print(f"{nombre:<18}{len(enviadas):>8}{mediana([c for c, _ in enviadas]) * 1000:>20.1f}"
+              f"{mediana([t for _, t in enviadas]) * 1000:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark de las métricas de clasificación de functions.func_util.
+
+Compara la versión anterior de obtencion_metricas_clasificacion
+(confusion_matrix más accuracy/precision/recall/f1 de sklearn, cada una
+recorriendo las etiquetas) con la matriz de confusión en una pasada de
+np.bincount y las métricas derivadas de ella, sobre etiquetas sintéticas
+con 22 clases (enteras, como las del LabelEncoder, y con los nombres de
+los cultivos). Comprueba además que ambos dan el mismo diccionario y que
+sumar las matrices de k folds equivale a evaluar todo de una vez.
+
+Uso:
+    python benchmarks/bench_metricas.py [--filas 100000 1000000] [--folds 5]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from sklearn.metrics import accuracy_score, confusion_matrix, f1_score, precision_score, recall_score
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from functions.func_util import matriz_confusion, metricas_desde_matriz, metricas_por_fold  # noqa: E402
+
+N_CLASES = 22
+
+
+def etiquetas(n_filas, nombres, seed=42):
+    """
+    Etiquetas verdaderas y predicciones con un ~95% de aciertos.
+    """
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, N_CLASES, n_filas)
+    y_pred = np.where(rng.random(n_filas) < 0.95, y_true, rng.integers(0, N_CLASES, n_filas))
+    if nombres:
+        nombres = np.array([f'cultivo_{i:02d}' for i in range(N_CLASES)])
+        return nombres[y_true], nombres[y_pred]
+    return y_true, y_pred
+
+
+def metricas_sklearn(y_true, y_pred):
+    """
+    Implementación anterior: matriz de confusión y cuatro métricas por separado.
+    """
+    confusion_matrix(y_true, y_pred)
+    return {
+        'exactitud': round(accuracy_score(y_true, y_pred), 4),
+        'precision': round(precision_score(y_true, y_pred, average='weighted'), 4),
+        'sensibilidad_recall': round(recall_score(y_true, y_pred, average='weighted'), 4),
+        'puntuacion_f1': round(f1_score(y_true, y_pred, average='weighted'), 4)
+    }
+
+
+def metricas_bincount(y_true, y_pred):
+    return metricas_desde_matriz(matriz_confusion(y_true, y_pred)[0])
+
+
+def medir(funcion, *args, repeticiones=3):
+    """
+    Mejor tiempo de repeticiones ejecuciones y el resultado de la última.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = funcion(*args)
+        tiempos.append(time.perf_counter() - t0)
+    return resultado, min(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--filas', type=int, nargs='*', default=[100000, 1000000])
+    parser.add_argument('--folds', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Filas':>10}{'Etiquetas':>11}{'sklearn (ms)':>14}{'bincount (ms)':>15}{'Speed-up':>10}{'Iguales':>9}")
+    print('=' * 69)
+    for n_filas in args.filas:
+        for nombres in (False, True):
+            y_true, y_pred = etiquetas(n_filas, nombres)
+            ref, t_ref = medir(metricas_sklearn, y_true, y_pred)
+            nuevo, t_nuevo = medir(metricas_bincount, y_true, y_pred)
+            print(f"{n_filas:>10,}{'texto' if nombres else 'enteras':>11}{t_ref * 1000:>14.1f}"
+                  f"{t_nuevo * 1000:>15.1f}{t_ref / t_nuevo:>9.1f}×{str(ref == nuevo):>9}")
+
+    # >> folds: suma de matrices frente a evaluar todo junto <<
+    y_true, y_pred = etiquetas(args.filas[-1], False)
+    folds = np.array_split(np.arange(len(y_true)), args.folds)
+    matrices = [matriz_confusion(y_true[i], y_pred[i], clases=range(N_CLASES))[0] for i in folds]
+    agregado = metricas_por_fold(matrices)
+    print(f"\n{args.folds} folds agregados = evaluación completa: "
+          f"{agregado['global'] == metricas_bincount(y_true, y_pred)} "
+          f"(F1 medio {agregado['media']['puntuacion_f1']} ± {agregado['desviacion']['puntuacion_f1']})")
+
+
+if __name__ == '__main__':
+    main()
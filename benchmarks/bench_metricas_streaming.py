@@ -0,0 +1,153 @@
+"""
+Benchmark de los acumuladores de métricas de functions.func_util.
+
+Genera un registro sintético de predicciones repartido en ficheros
+mensuales (cultivo real y predicho, rendimiento real y predicho) y lo
+evalúa de tres formas:
+    - en memoria: todos los meses concatenados y las funciones de siempre;
+    - en streaming: pd.read_csv por bloques y AcumuladorClasificacion /
+      AcumuladorRegresion en un solo proceso;
+    - en paralelo: un acumulador por mes en un pool de procesos, combinados
+      al final (los acumuladores viajan entre procesos con pickle).
+Compara tiempo, pico de memoria (tracemalloc, solo el proceso principal) y
+que los diccionarios finales sean iguales.
+
+Uso:
+    python benchmarks/bench_metricas_streaming.py [--meses 6] [--filas-mes 500000] [--bloque 100000]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# >> Raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from functions.func_util import (  # noqa: E402
+    AcumuladorClasificacion, AcumuladorRegresion, matriz_confusion, metricas_desde_matriz
+)
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score  # noqa: E402
+
+CULTIVOS = [f'cultivo_{i:02d}' for i in range(22)]
+
+
+def genera_registro(directorio, meses, filas_mes, seed=42):
+    """
+    Escribe un CSV por mes con un ~93% de aciertos y rendimientos con ruido.
+
+    Salida:
+        list: Rutas de los ficheros mensuales.
+    """
+    rng = np.random.default_rng(seed)
+    rutas = []
+    for mes in range(meses):
+        real = rng.integers(0, len(CULTIVOS), filas_mes)
+        predicho = np.where(rng.random(filas_mes) < 0.93, real, rng.integers(0, len(CULTIVOS), filas_mes))
+        rendimiento = rng.gamma(4.0, 1.5, filas_mes)
+        ruta = os.path.join(directorio, f'predicciones_{mes + 1:02d}.csv')
+        pd.DataFrame({
+            'cultivo_real': np.array(CULTIVOS)[real],
+            'cultivo_predicho': np.array(CULTIVOS)[predicho],
+            'rendimiento_real': rendimiento.round(3),
+            'rendimiento_predicho': (rendimiento + rng.normal(0, 0.8, filas_mes)).round(3),
+        }).to_csv(ruta, index=False)
+        rutas.append(ruta)
+    return rutas
+
+
+def en_memoria(rutas):
+    """
+    Evaluación con todo el registro cargado (como obtencion_metricas_*).
+    """
+    df = pd.concat([pd.read_csv(r) for r in rutas], ignore_index=True)
+    clasificacion = metricas_desde_matriz(
+        matriz_confusion(df['cultivo_real'], df['cultivo_predicho'], CULTIVOS)[0])
+    y, y_sal = df['rendimiento_real'], df['rendimiento_predicho']
+    regresion = {'error_MSE': round(mean_squared_error(y, y_sal), 4),
+                 'error_MAE': round(mean_absolute_error(y, y_sal), 4),
+                 'R2': round(r2_score(y, y_sal), 3)}
+    return clasificacion, regresion
+
+
+def acumula_fichero(ruta, bloque):
+    """
+    Acumuladores de un fichero leído por bloques.
+    """
+    clasificacion, regresion = AcumuladorClasificacion(CULTIVOS), AcumuladorRegresion()
+    for df in pd.read_csv(ruta, chunksize=bloque):
+        clasificacion.actualiza(df['cultivo_real'], df['cultivo_predicho'])
+        regresion.actualiza(df['rendimiento_real'], df['rendimiento_predicho'])
+    return clasificacion, regresion
+
+
+def en_streaming(rutas, bloque, procesos=0):
+    """
+    Evaluación por bloques, en este proceso o con un acumulador por fichero en un pool.
+    """
+    if procesos:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            parciales = list(pool.map(acumula_fichero, rutas, [bloque] * len(rutas)))
+    else:
+        parciales = [acumula_fichero(r, bloque) for r in rutas]
+    clasificacion, regresion = AcumuladorClasificacion(CULTIVOS), AcumuladorRegresion()
+    for parcial_clasificacion, parcial_regresion in parciales:
+        clasificacion.combina(parcial_clasificacion)
+        regresion.combina(parcial_regresion)
+    return clasificacion.finaliza(), regresion.finaliza()
+
+
+def medir(funcion, *args):
+    """
+    Tiempo sin trazar y pico de memoria en una segunda ejecución con tracemalloc
+    (que ralentiza mucho las asignaciones y falsearía el tiempo).
+
+    Salida:
+        tuple: (resultado, segundos, pico de memoria en MB).
+    """
+    t0 = time.perf_counter()
+    resultado = funcion(*args)
+    segundos = time.perf_counter() - t0
+    tracemalloc.start()
+    funcion(*args)
+    pico = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--meses', type=int, default=6)
+    parser.add_argument('--filas-mes', type=int, default=500000)
+    parser.add_argument('--bloque', type=int, default=100000)
+    parser.add_argument('--procesos', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rutas = genera_registro(tmp, args.meses, args.filas_mes)
+        mb = sum(os.path.getsize(r) for r in rutas) / 2**20
+        print(f"Registro: {args.meses} meses × {args.filas_mes:,} filas ({mb:.0f} MB de CSV)\n")
+
+        ref, t_ref, mem_ref = medir(en_memoria, rutas)
+        casos = [('En memoria', ref, t_ref, mem_ref)]
+        casos.append(('Streaming', *medir(en_streaming, rutas, args.bloque)))
+        casos.append((f'Paralelo ({args.procesos} proc.)', *medir(en_streaming, rutas, args.bloque,
+                                                                  args.procesos)))
+
+    print(f"{'Modo':<22}{'Tiempo (s)':>12}{'Pico (MB)':>12}{'Iguales':>9}")
+    print('=' * 55)
+    for nombre, resultado, segundos, pico in casos:
+        print(f"{nombre:<22}{segundos:>12.2f}{pico:>12.1f}{str(resultado == ref):>9}")
+    print(f"\nClasificación: {ref[0]}\nRegresión: {ref[1]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Prueba de carga del servidor de predicción (croprec.server).
+
+Lanza clientes concurrentes con conexiones keep-alive contra una instancia
+local y reporta latencia p50/p99 y peticiones por segundo, junto con el
+tamaño medio de lote que consiguió el micro-batching.
+
+Uso:
+    python -m croprec.server --port 8000 &
+    python benchmarks/load_test.py --port 8000 --concurrency 64 --requests 5000
+"""
+
+# >> Imports <<
+import argparse
+import asyncio
+import json
+import random
+import time
+
+# >> Dominio de los sliders de la página de predicción <<
+RANGES = {
+    'N': (0, 140), 'P': (5, 145), 'K': (5, 205), 'temperature': (8.0, 44.0),
+    'humidity': (14, 99), 'ph': (3.5, 9.9), 'rainfall': (20, 300),
+}
+
+
+async def request(reader, writer, host, method, path, payload=None):
+    """
+    Envía una petición HTTP/1.1 por una conexión abierta y devuelve el JSON.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(
+        f'{method} {path} HTTP/1.1\r\nHost: {host}\r\n'
+        f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n'
+        .encode('latin-1') + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    data = await reader.readexactly(length)
+    if b' 200 ' not in status_line:
+        raise RuntimeError(f'{status_line.decode().strip()}: {data.decode()}')
+    return json.loads(data)
+
+
+async def client(host, port, n_requests, latencies, rng):
+    """
+    Cliente secuencial: envía n_requests filas aleatorias y guarda latencias.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(n_requests):
+            row = {col: rng.uniform(lo, hi) for col, (lo, hi) in RANGES.items()}
+            t0 = time.perf_counter()
+            await request(reader, writer, host, 'POST', '/predict', row)
+            latencies.append(time.perf_counter() - t0)
+    finally:
+        writer.close()
+
+
+async def run(host, port, concurrency, n_requests, seed):
+    """
+    Ejecuta la prueba de carga y devuelve (latencias, duración, stats del servidor).
+    """
+    latencies = []
+    per_client = [n_requests // concurrency + (i < n_requests % concurrency)
+                  for i in range(concurrency)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, n, latencies, random.Random(seed + i))
+        for i, n in enumerate(per_client) if n
+    ))
+    elapsed = time.perf_counter() - t0
+
+    reader, writer = await asyncio.open_connection(host, port)
+    stats = await request(reader, writer, host, 'GET', '/stats')
+    writer.close()
+    return latencies, elapsed, stats
+
+
+def percentile(values, q):
+    """
+    Percentil q (0-100) por el método del rango más cercano.
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prueba de carga del servidor de predicción')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    latencies, elapsed, stats = asyncio.run(
+        run(args.host, args.port, args.concurrency, args.requests, args.seed)
+    )
+
+    print(f"Peticiones:        {len(latencies):,} ({args.concurrency} clientes concurrentes)")
+    print(f"Duración:          {elapsed:.2f}s")
+    print(f"Throughput:        {len(latencies) / elapsed:,.1f} req/s")
+    print(f"Latencia p50:      {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"Latencia p99:      {percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"Filas/lote (media): {stats['mean_batch_rows']:.1f} en {stats['batches']:,} lotes")
+
+
+if __name__ == '__main__':
+    main()
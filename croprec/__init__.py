@@ -0,0 +1,22 @@
+"""
+Inferencia headless del Sistema de Recomendación de Cultivos.
+
+Este paquete contiene la ingeniería de variables (N_over_PK), la carga del
+modelo y del codificador de etiquetas, y la lógica de predicción/top-k.
+Solo depende de numpy, scikit-learn y joblib, de modo que workers por lotes
+y contenedores de API pueden usarlo sin importar Streamlit ni librerías de
+visualización.
+"""
+
+# >> API pública <<
+from croprec.features import RAW_FEATURES, FEATURES, add_n_over_pk, build_features
+from croprec.model import PROJECT_ROOT, MODEL_PATH, ENCODER_PATH, load_model
+from croprec.predict import top_k_indices, predict_crops_batch, predict_crop
+from croprec.cache import SLIDER_RESOLUTION, quantize_inputs, PredictionCache
+
+__all__ = [
+    'RAW_FEATURES', 'FEATURES', 'add_n_over_pk', 'build_features',
+    'PROJECT_ROOT', 'MODEL_PATH', 'ENCODER_PATH', 'load_model',
+    'top_k_indices', 'predict_crops_batch', 'predict_crop',
+    'SLIDER_RESOLUTION', 'quantize_inputs', 'PredictionCache',
+]
@@ -0,0 +1,208 @@
+"""
+Puntuación por lotes en varios procesos con el modelo compartido.
+
+Un solo proceso no satura un nodo de muchos núcleos, y predict_proba con
+n_jobs=-1 sobre bloques pequeños pasa la mayor parte del tiempo repartiendo
+hilos. Aquí se lanzan N workers con n_jobs=1 que reciben bloques de la
+entrada en orden y devuelven las predicciones, con un número acotado de
+bloques en vuelo para que la memoria no dependa del tamaño del fichero.
+
+El modelo se abre con joblib.load(mmap_mode='r'). Como los árboles de
+scikit-learn copian sus nodos a memoria propia al deserializarse, el
+mapeo por sí solo no comparte páginas entre procesos: por eso, cuando el
+sistema lo permite (fork), el modelo se carga una vez en el proceso padre
+antes de crear los workers y estos heredan sus buffers en copy-on-write.
+Con spawn cada worker lo carga por su cuenta.
+
+Uso:
+    python -m croprec.batch suelos.csv predicciones.parquet --workers 32 --chunksize 50000
+"""
+
+# >> Imports <<
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+import warnings
+from collections import deque
+
+import joblib
+
+from croprec.model import MODEL_PATH, ENCODER_PATH
+from croprec.score import CHUNKSIZE, read_chunks, score_chunks, write_chunks, print_progress
+
+# >> Modelo del proceso actual (heredado del padre con fork o cargado por el worker) <<
+_MODEL = None
+
+
+def load_shared_model(model_path=MODEL_PATH, encoder_path=ENCODER_PATH):
+    """
+    Carga el pipeline con mmap_mode='r' y n_jobs=1 (el paralelismo lo ponen los procesos).
+
+    Salida:
+        tuple: (pipeline, le).
+    """
+    pipeline = joblib.load(model_path, mmap_mode='r')
+    if 'clf' in getattr(pipeline, 'named_steps', {}):
+        pipeline.named_steps['clf'].set_params(n_jobs=1)
+    return pipeline, joblib.load(encoder_path)
+
+
+def memory_usage():
+    """
+    Memoria del proceso actual en MB (Linux): RSS privada, RSS de ficheros y PSS.
+
+    Salida:
+        dict: rss_anon_mb, rss_file_mb y pss_mb (PSS reparte las páginas compartidas entre procesos).
+    """
+    usage = {}
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(('RssAnon:', 'RssFile:')):
+                    key, value = line.split(':')
+                    usage[f'{key.lower().replace("rss", "rss_")}_mb'] = int(value.split()[0]) / 1024
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    usage['pss_mb'] = int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return usage
+
+
+def _init_worker(model_path, encoder_path):
+    """
+    Inicializa un worker: un hilo BLAS/OpenMP y el modelo si no se heredó del padre.
+    """
+    global _MODEL
+    warnings.filterwarnings('ignore')
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(1)
+    except ImportError:
+        pass
+    if _MODEL is None:
+        _MODEL = load_shared_model(model_path, encoder_path)
+
+
+def _score_shard(chunk, top_k, keep_inputs):
+    """
+    Puntúa un bloque en el worker.
+
+    Salida:
+        tuple: (DataFrame puntuado, dict con pid y memoria del worker).
+    """
+    pipeline, le = _MODEL
+    scored = next(score_chunks([chunk], pipeline, le, top_k, keep_inputs))
+    return scored, dict(memory_usage(), pid=os.getpid())
+
+
+def start_pool(n_workers, model_path=MODEL_PATH, encoder_path=ENCODER_PATH):
+    """
+    Crea el pool de workers, compartiendo el modelo del padre cuando se usa fork.
+
+    Parámetros de entrada:
+        n_workers (int): Número de procesos.
+        model_path, encoder_path (str): Artefactos del modelo.
+
+    Salida:
+        Pool: Pool de multiprocessing listo para _score_shard.
+    """
+    global _MODEL
+    if 'fork' in mp.get_all_start_methods():
+        ctx = mp.get_context('fork')
+        _MODEL = load_shared_model(model_path, encoder_path)
+    else:
+        ctx = mp.get_context('spawn')
+    return ctx.Pool(n_workers, initializer=_init_worker, initargs=(model_path, encoder_path))
+
+
+def score_chunks_parallel(chunks, pool, n_workers, top_k=5, keep_inputs=True,
+                          in_flight=2, worker_stats=None):
+    """
+    Reparte los bloques entre los workers y los devuelve en el orden de entrada.
+
+    Parámetros de entrada:
+        chunks (iterable): DataFrames con RAW_FEATURES.
+        pool (Pool): Pool de start_pool.
+        n_workers (int): Workers del pool.
+        top_k (int): Cultivos alternativos por fila.
+        keep_inputs (bool): Copiar las columnas de entrada a la salida.
+        in_flight (int): Bloques pendientes por worker (acota la memoria).
+        worker_stats (dict | None): Si se pasa, recibe pid -> última medida de memoria.
+
+    Variables de proceso:
+        pending: Cola FIFO de resultados asíncronos (como mucho n_workers * in_flight).
+
+    Salida:
+        generator: DataFrames puntuados.
+    """
+    pending = deque()
+    limit = max(1, n_workers * in_flight)
+
+    def collect():
+        scored, stats = pending.popleft().get()
+        if worker_stats is not None:
+            worker_stats[stats['pid']] = stats
+        return scored
+
+    for chunk in chunks:
+        pending.append(pool.apply_async(_score_shard, (chunk, top_k, keep_inputs)))
+        if len(pending) >= limit:
+            yield collect()
+    while pending:
+        yield collect()
+
+
+def score_file_parallel(in_path, out_path, n_workers, model_path=MODEL_PATH,
+                        encoder_path=ENCODER_PATH, chunksize=CHUNKSIZE, top_k=5,
+                        keep_inputs=True, progress=None):
+    """
+    Equivalente a croprec.score.score_file repartiendo los bloques entre procesos.
+
+    Salida:
+        dict: Filas, bloques, segundos, filas por segundo y memoria de cada worker.
+    """
+    worker_stats = {}
+    t0 = time.perf_counter()
+    rows = n_chunks = 0
+    with start_pool(n_workers, model_path, encoder_path) as pool:
+        scored = score_chunks_parallel(read_chunks(in_path, chunksize, keep_inputs), pool,
+                                       n_workers, top_k, keep_inputs, worker_stats=worker_stats)
+        for n in write_chunks(scored, out_path):
+            rows += n
+            n_chunks += 1
+            if progress is not None:
+                progress(rows, time.perf_counter() - t0)
+    elapsed = time.perf_counter() - t0
+    return {'rows': rows, 'chunks': n_chunks, 'elapsed_s': elapsed,
+            'rows_per_s': rows / elapsed if elapsed else 0.0,
+            'workers': list(worker_stats.values())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Puntúa un CSV grande con varios procesos')
+    parser.add_argument('input', help='CSV con N, P, K, temperature, humidity, ph, rainfall')
+    parser.add_argument('output', help='Salida .csv (o .csv.gz) o .parquet')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--encoder', default=ENCODER_PATH)
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--no-inputs', action='store_true', help='No copiar las columnas de entrada')
+    args = parser.parse_args()
+
+    report = score_file_parallel(args.input, args.output, args.workers, args.model, args.encoder,
+                                 args.chunksize, args.top_k, not args.no_inputs, print_progress())
+    sys.stderr.write('\n')
+    print(f"✅ {report['rows']:,} filas en {report['chunks']} bloques con {args.workers} workers, "
+          f"{report['elapsed_s']:.2f}s ({report['rows_per_s']:,.0f} filas/s) → {args.output}")
+    if report['workers'] and 'pss_mb' in report['workers'][0]:
+        pss = [w['pss_mb'] for w in report['workers']]
+        print(f"PSS por worker: media {sum(pss) / len(pss):.1f} MB, máx. {max(pss):.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
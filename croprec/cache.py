@@ -0,0 +1,196 @@
+"""
+Caché de predicciones con claves cuantizadas según los sliders de la app.
+
+Los sliders de la página de predicción tienen pasos fijos (N/P/K/humedad/
+precipitación enteros, pH de 0.1 y temperatura de 0.5 °C), así que el espacio
+real de entradas es finito y las peticiones se repiten mucho entre usuarios.
+PredictionCache guarda los resultados en un LRU acotado con caducidad (TTL),
+es seguro entre hilos (sesiones de Streamlit) y se invalida automáticamente
+cuando cambia el hash del fichero del modelo.
+"""
+
+# >> Imports <<
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from croprec.features import RAW_FEATURES
+from croprec.model import MODEL_PATH, ENCODER_PATH, load_model
+from croprec.predict import predict_crop
+
+# >> Divisiones por unidad de cada variable (inverso del paso del slider) <<
+SLIDER_RESOLUTION = {
+    'N': 1, 'P': 1, 'K': 1, 'temperature': 2,
+    'humidity': 1, 'ph': 10, 'rainfall': 1,
+}
+
+
+def quantize_inputs(values, resolution=SLIDER_RESOLUTION):
+    """
+    Cuantiza las variables de entrada a la rejilla de los sliders.
+
+    Parámetros de entrada:
+        values (sequence): Valores en el orden de RAW_FEATURES.
+        resolution (dict): Divisiones por unidad de cada variable.
+
+    Salida:
+        tuple: Clave entera, p. ej. pH 6.5 -> 65 y temperatura 25.5 -> 51.
+    """
+    return tuple(int(round(v * resolution[col])) for col, v in zip(RAW_FEATURES, values))
+
+
+def dequantize_key(key, resolution=SLIDER_RESOLUTION):
+    """
+    Valores canónicos de una clave (el punto de la rejilla que representa).
+    """
+    return [k / resolution[col] for col, k in zip(RAW_FEATURES, key)]
+
+
+def file_sha256(path, block_size=1 << 20):
+    """
+    Hash sha256 de un fichero leído por bloques.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    Predictor con caché LRU/TTL compartible entre sesiones.
+
+    Parámetros de entrada:
+        model_path, encoder_path (str): Rutas a los artefactos del modelo.
+        maxsize (int): Número máximo de entradas antes de expulsar la menos usada.
+        ttl (float | None): Segundos de validez de cada entrada (None = sin caducidad).
+        resolution (dict): Rejilla de cuantización de las entradas.
+        registry (ModelRegistry | None): Si se indica, se sirve la versión activa del
+            registro (sustituye a model_path/encoder_path).
+
+    Variables de proceso:
+        _entries: OrderedDict clave -> (instante, resultado) en orden de uso.
+        _stamp: (mtime_ns, tamaño) del modelo; solo si cambia se recalcula el hash.
+            Con registro, el hash es el de la versión activa del manifiesto.
+        stats: Contadores de aciertos, fallos, expulsiones, caducidades e invalidaciones.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, encoder_path=ENCODER_PATH,
+                 maxsize=4096, ttl=3600.0, resolution=SLIDER_RESOLUTION, registry=None):
+        self.model_path = model_path
+        self.encoder_path = encoder_path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.resolution = resolution
+        self.registry = registry
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._model_hash = None
+        self._model = None
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0,
+                      'expirations': 0, 'invalidations': 0}
+
+    @property
+    def model_hash(self):
+        return self._model_hash
+
+    def model(self):
+        """
+        Devuelve (pipeline, le, hash), recargando y vaciando la caché si el
+        modelo (o la versión activa del registro) cambió.
+
+        Los tres valores se leen dentro del mismo bloqueo, de modo que el hash
+        corresponde siempre al pipeline devuelto aunque otra sesión cambie el
+        modelo a la vez.
+
+        Salida:
+            tuple: (pipeline, le, hash del modelo) vigentes.
+        """
+        if self.registry is not None:
+            # >> versión activa del registro: su hash ya está en el manifiesto <<
+            entry = self.registry.entry()
+            stamp, model_hash = None, entry['model_sha256']
+            loader = lambda: self.registry.load(entry['version'])[:2]
+            with self._lock:
+                if model_hash == self._model_hash:
+                    return self._model + (self._model_hash,)
+        else:
+            stat = os.stat(self.model_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                if stamp == self._stamp:
+                    return self._model + (self._model_hash,)
+
+            # >> el fichero cambió (o primera carga): comprobar contenido <<
+            model_hash = file_sha256(self.model_path)
+            loader = lambda: load_model(self.model_path, self.encoder_path)
+
+        with self._lock:
+            if model_hash != self._model_hash:
+                self._model = loader()
+                if self._model_hash is not None:
+                    self.stats['invalidations'] += 1
+                self._entries.clear()
+                self._model_hash = model_hash
+            self._stamp = stamp
+            return self._model + (self._model_hash,)
+
+    def predict_crop(self, N, P, K, temperature, humidity, ph, rainfall):
+        """
+        Igual que croprec.predict_crop, pero servido desde la caché si es posible.
+
+        Parámetros de entrada:
+            N, P, K, temperature, humidity, ph, rainfall (float): Valores de los sliders.
+
+        Salida:
+            tuple: (cultivo, dict {cultivo: probabilidad} con el top-5).
+        """
+        pipeline, le, model_hash = self.model()
+        key = quantize_inputs((N, P, K, temperature, humidity, ph, rainfall), self.resolution)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self.ttl is None or now - entry[0] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.stats['hits'] += 1
+                    return entry[1]
+                del self._entries[key]
+                self.stats['expirations'] += 1
+            self.stats['misses'] += 1
+
+        # >> se predice el punto canónico de la rejilla para que la clave sea exacta <<
+        result = predict_crop(*dequantize_key(key, self.resolution), pipeline, le)
+
+        with self._lock:
+            # >> no guardar resultados de un modelo que ya fue reemplazado <<
+            if model_hash != self._model_hash:
+                return result
+            self._entries[key] = (now, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+        return result
+
+    def info(self):
+        """
+        Contadores actuales junto con tamaño, capacidad y hash del modelo.
+        """
+        with self._lock:
+            total = self.stats['hits'] + self.stats['misses']
+            return dict(self.stats, size=len(self._entries), maxsize=self.maxsize,
+                        hit_rate=self.stats['hits'] / total if total else 0.0,
+                        model_hash=self._model_hash)
+
+    def clear(self):
+        """
+        Vacía las entradas sin tocar los contadores.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,245 @@
+"""
+Validación cruzada y comparación de modelos en paralelo.
+
+El notebook ejecuta cross_validate(..., n_jobs=-1) modelo a modelo mientras
+RandomForest y XGBoost usan también n_jobs=-1, de modo que los dos niveles
+compiten por los mismos núcleos. Este runner planifica todas las tareas
+(modelo × fold) en un único pool de procesos con un presupuesto explícito de
+núcleos por tarea, comparte la matriz de entrenamiento como arrays .npy
+mapeados en memoria (en vez de serializarla para cada worker) y genera la
+misma tabla summary_df del notebook junto con los tiempos de cada tarea.
+
+Uso:
+    python -m croprec.compare --cores 8 --cores-per-task 2 [--models SVM "Random Forest"]
+"""
+
+# >> Imports <<
+import argparse
+import os
+import tempfile
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+from croprec.train import RANDOM_STATE, DATA_PATH, load_dataset, split_dataset, build_pipeline
+
+# >> XGBoost es opcional: sin él se compara solo SVM y Random Forest <<
+try:
+    from xgboost import XGBClassifier
+except ImportError:
+    XGBClassifier = None
+
+N_SPLITS = 5
+
+
+def build_models(n_jobs=1, random_state=RANDOM_STATE):
+    """
+    Pipelines del notebook con n_jobs fijado al presupuesto de cada tarea.
+
+    Parámetros de entrada:
+        n_jobs (int): Núcleos que puede usar cada estimador.
+        random_state (int): Semilla.
+
+    Salida:
+        dict: Nombre -> Pipeline sin entrenar.
+    """
+    models = {
+        'SVM': Pipeline([
+            ('scaler', StandardScaler()),
+            ('clf', SVC(kernel='rbf', C=10, gamma='scale',
+                        random_state=random_state, probability=True))
+        ]),
+        'Random Forest': build_pipeline(n_jobs=n_jobs, random_state=random_state),
+    }
+    if XGBClassifier is not None:
+        models['XGBoost'] = Pipeline([
+            ('scaler', StandardScaler()),
+            ('clf', XGBClassifier(n_estimators=200, max_depth=6, learning_rate=0.1,
+                                  random_state=random_state, n_jobs=n_jobs,
+                                  eval_metric='mlogloss'))
+        ])
+    return models
+
+
+def _scores(prefix, y_true, y_pred):
+    """
+    Métricas del notebook (accuracy y macro) con un prefijo train_/test_.
+    """
+    return {
+        f'{prefix}accuracy': accuracy_score(y_true, y_pred),
+        f'{prefix}f1_macro': f1_score(y_true, y_pred, average='macro'),
+        f'{prefix}precision_macro': precision_score(y_true, y_pred, average='macro', zero_division=0),
+        f'{prefix}recall_macro': recall_score(y_true, y_pred, average='macro', zero_division=0),
+    }
+
+
+def _init_worker(cores_per_task):
+    """
+    Limita los hilos BLAS/OpenMP de cada worker al presupuesto de la tarea.
+    """
+    warnings.filterwarnings('ignore')
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(cores_per_task)
+    except ImportError:
+        pass
+
+
+def _run_task(model_name, fold, data_dir, train_idx, test_idx, cores_per_task, random_state):
+    """
+    Entrena y evalúa un modelo en un fold (se ejecuta en un worker).
+
+    Parámetros de entrada:
+        model_name (str): Modelo de build_models.
+        fold (int): Número de fold.
+        data_dir (str): Directorio con X.npy e y.npy compartidos.
+        train_idx, test_idx (ndarray): Índices del fold.
+        cores_per_task (int): n_jobs del estimador.
+        random_state (int): Semilla.
+
+    Variables de proceso:
+        X, y: Arrays abiertos con mmap_mode='r' (páginas compartidas entre workers).
+
+    Salida:
+        dict: Métricas train/test y tiempos de ajuste y evaluación.
+    """
+    t_start = time.perf_counter()
+    X = np.load(os.path.join(data_dir, 'X.npy'), mmap_mode='r')
+    y = np.load(os.path.join(data_dir, 'y.npy'), mmap_mode='r')
+    model = build_models(cores_per_task, random_state)[model_name]
+
+    t0 = time.perf_counter()
+    model.fit(X[train_idx], y[train_idx])
+    fit_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = _scores('test_', y[test_idx], model.predict(X[test_idx]))
+    score_time = time.perf_counter() - t0
+    result.update(_scores('train_', y[train_idx], model.predict(X[train_idx])))
+    result.update({
+        'Modelo': model_name, 'fold': fold, 'pid': os.getpid(),
+        'fit_time': fit_time, 'score_time': score_time,
+        'task_time': time.perf_counter() - t_start,
+    })
+    return result
+
+
+def summarize(tasks_df, model_order=None):
+    """
+    Construye summary_df con las mismas columnas que el notebook.
+
+    Parámetros de entrada:
+        tasks_df (DataFrame): Una fila por tarea (modelo × fold).
+        model_order (list | None): Orden de los modelos antes de ordenar por accuracy.
+
+    Salida:
+        DataFrame: Tabla comparativa ordenada por Accuracy (mean).
+    """
+    summary_data = []
+    for name in model_order or tasks_df['Modelo'].unique():
+        r = tasks_df[tasks_df['Modelo'] == name]
+        summary_data.append({
+            'Modelo': name,
+            'Accuracy (mean)': r['test_accuracy'].to_numpy().mean(),
+            'Accuracy (std)': r['test_accuracy'].to_numpy().std(),
+            'F1-Score (mean)': r['test_f1_macro'].to_numpy().mean(),
+            'F1-Score (std)': r['test_f1_macro'].to_numpy().std(),
+            'Precision (mean)': r['test_precision_macro'].to_numpy().mean(),
+            'Recall (mean)': r['test_recall_macro'].to_numpy().mean(),
+            'Tiempo (s)': r['task_time'].sum(),
+        })
+    summary_df = pd.DataFrame(summary_data)
+    return summary_df.sort_values('Accuracy (mean)', ascending=False).reset_index(drop=True)
+
+
+def run_comparison(X, y, models=None, cores=None, cores_per_task=1,
+                   n_splits=N_SPLITS, random_state=RANDOM_STATE):
+    """
+    Ejecuta la validación cruzada de todos los modelos en un único pool.
+
+    Parámetros de entrada:
+        X (array-like): Matriz de entrenamiento.
+        y (array-like): Etiquetas codificadas.
+        models (list | None): Nombres a comparar (None = todos los disponibles).
+        cores (int | None): Núcleos totales (None = os.cpu_count()).
+        cores_per_task (int): Núcleos asignados a cada tarea (modelo × fold).
+        n_splits (int): Número de folds estratificados.
+        random_state (int): Semilla de los folds y de los modelos.
+
+    Variables de proceso:
+        n_workers: cores // cores_per_task procesos, para no sobresuscribir núcleos.
+
+    Salida:
+        tuple: (summary_df, tasks_df, tiempo total en segundos).
+    """
+    available = list(build_models(1, random_state))
+    models = models or available
+    unknown = set(models) - set(available)
+    if unknown:
+        raise ValueError(f'Modelos no disponibles: {sorted(unknown)} (disponibles: {available})')
+    cores = cores or os.cpu_count()
+    n_workers = max(1, cores // cores_per_task)
+
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y)
+    folds = list(StratifiedKFold(n_splits=n_splits, shuffle=True,
+                                 random_state=random_state).split(X, y))
+
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='croprec_cv_') as data_dir:
+        # >> matriz compartida en disco: los workers la abren como memmap <<
+        np.save(os.path.join(data_dir, 'X.npy'), X)
+        np.save(os.path.join(data_dir, 'y.npy'), y)
+
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(cores_per_task,)) as pool:
+            futures = [
+                pool.submit(_run_task, name, fold, data_dir, train_idx, test_idx,
+                            cores_per_task, random_state)
+                for name in models
+                for fold, (train_idx, test_idx) in enumerate(folds, start=1)
+            ]
+            tasks = [future.result() for future in as_completed(futures)]
+    elapsed = time.perf_counter() - t0
+
+    tasks_df = pd.DataFrame(tasks).sort_values(['Modelo', 'fold']).reset_index(drop=True)
+    return summarize(tasks_df, models), tasks_df, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Comparación de modelos con CV en paralelo')
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--models', nargs='*', default=None)
+    parser.add_argument('--cores', type=int, default=os.cpu_count())
+    parser.add_argument('--cores-per-task', type=int, default=1)
+    parser.add_argument('--folds', type=int, default=N_SPLITS)
+    parser.add_argument('--tasks-out', default=None, help='CSV con los tiempos de cada tarea')
+    args = parser.parse_args()
+
+    X_train, _, y_train, _, _ = split_dataset(load_dataset(args.data))
+    summary_df, tasks_df, elapsed = run_comparison(
+        X_train, y_train, args.models, args.cores, args.cores_per_task, args.folds
+    )
+
+    print("\n📊 Tabla Comparativa de Modelos:")
+    print("=" * 100)
+    print(summary_df.to_string(float_format=lambda v: f'{v:.4f}'))
+    print("\n⏱️  Tiempos por tarea:")
+    print(tasks_df[['Modelo', 'fold', 'pid', 'fit_time', 'score_time', 'task_time']]
+          .to_string(float_format=lambda v: f'{v:.2f}'))
+    print(f"\n✅ {len(tasks_df)} tareas en {elapsed:.2f}s "
+          f"({args.cores} núcleos, {args.cores_per_task} por tarea)")
+    if args.tasks_out:
+        tasks_df.to_csv(args.tasks_out, index=False)
+
+
+if __name__ == '__main__':
+    main()
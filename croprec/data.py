@@ -0,0 +1,226 @@
+"""
+Caché columnar binaria del dataset para no volver a parsear el CSV.
+
+La primera lectura convierte el CSV a un directorio con un .npy por columna
+(N/P/K en int16, variables climáticas en float32 y label como códigos int8
+más la lista de categorías en meta.json). Las lecturas siguientes abren los
+.npy con mmap_mode='r', sin parsear texto y compartiendo páginas entre
+procesos. La caché se valida por (mtime, tamaño) del CSV y, si estos cambian,
+por su sha256; ante cualquier problema se vuelve a pd.read_csv.
+
+Uso:
+    python -m croprec.data --data data/Crop_recommendation.csv
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import shutil
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from croprec.cache import file_sha256
+from croprec.model import PROJECT_ROOT
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'Crop_recommendation.csv')
+
+# >> Directorio de caché junto al CSV <<
+CACHE_DIRNAME = '.croprec_cache'
+
+# >> Tipos de cada columna en disco (versión del formato en meta.json) <<
+COLUMN_DTYPES = {
+    'N': np.int16, 'P': np.int16, 'K': np.int16,
+    'temperature': np.float32, 'humidity': np.float32,
+    'ph': np.float32, 'rainfall': np.float32,
+}
+FORMAT_VERSION = 1
+
+
+def cache_dir_for(csv_path):
+    """
+    Directorio de caché de un CSV: <carpeta del CSV>/.croprec_cache/<nombre>.
+    """
+    folder, name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(folder, CACHE_DIRNAME, os.path.splitext(name)[0])
+
+
+def _source_stamp(csv_path):
+    """
+    (mtime_ns, tamaño) del CSV, para validar la caché sin leerlo.
+    """
+    stat = os.stat(csv_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _column_dtype(values, dtype):
+    """
+    Tipo de disco de una columna: el del esquema si la conversión es exacta, si no float32.
+    """
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        if (np.all(np.mod(values, 1) == 0) and values.min() >= info.min
+                and values.max() <= info.max):
+            return dtype
+        return np.float32
+    return dtype
+
+
+def build_cache(csv_path, cache_dir=None):
+    """
+    Convierte el CSV al formato columnar en disco.
+
+    Parámetros de entrada:
+        csv_path (str): CSV con las columnas de COLUMN_DTYPES y label.
+        cache_dir (str | None): Directorio destino (None = cache_dir_for(csv_path)).
+
+    Variables de proceso:
+        tmp_dir: Directorio temporal que se renombra al terminar (escritura atómica).
+
+    Salida:
+        dict: Contenido de meta.json.
+    """
+    cache_dir = cache_dir or cache_dir_for(csv_path)
+    stamp = _source_stamp(csv_path)
+    df = pd.read_csv(csv_path, dtype={col: np.float64 for col in COLUMN_DTYPES})
+
+    tmp_dir = f'{cache_dir}.tmp{os.getpid()}'
+    os.makedirs(tmp_dir, exist_ok=True)
+    dtypes = {}
+    for col, dtype in COLUMN_DTYPES.items():
+        values = df[col].to_numpy()
+        dtypes[col] = np.dtype(_column_dtype(values, dtype)).name
+        np.save(os.path.join(tmp_dir, f'{col}.npy'), values.astype(dtypes[col]))
+
+    labels = pd.Categorical(df['label'])
+    # >> códigos con signo: -1 representa una etiqueta ausente <<
+    code_dtype = np.int8 if len(labels.categories) <= np.iinfo(np.int8).max else np.int32
+    np.save(os.path.join(tmp_dir, 'label.npy'), labels.codes.astype(code_dtype))
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'source': os.path.abspath(csv_path),
+        'source_stamp': stamp,
+        'source_sha256': file_sha256(csv_path),
+        'rows': int(len(df)),
+        'columns': list(COLUMN_DTYPES) + ['label'],
+        'dtypes': dtypes,
+        'categories': [str(c) for c in labels.categories],
+    }
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+    return meta
+
+
+def _valid_meta(csv_path, cache_dir):
+    """
+    meta.json de la caché si sigue correspondiendo al CSV, si no None.
+    """
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta.get('format_version') != FORMAT_VERSION:
+        return None
+    stamp = _source_stamp(csv_path)
+    if meta['source_stamp'] == stamp:
+        return meta
+
+    # >> cambió la fecha o el tamaño: comprobar el contenido antes de reconstruir <<
+    if meta['source_sha256'] != file_sha256(csv_path):
+        return None
+    meta['source_stamp'] = stamp
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def load_columns(csv_path=DATA_PATH, cache_dir=None, rebuild=True):
+    """
+    Columnas del dataset como arrays memmap de solo lectura (sin copias).
+
+    Parámetros de entrada:
+        csv_path (str): CSV de origen.
+        cache_dir (str | None): Directorio de caché (None = cache_dir_for(csv_path)).
+        rebuild (bool): Construir la caché si falta o está obsoleta.
+
+    Salida:
+        tuple: (dict columna -> ndarray memmap con label como códigos, meta).
+
+    Excepciones:
+        FileNotFoundError: Si no hay caché válida y rebuild es False.
+    """
+    cache_dir = cache_dir or cache_dir_for(csv_path)
+    meta = _valid_meta(csv_path, cache_dir)
+    if meta is None:
+        if not rebuild:
+            raise FileNotFoundError(f'No hay caché válida para {csv_path} en {cache_dir}')
+        meta = build_cache(csv_path, cache_dir)
+    columns = {
+        col: np.load(os.path.join(cache_dir, f'{col}.npy'), mmap_mode='r')
+        for col in meta['columns']
+    }
+    return columns, meta
+
+
+def load_cached_dataset(csv_path=DATA_PATH, cache_dir=None):
+    """
+    Dataset como DataFrame tipado desde la caché, o desde el CSV si falla.
+
+    No confundir con croprec.train.load_dataset, que lee el CSV en float64 y
+    añade N_over_PK para entrenar.
+
+    Parámetros de entrada:
+        csv_path (str): CSV de origen.
+        cache_dir (str | None): Directorio de caché.
+
+    Variables de proceso:
+        data: Una Series por columna sobre su memmap; construir el DataFrame
+            desde arrays sueltos consolidaría las columnas del mismo tipo en un
+            bloque nuevo (copia), así que cada columna numérica se pasa como
+            Series para que siga leyendo de la caché. Solo los códigos de label
+            (1 byte por fila) se copian en el Categorical.
+
+    Salida:
+        DataFrame: Columnas de COLUMN_DTYPES y label categórica.
+    """
+    try:
+        columns, meta = load_columns(csv_path, cache_dir)
+    except (OSError, ValueError, KeyError) as exc:
+        warnings.warn(f'Caché columnar no disponible ({exc}); se lee el CSV')
+        return pd.read_csv(csv_path)
+
+    data = {col: pd.Series(columns[col], copy=False) for col in COLUMN_DTYPES}
+    data['label'] = pd.Categorical.from_codes(np.asarray(columns['label']), meta['categories'])
+    return pd.DataFrame(data, copy=False)
+
+
+def main():
+    import resource
+
+    parser = argparse.ArgumentParser(description='Construye la caché columnar del dataset')
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--cache-dir', default=None)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    meta = build_cache(args.data, args.cache_dir)
+    elapsed = time.perf_counter() - t0
+    cache_dir = args.cache_dir or cache_dir_for(args.data)
+    size_mb = sum(os.path.getsize(os.path.join(cache_dir, f)) for f in os.listdir(cache_dir)) / 2**20
+
+    print(f"✅ {meta['rows']:,} filas convertidas en {elapsed:.2f}s → {cache_dir} ({size_mb:.1f} MB, "
+          f"CSV {os.path.getsize(args.data) / 2**20:.1f} MB)")
+    print('Tipos: ' + ', '.join(f'{k}={v}' for k, v in meta['dtypes'].items()))
+    print(f"RSS máximo: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
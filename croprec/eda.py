@@ -0,0 +1,268 @@
+"""
+Agregados precalculados para la página de EDA.
+
+La página de EDA recalculaba en cada rerun la matriz de correlación, las
+medianas por cultivo (un filtro por cultivo en un bucle), los mínimos y
+máximos de cada columna y los pares de correlación con un bucle O(n²) en
+Python. Aquí se calculan una sola vez por versión del dataset (un único
+groupby por label y operaciones vectorizadas) y se guardan en JSON junto a
+la caché columnar, con el sha256 del CSV como clave.
+
+Para que las gráficas no envíen el DataFrame completo al navegador, se
+guardan también histogramas ya agrupados con NumPy, los cuantiles de los
+boxplots y una muestra estratificada proporcional al tamaño de cada
+cultivo, todo acotado por un presupuesto de puntos.
+
+Uso:
+    python -m croprec.eda --data data/Crop_recommendation.csv
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from croprec.cache import file_sha256
+from croprec.data import DATA_PATH, cache_dir_for, load_cached_dataset, load_columns
+from croprec.features import RAW_FEATURES
+
+# >> Versión del formato del JSON (cambiarla invalida las cachés existentes) <<
+FORMAT_VERSION = 3
+AGGREGATES_FILE = 'eda_aggregates.json'
+HEAD_ROWS = 15
+
+# >> Puntos máximos enviados por gráfica y barras de los histogramas <<
+POINT_BUDGET = 5000
+HIST_BINS = 40
+
+
+def correlation_pairs(corr):
+    """
+    Pares de variables ordenados por |correlación| de mayor a menor (sin bucles en Python).
+
+    Parámetros de entrada:
+        corr (DataFrame): Matriz de correlación cuadrada.
+
+    Salida:
+        list: Tuplas (variable 1, variable 2, correlación).
+    """
+    cols = corr.columns
+    i, j = np.triu_indices(len(cols), k=1)
+    values = corr.to_numpy()[i, j]
+    order = np.argsort(-np.abs(values), kind='stable')
+    return [(cols[i[o]], cols[j[o]], float(values[o])) for o in order]
+
+
+def histogram(values, bins=HIST_BINS):
+    """
+    Histograma agrupado en el servidor.
+
+    Salida:
+        dict: counts (bins,) y edges (bins + 1,).
+    """
+    counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+    return {'counts': counts.tolist(), 'edges': edges.tolist()}
+
+
+def box_stats(values, max_outliers=POINT_BUDGET, seed=42):
+    """
+    Cuantiles de un boxplot (regla de 1.5 IQR como plotly) calculados en el servidor.
+
+    Parámetros de entrada:
+        values (array-like): Valores de la variable.
+        max_outliers (int): Outliers máximos devueltos (muestreo uniforme si hay más).
+        seed (int): Semilla del muestreo de outliers.
+
+    Salida:
+        dict: q1, median, q3, mean, lowerfence, upperfence, outliers y n_outliers.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)]
+    n_outliers = len(outliers)
+    if n_outliers > max_outliers:
+        outliers = np.random.default_rng(seed).choice(outliers, max_outliers, replace=False)
+    return {
+        'q1': float(q1), 'median': float(median), 'q3': float(q3), 'mean': float(values.mean()),
+        'lowerfence': float(inside.min()), 'upperfence': float(inside.max()),
+        'outliers': outliers.tolist(), 'n_outliers': int(n_outliers),
+    }
+
+
+def stratified_sample(df, budget=POINT_BUDGET, by='label', seed=42, proportional=True):
+    """
+    Muestra uniforme de cada cultivo con un cupo por cultivo.
+
+    Con proportional=True el cupo de cada cultivo es proporcional a su número
+    de filas, así que la muestra conserva la distribución global (la que
+    dibuja el violín de todo el dataset). Con proportional=False todos los
+    cultivos reciben el mismo cupo (budget / n_cultivos), lo que solo es
+    adecuado para vistas por cultivo: en un dataset desbalanceado deformaría
+    la distribución global.
+
+    Equivale a un reservoir sampling por grupo hecho en una pasada: cada fila
+    recibe una prioridad aleatoria y se conservan las de menor prioridad de
+    cada grupo (un único lexsort, sin bucles por cultivo).
+
+    Parámetros de entrada:
+        df (DataFrame): Dataset con la columna by.
+        budget (int): Filas totales máximas.
+        by (str): Columna de estratificación.
+        seed (int): Semilla.
+        proportional (bool): Cupo proporcional al tamaño del cultivo o igual para todos.
+
+    Salida:
+        DataFrame: Muestra con como mucho budget filas.
+    """
+    codes = pd.Categorical(df[by]).codes
+    n_groups = int(codes.max()) + 1 if len(codes) else 0
+    if len(df) <= budget or n_groups == 0:
+        return df.reset_index(drop=True)
+    priority = np.random.default_rng(seed).random(len(df))
+    order = np.lexsort((priority, codes))
+    sorted_codes = codes[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_codes, sorted_codes)
+    if proportional:
+        # >> códigos desplazados en 1: -1 (etiqueta ausente) es un grupo más <<
+        quota = np.bincount(codes + 1) * budget // len(df)
+        keep = np.sort(order[rank < quota[sorted_codes + 1]])
+    else:
+        keep = np.sort(order[rank < max(1, budget // n_groups)])
+    return df.iloc[keep].reset_index(drop=True)
+
+
+def compute_aggregates(df, num_cols=RAW_FEATURES, head_rows=HEAD_ROWS,
+                       point_budget=POINT_BUDGET, bins=HIST_BINS):
+    """
+    Calcula todas las estadísticas que muestra la página de EDA.
+
+    Parámetros de entrada:
+        df (DataFrame): Dataset con num_cols y label.
+        num_cols (list): Variables numéricas.
+        head_rows (int): Filas de muestra para la vista del dataset.
+        point_budget (int): Puntos máximos de la muestra y de los outliers de cada boxplot.
+        bins (int): Barras de cada histograma.
+
+    Variables de proceso:
+        grouped: Único groupby por label (medianas y tamaños salen de la misma agrupación).
+
+    Salida:
+        dict: shape, null_count, n_labels, head, describe, corr, corr_pairs,
+        crop_medians, crop_counts, histograms, box_stats, sample y point_budget.
+    """
+    grouped = df.groupby('label', observed=True, sort=True)[num_cols]
+    crop_medians = grouped.median().astype(np.float64)
+    crop_counts = grouped.size().sort_values(ascending=False, kind='stable')
+    corr = df[num_cols].corr()
+    return {
+        'shape': [int(df.shape[0]), int(df.shape[1])],
+        'null_count': int(df.isna().to_numpy().sum()),
+        'n_labels': int(len(crop_counts)),
+        'head': df.head(head_rows).astype({'label': str}),
+        'describe': df[num_cols].describe().T.astype(np.float64),
+        'corr': corr,
+        'corr_pairs': correlation_pairs(corr),
+        'crop_medians': crop_medians,
+        'crop_counts': crop_counts,
+        'histograms': {col: histogram(df[col], bins) for col in num_cols},
+        'box_stats': {col: box_stats(df[col], point_budget) for col in num_cols},
+        'sample': stratified_sample(df[num_cols + ['label']], point_budget).astype({'label': str}),
+        'point_budget': point_budget,
+    }
+
+
+def _to_json(aggregates, source_sha256):
+    """
+    Serializa los agregados (los DataFrame/Series en orient='split').
+    """
+    payload = {'format_version': FORMAT_VERSION, 'source_sha256': source_sha256}
+    for key, value in aggregates.items():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            payload[key] = json.loads(value.to_json(orient='split'))
+        else:
+            payload[key] = value
+    return payload
+
+
+def _from_json(payload):
+    """
+    Reconstruye los agregados guardados con _to_json.
+    """
+    aggregates = dict(payload)
+    for key in ('head', 'describe', 'corr', 'crop_medians', 'sample'):
+        aggregates[key] = pd.DataFrame(**payload[key])
+    counts = payload['crop_counts']
+    aggregates['crop_counts'] = pd.Series(counts['data'], index=counts['index'], name=counts.get('name'))
+    aggregates['corr_pairs'] = [tuple(pair) for pair in payload['corr_pairs']]
+    return aggregates
+
+
+def load_aggregates(csv_path=DATA_PATH, df=None, point_budget=POINT_BUDGET):
+    """
+    Agregados del dataset desde la caché en disco, o calculados y guardados si no coinciden.
+
+    Parámetros de entrada:
+        csv_path (str): CSV de origen (su sha256 es la clave de la caché).
+        df (DataFrame | None): Dataset ya cargado (None = croprec.data.load_cached_dataset).
+        point_budget (int): Presupuesto de puntos de las gráficas (forma parte de la clave).
+
+    Variables de proceso:
+        source_sha256: Hash del CSV validado por la caché columnar (o calculado si no está disponible).
+
+    Salida:
+        dict: Igual que compute_aggregates, más format_version y source_sha256.
+    """
+    try:
+        source_sha256 = load_columns(csv_path)[1]['source_sha256']
+    except (OSError, ValueError, KeyError):
+        source_sha256 = file_sha256(csv_path)
+    path = os.path.join(cache_dir_for(csv_path), AGGREGATES_FILE)
+
+    if os.path.exists(path):
+        with open(path) as f:
+            payload = json.load(f)
+        if (payload.get('format_version') == FORMAT_VERSION
+                and payload.get('source_sha256') == source_sha256
+                and payload.get('point_budget') == point_budget):
+            return _from_json(payload)
+
+    # >> caché ausente u obsoleta: recalcular una vez para esta versión del dataset <<
+    df = load_cached_dataset(csv_path) if df is None else df
+    payload = _to_json(compute_aggregates(df, point_budget=point_budget), source_sha256)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(payload, f)
+    except OSError:
+        pass
+    return _from_json(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precalcula los agregados de la página de EDA')
+    parser.add_argument('--data', default=DATA_PATH)
+    args = parser.parse_args()
+
+    path = os.path.join(cache_dir_for(args.data), AGGREGATES_FILE)
+    if os.path.exists(path):
+        os.remove(path)
+    t0 = time.perf_counter()
+    aggregates = load_aggregates(args.data)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    load_aggregates(args.data)
+    t_load = time.perf_counter() - t0
+
+    print(f"✅ Agregados de {aggregates['shape'][0]:,} filas y {aggregates['n_labels']} cultivos "
+          f"en {t_build:.3f}s → {path}")
+    print(f"Lectura desde la caché: {t_load * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
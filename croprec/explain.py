@@ -0,0 +1,245 @@
+"""
+Explicación de cada predicción como suma de contribuciones por variable.
+
+Descomposición por caminos (Saabas) sobre el bosque aplanado: al recorrer un
+árbol, cada división mueve la distribución de clases del nodo padre a la del
+hijo elegido, y esa diferencia se atribuye a la variable de la división.
+Como FlatForest guarda la distribución normalizada de todos los nodos (no
+solo de las hojas), para cada fila y clase se cumple exactamente
+
+    predict_proba = base + suma de contribuciones de las 8 variables
+
+donde base es la media de las distribuciones de las raíces (la proporción de
+cada cultivo en las muestras bootstrap). N_over_PK tiene su propia
+contribución, separada de N, P y K.
+
+El recorrido es el mismo que FlatForest.apply (todos los pares fila-árbol
+avanzan un nivel a la vez), así que una consulta de la app cuesta unos pocos
+milisegundos. En modo por lotes solo se acumula la clase predicha de cada
+fila con np.bincount.
+
+Uso:
+    python -m croprec.explain suelos.csv explicaciones.csv [--chunksize 50000] [--forest rf_flat.npz]
+"""
+
+# >> Imports <<
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from croprec.features import FEATURES, RAW_FEATURES, build_features
+from croprec.forest import CHUNK_ROWS, FlatForest
+from croprec.model import MODEL_PATH, ENCODER_PATH, load_model
+from croprec.score import read_chunks, write_chunks, print_progress
+
+# >> Filas por bloque en el modo por lotes del CLI <<
+CHUNKSIZE = 50_000
+
+
+def base_values(forest):
+    """
+    Distribución de clases media de las raíces (valor esperado antes de ninguna división).
+
+    Salida:
+        ndarray: Vector (n_clases,).
+    """
+    return forest.value[forest.roots].mean(axis=0)
+
+
+def path_contributions(forest, X, class_index=None):
+    """
+    Contribución de cada variable a la probabilidad de cada fila.
+
+    Parámetros de entrada:
+        forest (FlatForest): Bosque aplanado (plegado o no).
+        X (array-like): Matriz (n, 8) de features del modelo (build_features).
+        class_index (array-like | None): Columna de clase a explicar en cada fila;
+            None = todas las clases.
+
+    Variables de proceso:
+        pos: Pares (fila, árbol) que aún no han llegado a una hoja.
+        delta: Cambio de la distribución de clases al pasar del nodo a su hijo.
+
+    Salida:
+        ndarray: (n, 8, n_clases) si class_index es None, (n, 8) si no. Sumado sobre
+        las variables y más base_values(forest) da predict_proba.
+    """
+    X = forest._prepare(X)
+    n_rows, n_features = X.shape
+    n_classes = len(forest.classes_)
+    if class_index is None:
+        contributions = np.zeros((n_rows, n_features, n_classes))
+    else:
+        class_index = np.asarray(class_index, dtype=np.int64)
+        contributions = np.zeros((n_rows, n_features))
+
+    for start in range(0, n_rows, CHUNK_ROWS):
+        block = X[start:start + CHUNK_ROWS]
+        n_block = len(block)
+        X_flat = block.ravel()
+        nodes = np.tile(forest.roots, n_block)
+        row = np.repeat(np.arange(n_block, dtype=np.int64), forest.n_trees)
+        pos = np.arange(nodes.size)
+        flat_out = contributions[start:start + n_block].reshape(n_block * n_features, -1)
+
+        # >> mismo recorrido que FlatForest.apply, acumulando el cambio de cada división <<
+        while pos.size:
+            cur = nodes.take(pos)
+            rows = row.take(pos)
+            feature = forest.feature.take(cur)
+            x = X_flat.take(rows * n_features + feature)
+            nxt = np.where(x <= forest.threshold.take(cur), forest.left.take(cur), forest.right.take(cur))
+            moved = nxt != cur
+            pos, cur, nxt, rows, feature = pos[moved], cur[moved], nxt[moved], rows[moved], feature[moved]
+            target = rows * n_features + feature
+            if class_index is None:
+                np.add.at(flat_out, target, forest.value[nxt] - forest.value[cur])
+            else:
+                cls = class_index[start + rows]
+                delta = forest.value[nxt, cls] - forest.value[cur, cls]
+                flat_out[:, 0] += np.bincount(target, weights=delta, minlength=n_block * n_features)
+            nodes[pos] = nxt
+    contributions /= forest.n_trees
+    return contributions
+
+
+def explain_batch(forest, X):
+    """
+    Explicación de la clase predicha de cada fila (modo por lotes).
+
+    Parámetros de entrada:
+        forest (FlatForest): Bosque aplanado.
+        X (array-like): Matriz (n, 8) de features del modelo.
+
+    Salida:
+        tuple: (índice de clase predicha (n,), probabilidad (n,), base (n,),
+        contribuciones (n, 8)).
+    """
+    proba = forest.predict_proba(X)
+    predicted = proba.argmax(axis=1)
+    contributions = path_contributions(forest, X, predicted)
+    base = base_values(forest)[predicted]
+    return predicted, proba[np.arange(len(proba)), predicted], base, contributions
+
+
+def explain_crop(forest, le, N, P, K, temperature, humidity, ph, rainfall, crop=None):
+    """
+    Explicación de una consulta de la app.
+
+    Parámetros de entrada:
+        forest (FlatForest): Bosque aplanado del modelo vigente.
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+        N, P, K, temperature, humidity, ph, rainfall (float): Valores de entrada.
+        crop (str | None): Cultivo a explicar (None = el más probable).
+
+    Variables de proceso:
+        contributions: Matriz (8, n_clases) de contribuciones de la fila.
+
+    Salida:
+        dict: crop, probability, base y contributions (lista de (variable, valor,
+        contribución) ordenada por contribución absoluta descendente).
+    """
+    X = build_features([[N, P, K, temperature, humidity, ph, rainfall]])
+    contributions = path_contributions(forest, X)[0]
+    base = base_values(forest)
+    proba = base + contributions.sum(axis=0)
+    column = proba.argmax() if crop is None else int(np.flatnonzero(le.classes_[forest.classes_] == crop)[0])
+
+    order = np.argsort(-np.abs(contributions[:, column]), kind='stable')
+    return {
+        'crop': str(le.classes_[forest.classes_[column]]),
+        'probability': float(proba[column]),
+        'base': float(base[column]),
+        'contributions': [(FEATURES[i], float(X[0, i]), float(contributions[i, column])) for i in order],
+    }
+
+
+def explain_chunks(chunks, forest, le, keep_inputs=True):
+    """
+    Añade a cada bloque la predicción y las contribuciones de su clase predicha.
+
+    Parámetros de entrada:
+        chunks (iterable): DataFrames con RAW_FEATURES (read_chunks).
+        forest (FlatForest): Bosque aplanado.
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+        keep_inputs (bool): Copiar las columnas de entrada a la salida.
+
+    Variables de proceso:
+        valid: Filas sin valores ausentes en RAW_FEATURES (las únicas que se explican).
+
+    Salida:
+        generator: DataFrames con label, confidence, base y contrib_<variable>.
+    """
+    for chunk in chunks:
+        missing = set(RAW_FEATURES) - set(chunk.columns)
+        if missing:
+            raise ValueError(f'Faltan columnas en la entrada: {sorted(missing)}')
+        valid = chunk[RAW_FEATURES].notna().all(axis=1).to_numpy()
+        labels = np.full(len(chunk), None, dtype=object)
+        values = np.full((len(chunk), 2 + len(FEATURES)), np.nan, dtype=np.float32)
+        if valid.any():
+            predicted, proba, base, contributions = explain_batch(
+                forest, build_features(chunk.loc[valid, RAW_FEATURES]))
+            labels[valid] = le.classes_[forest.classes_[predicted]]
+            values[valid] = np.column_stack([proba, base, contributions])
+
+        columns = {'label': labels}
+        names = ['confidence', 'base'] + [f'contrib_{f}' for f in FEATURES]
+        columns.update({name: values[:, i] for i, name in enumerate(names)})
+        explained = pd.DataFrame(columns)
+        if keep_inputs:
+            inputs = chunk.reset_index(drop=True)
+            inputs.columns = [f'{c}_input' if c in columns else c for c in inputs.columns]
+            explained = pd.concat([inputs, explained], axis=1)
+        yield explained
+
+
+def explain_file(in_path, out_path, forest, le, chunksize=CHUNKSIZE, keep_inputs=True, progress=None):
+    """
+    Explica un CSV completo bloque a bloque.
+
+    Salida:
+        dict: Filas, bloques, segundos y filas por segundo.
+    """
+    t0 = time.perf_counter()
+    rows = n_chunks = 0
+    chunks = read_chunks(in_path, chunksize, keep_inputs)
+    for n in write_chunks(explain_chunks(chunks, forest, le, keep_inputs), out_path):
+        rows += n
+        n_chunks += 1
+        if progress is not None:
+            progress(rows, time.perf_counter() - t0)
+    elapsed = time.perf_counter() - t0
+    return {'rows': rows, 'chunks': n_chunks, 'elapsed_s': elapsed,
+            'rows_per_s': rows / elapsed if elapsed else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Explica las predicciones de un CSV por bloques')
+    parser.add_argument('input', help='CSV con N, P, K, temperature, humidity, ph, rainfall')
+    parser.add_argument('output', help='Salida .csv (o .csv.gz) o .parquet')
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--encoder', default=ENCODER_PATH)
+    parser.add_argument('--forest', default=None, help='Bosque aplanado .npz (croprec.forest) en vez del pipeline')
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--no-inputs', action='store_true', help='No copiar las columnas de entrada')
+    args = parser.parse_args()
+
+    pipeline, le = load_model(args.model, args.encoder)
+    if args.forest:
+        forest = FlatForest.load(args.forest)
+    else:
+        forest = FlatForest.from_pipeline(pipeline, fold_scaler=True)
+
+    report = explain_file(args.input, args.output, forest, le, args.chunksize,
+                          not args.no_inputs, print_progress())
+    sys.stderr.write('\n')
+    print(f"✅ {report['rows']:,} filas explicadas en {report['chunks']} bloques, {report['elapsed_s']:.2f}s "
+          f"({report['rows_per_s']:,.0f} filas/s) → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
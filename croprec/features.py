@@ -0,0 +1,52 @@
+"""
+Ingeniería de variables del recomendador de cultivos.
+
+Reproduce exactamente las transformaciones del notebook de entrenamiento
+para que el modelo reciba las features en el mismo orden.
+"""
+
+# >> Imports <<
+import numpy as np
+
+# >> Variables de entrada (sin N_over_PK) <<
+RAW_FEATURES = ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall']
+
+# >> Variables del modelo en el orden del entrenamiento <<
+FEATURES = RAW_FEATURES + ['N_over_PK']
+
+# >> Constante que evita la división por cero <<
+EPSILON = 1e-6
+
+
+def add_n_over_pk(N, P, K):
+    """
+    Calcula el ratio de nitrógeno frente a fósforo y potasio.
+    
+    Parámetros de entrada:
+        N, P, K (float | array-like): Contenidos de nitrógeno, fósforo y potasio.
+    
+    Salida:
+        float | ndarray: N / (P + K + 1e-6), vectorizado si la entrada es array.
+    """
+    return N / (P + K + EPSILON)
+
+
+def build_features(X):
+    """
+    Construye la matriz de features del modelo a partir de las variables de entrada.
+    
+    Parámetros de entrada:
+        X (DataFrame | array-like): Filas con N, P, K, temperature, humidity, ph, rainfall.
+    
+    Variables de proceso:
+        raw: Matriz (n, 7) de variables de entrada en float64.
+    
+    Salida:
+        ndarray: Matriz (n, 8) con N_over_PK como última columna.
+    """
+    # >> DataFrame por nombre de columna, array por posición <<
+    if hasattr(X, 'columns'):
+        raw = X[RAW_FEATURES].to_numpy(dtype=float)
+    else:
+        raw = np.asarray(X, dtype=float).reshape(-1, len(RAW_FEATURES))
+    return np.column_stack([raw, add_n_over_pk(raw[:, 0], raw[:, 1], raw[:, 2])])
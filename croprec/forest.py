@@ -0,0 +1,698 @@
+"""
+Evaluador de RandomForest compilado a arrays planos.
+
+El export aplana los 200 árboles del pipeline en arrays contiguos de NumPy
+(feature, umbral, hijo izquierdo, hijo derecho y distribución de clases de
+cada hoja) y el evaluador recorre todos los árboles para un lote completo a
+la vez, sin pasar por el despacho de estimadores de scikit-learn.
+
+Si numba está instalado se usa un recorrido compilado; si no, el recorrido
+vectorizado en NumPy puro.
+
+Con --fold-scaler el StandardScaler se integra en los umbrales: cada umbral
+se reescribe en unidades originales de la variable, de modo que el bosque
+exportado no escala (ni copia) los lotes de entrada y predice exactamente
+lo mismo que el pipeline.
+
+Con --compact se escribe en su lugar el formato compacto (CompactForest):
+un directorio con un .npy por array de tipos reducidos (variables int8,
+umbrales float32, hijos int32 y conteos de clase uint8 o probabilidades
+float16 solo en las hojas) que se carga con np.load(mmap_mode='r') sin
+deserializar objetos de Python.
+
+Uso:
+    python -m croprec.forest --model models/crop_recommender_rf.joblib \\
+                             --out models/crop_recommender_rf_flat.npz \\
+                             [--fold-scaler --check data/Crop_recommendation.csv]
+    python -m croprec.forest --compact --out models/crop_recommender_rf_compact \\
+                             [--leaf-dtype auto --check data/Crop_recommendation.csv]
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+
+import numpy as np
+
+from croprec.model import MODEL_PATH
+
+# >> numba es opcional: sin él se usa el evaluador NumPy <<
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# >> Máscaras para ordenar float64 por su patrón de bits <<
+_SIGN_BIT = np.int64(-2 ** 63)
+_MAGNITUDE = np.int64(2 ** 63 - 1)
+
+# >> Filas por bloque en el evaluador NumPy (acota la memoria de los pares fila-árbol) <<
+CHUNK_ROWS = 4096
+
+# >> Versión del formato compacto (directorio con meta.json y un .npy por array) <<
+COMPACT_FORMAT = 1
+
+# >> Filas cuyas hojas se reúnen de una vez al promediar el bosque compacto <<
+LEAF_BLOCK_ROWS = 256
+
+
+def _split_pipeline(model):
+    """
+    Separa el escalador y el RandomForest de un pipeline (o estimador suelto).
+
+    Parámetros de entrada:
+        model (Pipeline | RandomForestClassifier): Modelo entrenado.
+
+    Salida:
+        tuple: (scaler o None, clasificador).
+
+    Excepciones:
+        TypeError: Si el pipeline contiene pasos distintos de un StandardScaler.
+    """
+    steps = [step for _, step in model.steps] if hasattr(model, 'steps') else [model]
+    clf = steps[-1]
+    if not hasattr(clf, 'estimators_'):
+        raise TypeError(f'Se esperaba un RandomForest entrenado, no {type(clf).__name__}')
+    if len(steps) == 1:
+        return None, clf
+    if len(steps) == 2 and hasattr(steps[0], 'scale_'):
+        return steps[0], clf
+    raise TypeError('Solo se soportan pipelines [StandardScaler, RandomForest]')
+
+
+def _float_to_key(x):
+    """
+    Convierte float64 en enteros int64 con el mismo orden que los floats.
+    """
+    bits = np.asarray(x, dtype=np.float64).view(np.int64)
+    return np.where(bits < 0, -(bits & _MAGNITUDE), bits)
+
+
+def _key_to_float(key):
+    """
+    Inversa de _float_to_key.
+    """
+    return np.where(key < 0, (-key) | _SIGN_BIT, key).view(np.float64)
+
+
+def fold_thresholds(threshold, feature, mean, scale):
+    """
+    Reescribe umbrales de variables escaladas en unidades originales.
+
+    Para cada nodo busca el mayor x (float64) tal que
+    float32((x - mean) / scale) <= umbral, que es exactamente la decisión que
+    toma scikit-learn tras el StandardScaler. Como esa función es monótona en x,
+    basta una búsqueda binaria sobre el orden de los float64.
+
+    Parámetros de entrada:
+        threshold (ndarray): Umbrales en unidades escaladas (inf en hojas).
+        feature (ndarray): Variable de cada nodo.
+        mean, scale (ndarray): Parámetros del StandardScaler.
+
+    Variables de proceso:
+        lo, hi: Extremos de la búsqueda como claves int64 (decisión izquierda en lo, derecha en hi).
+
+    Salida:
+        ndarray: Umbrales en unidades originales; x <= umbral equivale a la decisión original.
+    """
+    folded = threshold.copy()
+    is_split = np.isfinite(threshold)
+    t = threshold[is_split]
+    m = mean[feature[is_split]]
+    s = scale[feature[is_split]]
+
+    lo = np.full(t.shape, _float_to_key(-np.finfo(np.float64).max))
+    hi = np.full(t.shape, _float_to_key(np.finfo(np.float64).max))
+    with np.errstate(over='ignore'):
+        for _ in range(64):
+            # >> punto medio sin desbordar int64 <<
+            mid = lo // 2 + hi // 2 + (lo % 2 + hi % 2) // 2
+            goes_left = ((_key_to_float(mid) - m) / s).astype(np.float32) <= t
+            lo = np.where(goes_left, mid, lo)
+            hi = np.where(goes_left, hi, mid)
+    folded[is_split] = _key_to_float(lo)
+    return folded
+
+
+class FlatForest:
+    """
+    Bosque aplanado en arrays contiguos, compatible con predict_crops_batch.
+
+    Parámetros de entrada:
+        feature (ndarray[int32]): Variable evaluada en cada nodo.
+        threshold (ndarray[float64]): Umbral de cada nodo (inf en las hojas).
+        left, right (ndarray[int32]): Hijos con índices globales; las hojas apuntan a sí mismas.
+        value (ndarray[float64]): Distribución de clases normalizada de cada nodo.
+        roots (ndarray[int32]): Nodo raíz de cada árbol.
+        classes (ndarray): classes_ del clasificador original.
+        max_depth (int): Profundidad máxima entre todos los árboles.
+        mean, scale (ndarray | None): Parámetros del StandardScaler a aplicar antes.
+        folded (bool): True si los umbrales están en unidades originales (sin escalado).
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes,
+                 max_depth, mean=None, scale=None, folded=False):
+        self.feature = np.ascontiguousarray(feature, dtype=np.int32)
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float64)
+        self.left = np.ascontiguousarray(left, dtype=np.int32)
+        self.right = np.ascontiguousarray(right, dtype=np.int32)
+        self.value = np.ascontiguousarray(value, dtype=np.float64)
+        self.roots = np.ascontiguousarray(roots, dtype=np.int32)
+        self.classes_ = np.asarray(classes)
+        self.max_depth = int(max_depth)
+        self.mean = None if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float64)
+        self.folded = bool(folded)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @classmethod
+    def from_pipeline(cls, model, fold_scaler=False):
+        """
+        Aplana un pipeline [StandardScaler, RandomForestClassifier] entrenado.
+
+        Parámetros de entrada:
+            model (Pipeline | RandomForestClassifier): Modelo entrenado.
+            fold_scaler (bool): Integrar el escalador en los umbrales (ver fold_scaler).
+
+        Variables de proceso:
+            offset: Desplazamiento de los índices de nodo de cada árbol.
+
+        Salida:
+            FlatForest: Bosque aplanado con las mismas probabilidades.
+        """
+        scaler, clf = _split_pipeline(model)
+        parts = {k: [] for k in ('feature', 'threshold', 'left', 'right', 'value')}
+        roots = []
+        offset = 0
+        for estimator in clf.estimators_:
+            tree = estimator.tree_
+            idx = np.arange(tree.node_count) + offset
+            is_leaf = tree.children_left == -1
+
+            # >> las hojas se apuntan a sí mismas y siempre "van a la izquierda" <<
+            parts['feature'].append(np.where(is_leaf, 0, tree.feature))
+            parts['threshold'].append(np.where(is_leaf, np.inf, tree.threshold))
+            parts['left'].append(np.where(is_leaf, idx, tree.children_left + offset))
+            parts['right'].append(np.where(is_leaf, idx, tree.children_right + offset))
+
+            # >> misma normalización que DecisionTreeClassifier.predict_proba <<
+            value = tree.value[:, 0, :clf.n_classes_].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            parts['value'].append(value / normalizer)
+
+            roots.append(offset)
+            offset += tree.node_count
+
+        forest = cls(
+            **{k: np.concatenate(v) for k, v in parts.items()},
+            roots=np.array(roots), classes=clf.classes_,
+            max_depth=max(e.tree_.max_depth for e in clf.estimators_),
+            mean=None if scaler is None or scaler.mean_ is None else scaler.mean_,
+            scale=None if scaler is None or scaler.scale_ is None else scaler.scale_,
+        )
+        return forest.fold_scaler() if fold_scaler else forest
+
+    def fold_scaler(self):
+        """
+        Devuelve un bosque sin escalador con umbrales en unidades originales.
+
+        Las divisiones de un árbol son invariantes a transformaciones afines
+        monótonas, así que el escalado se traslada a los umbrales y la
+        inferencia trabaja directamente sobre las variables originales.
+
+        Salida:
+            FlatForest: Bosque equivalente que no escala ni copia la entrada.
+        """
+        if self.folded:
+            return self
+        n_features = int(self.feature.max()) + 1
+        mean = np.zeros(n_features) if self.mean is None else self.mean
+        scale = np.ones(n_features) if self.scale is None else self.scale
+        return FlatForest(
+            self.feature, fold_thresholds(self.threshold, self.feature, mean, scale),
+            self.left, self.right, self.value, self.roots, self.classes_,
+            self.max_depth, folded=True,
+        )
+
+    def _prepare(self, X):
+        """
+        Prepara la entrada para el recorrido de los árboles.
+
+        Sin plegar, aplica el escalado y convierte a float32 como hace
+        scikit-learn; plegado, usa la entrada original en float64 sin copiarla.
+        """
+        if self.folded:
+            return np.ascontiguousarray(X, dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64)
+        if self.mean is not None:
+            X = X - self.mean
+        if self.scale is not None:
+            X = X / self.scale
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    def apply(self, X):
+        """
+        Devuelve la hoja alcanzada en cada árbol por cada fila.
+
+        Parámetros de entrada:
+            X (ndarray): Matriz ya preparada con _prepare.
+
+        Variables de proceso:
+            pos: Pares (fila, árbol) que aún no han llegado a una hoja.
+            cur: Nodo actual de cada par activo.
+
+        Salida:
+            ndarray[int32]: Matriz (n, n_trees) de índices globales de hoja.
+        """
+        n_rows, n_features = X.shape
+        X_flat = X.ravel()
+        nodes = np.tile(self.roots, n_rows)
+        x_base = np.repeat(np.arange(n_rows, dtype=np.int64) * n_features, self.n_trees)
+        pos = np.arange(nodes.size)
+
+        # >> avanzar un nivel todos los pares activos y descartar los que ya están en hoja <<
+        while pos.size:
+            cur = nodes.take(pos)
+            x = X_flat.take(x_base.take(pos) + self.feature.take(cur))
+            nxt = np.where(x <= self.threshold.take(cur), self.left.take(cur), self.right.take(cur))
+            nodes[pos] = nxt
+            pos = pos[nxt != cur]
+        return nodes.reshape(n_rows, self.n_trees)
+
+    def predict_proba(self, X, use_numba=None):
+        """
+        Probabilidades por clase promediadas sobre todos los árboles.
+
+        Parámetros de entrada:
+            X (array-like): Matriz (n, 8) de features del modelo.
+            use_numba (bool | None): Forzar o desactivar numba; None lo usa si está disponible.
+
+        Salida:
+            ndarray: Matriz (n, n_clases) igual a pipeline.predict_proba (tolerancia 1e-9).
+        """
+        X = self._prepare(X)
+        proba = np.zeros((len(X), len(self.classes_)))
+        if use_numba is None:
+            use_numba = numba is not None
+        if use_numba:
+            _accumulate_numba()(X, self.feature, self.threshold, self.left, self.right,
+                                self.value, self.roots, proba)
+        else:
+            # >> bloques de filas para acotar la memoria del recorrido <<
+            for start in range(0, len(X), CHUNK_ROWS):
+                leaves = self.apply(X[start:start + CHUNK_ROWS])
+                block = proba[start:start + CHUNK_ROWS]
+                for t in range(self.n_trees):
+                    block += self.value.take(leaves[:, t], axis=0)
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X):
+        """
+        Clase predicha (codificada) para cada fila.
+        """
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def save(self, path):
+        """
+        Guarda los arrays del bosque en un .npz sin comprimir.
+        """
+        arrays = {
+            'feature': self.feature, 'threshold': self.threshold, 'left': self.left,
+            'right': self.right, 'value': self.value, 'roots': self.roots,
+            'classes': self.classes_, 'max_depth': np.array(self.max_depth),
+            'folded': np.array(self.folded),
+        }
+        if self.mean is not None:
+            arrays['mean'] = self.mean
+        if self.scale is not None:
+            arrays['scale'] = self.scale
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Carga un bosque guardado con save().
+        """
+        with np.load(path) as data:
+            return cls(
+                data['feature'], data['threshold'], data['left'], data['right'],
+                data['value'], data['roots'], data['classes'], int(data['max_depth']),
+                mean=data['mean'] if 'mean' in data else None,
+                scale=data['scale'] if 'scale' in data else None,
+                folded=bool(data['folded']) if 'folded' in data else False,
+            )
+
+
+_NUMBA_KERNEL = None
+
+
+def _accumulate_numba():
+    """
+    Compila (una sola vez) el recorrido fila a fila con numba.
+    """
+    global _NUMBA_KERNEL
+    if _NUMBA_KERNEL is None:
+        @numba.njit(cache=True, nogil=True, parallel=True)
+        def kernel(X, feature, threshold, left, right, value, roots, out):
+            for i in numba.prange(X.shape[0]):
+                for t in range(roots.shape[0]):
+                    node = roots[t]
+                    while left[node] != node:
+                        if X[i, feature[node]] <= threshold[node]:
+                            node = left[node]
+                        else:
+                            node = right[node]
+                    for c in range(value.shape[1]):
+                        out[i, c] += value[node, c]
+        _NUMBA_KERNEL = kernel
+    return _NUMBA_KERNEL
+
+
+def _float32_floor(values):
+    """
+    Mayor float32 menor o igual que cada valor float64.
+
+    Con umbrales redondeados hacia abajo, x <= umbral32 equivale a x <= umbral
+    para cualquier x float32, que es como compara scikit-learn.
+    """
+    rounded = values.astype(np.float32)
+    too_high = rounded.astype(np.float64) > values
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
+
+
+class CompactForest:
+    """
+    Bosque en arrays planos de tipos reducidos, cargable con np.load(mmap_mode='r').
+
+    Cada nodo ocupa 13 bytes (variable int8, umbral float32 e hijos int32) y
+    solo las hojas guardan su distribución de clases, como conteos uint8 o,
+    si no caben, probabilidades float16. Las hojas se apuntan a sí mismas por
+    la izquierda; su fila en leaf_values es su orden entre las hojas.
+
+    Parámetros de entrada:
+        feature (ndarray[int8]): Variable evaluada en cada nodo.
+        threshold (ndarray[float32]): Umbral en unidades escaladas (inf en las hojas).
+        left, right (ndarray[int32]): Hijos con índices globales.
+        roots (ndarray[int32]): Nodo raíz de cada árbol.
+        leaf_values (ndarray[uint8 | float16]): (n_hojas, n_clases) conteos o probabilidades.
+        classes (ndarray): classes_ del clasificador original.
+        max_depth (int): Profundidad máxima entre todos los árboles.
+        mean, scale (ndarray | None): Parámetros del StandardScaler.
+
+    Variables de proceso:
+        leaf_row: Fila de leaf_values de cada nodo (se deriva al cargar, no se guarda).
+        leaf_scale: 1 / total de cada hoja, para normalizar conteos a probabilidades.
+    """
+
+    ARRAYS = ('feature', 'threshold', 'left', 'right', 'roots', 'leaf_values')
+
+    def __init__(self, feature, threshold, left, right, roots, leaf_values, classes,
+                 max_depth, mean=None, scale=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.roots = roots
+        self.leaf_values = leaf_values
+        self.classes_ = np.asarray(classes)
+        self.max_depth = int(max_depth)
+        self.mean = None if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float64)
+        is_leaf = np.asarray(left) == np.arange(len(left))
+        self.leaf_row = (np.cumsum(is_leaf, dtype=np.int32) - 1).astype(np.int32)
+        self.leaf_scale = 1.0 / np.asarray(leaf_values).sum(axis=1, dtype=np.float64)
+
+    n_trees = FlatForest.n_trees
+    apply = FlatForest.apply
+    predict = FlatForest.predict
+
+    @classmethod
+    def from_pipeline(cls, model, leaf_dtype='auto'):
+        """
+        Compacta un pipeline [StandardScaler, RandomForestClassifier] entrenado.
+
+        Parámetros de entrada:
+            model (Pipeline | RandomForestClassifier): Modelo entrenado.
+            leaf_dtype (str): 'uint8' (conteos), 'float16' (probabilidades) o 'auto'
+                (uint8 si todos los conteos son enteros de hasta 255).
+
+        Variables de proceso:
+            counts: Conteos (ponderados por el bootstrap) de cada clase en cada hoja.
+
+        Excepciones:
+            ValueError: Si hay más de 127 variables o se piden conteos uint8 que no caben.
+
+        Salida:
+            CompactForest: Bosque compacto.
+        """
+        scaler, clf = _split_pipeline(model)
+        if clf.n_features_in_ > np.iinfo(np.int8).max:
+            raise ValueError(f'{clf.n_features_in_} variables no caben en int8')
+
+        parts = {k: [] for k in ('feature', 'threshold', 'left', 'right', 'counts')}
+        roots = []
+        offset = 0
+        for estimator in clf.estimators_:
+            tree = estimator.tree_
+            idx = np.arange(tree.node_count) + offset
+            is_leaf = tree.children_left == -1
+
+            parts['feature'].append(np.where(is_leaf, 0, tree.feature))
+            parts['threshold'].append(np.where(is_leaf, np.inf, tree.threshold))
+            parts['left'].append(np.where(is_leaf, idx, tree.children_left + offset))
+            parts['right'].append(np.where(is_leaf, idx, tree.children_right + offset))
+
+            # >> tree.value guarda fracciones (sklearn >= 1.4) o conteos: se normaliza a conteos <<
+            value = tree.value[is_leaf, 0, :clf.n_classes_].astype(np.float64)
+            total = value.sum(axis=1, keepdims=True)
+            total[total == 0.0] = 1.0
+            parts['counts'].append(value / total * tree.weighted_n_node_samples[is_leaf, None])
+
+            roots.append(offset)
+            offset += tree.node_count
+
+        counts = np.concatenate(parts['counts'])
+        rounded = np.round(counts)
+        fits_uint8 = bool(np.allclose(counts, rounded, rtol=0, atol=1e-6)
+                          and rounded.max() <= np.iinfo(np.uint8).max)
+        if leaf_dtype == 'auto':
+            leaf_dtype = 'uint8' if fits_uint8 else 'float16'
+        if leaf_dtype == 'uint8':
+            if not fits_uint8:
+                raise ValueError(f'Los conteos de las hojas (máx. {counts.max():.0f}) no caben en uint8; '
+                                 f'usar float16')
+            leaf_values = rounded.astype(np.uint8)
+        else:
+            leaf_values = (counts / counts.sum(axis=1, keepdims=True)).astype(np.float16)
+
+        return cls(
+            np.concatenate(parts['feature']).astype(np.int8),
+            _float32_floor(np.concatenate(parts['threshold'])),
+            np.concatenate(parts['left']).astype(np.int32),
+            np.concatenate(parts['right']).astype(np.int32),
+            np.array(roots, dtype=np.int32), leaf_values, clf.classes_,
+            max(e.tree_.max_depth for e in clf.estimators_),
+            mean=None if scaler is None else scaler.mean_,
+            scale=None if scaler is None else scaler.scale_,
+        )
+
+    def _prepare(self, X):
+        """
+        Escalado y conversión a float32 como en scikit-learn.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if self.mean is not None:
+            X = X - self.mean
+        if self.scale is not None:
+            X = X / self.scale
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    def predict_proba(self, X):
+        """
+        Probabilidades por clase promediadas sobre todos los árboles.
+
+        Parámetros de entrada:
+            X (array-like): Matriz (n, 8) de features del modelo.
+
+        Salida:
+            ndarray: Matriz (n, n_clases); con hojas uint8 coincide con el pipeline (1e-9).
+        """
+        X = self._prepare(X)
+        proba = np.zeros((len(X), len(self.classes_)))
+        for start in range(0, len(X), CHUNK_ROWS):
+            rows = self.leaf_row.take(self.apply(X[start:start + CHUNK_ROWS]))
+            # >> todas las hojas de un sub-bloque a la vez: (filas, árboles, clases) · (filas, árboles) <<
+            for sub in range(0, len(rows), LEAF_BLOCK_ROWS):
+                r = rows[sub:sub + LEAF_BLOCK_ROWS]
+                proba[start + sub:start + sub + len(r)] = np.einsum(
+                    'ntc,nt->nc', self.leaf_values[r], self.leaf_scale[r])
+        proba /= self.n_trees
+        return proba
+
+    def nbytes(self):
+        """
+        Bytes de los arrays guardados en disco (sin cabeceras).
+        """
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    def save(self, path):
+        """
+        Guarda un .npy por array y meta.json en el directorio path.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(path, f'{name}.npy'), getattr(self, name))
+        meta = {
+            'format_version': COMPACT_FORMAT, 'n_trees': self.n_trees,
+            'n_nodes': int(len(self.feature)), 'n_leaves': int(len(self.leaf_values)),
+            'max_depth': self.max_depth, 'leaf_dtype': str(self.leaf_values.dtype),
+            'classes': self.classes_.tolist(),
+            'mean': None if self.mean is None else self.mean.tolist(),
+            'scale': None if self.scale is None else self.scale.tolist(),
+        }
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        """
+        Carga un bosque guardado con save() mapeando los arrays en memoria.
+
+        Excepciones:
+            ValueError: Si el formato del directorio no es COMPACT_FORMAT.
+        """
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('format_version') != COMPACT_FORMAT:
+            raise ValueError(f"Formato compacto no soportado: {meta.get('format_version')}")
+        arrays = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+                  for name in cls.ARRAYS}
+        return cls(**arrays, classes=meta['classes'], max_depth=meta['max_depth'],
+                   mean=meta['mean'], scale=meta['scale'])
+
+
+def export_forest(model, path, fold_scaler=False):
+    """
+    Aplana un modelo entrenado y lo guarda en disco.
+
+    Parámetros de entrada:
+        model (Pipeline): Pipeline entrenado.
+        path (str): Ruta de salida (.npz).
+        fold_scaler (bool): Integrar el StandardScaler en los umbrales.
+
+    Salida:
+        FlatForest: Bosque exportado.
+    """
+    forest = FlatForest.from_pipeline(model, fold_scaler=fold_scaler)
+    forest.save(path)
+    return forest
+
+
+def export_compact(model, path, leaf_dtype='auto'):
+    """
+    Compacta un modelo entrenado y lo guarda en el directorio path.
+
+    Parámetros de entrada:
+        model (Pipeline): Pipeline entrenado.
+        path (str): Directorio de salida.
+        leaf_dtype (str): Tipo de las hojas ('auto', 'uint8' o 'float16').
+
+    Salida:
+        CompactForest: Bosque exportado.
+    """
+    forest = CompactForest.from_pipeline(model, leaf_dtype=leaf_dtype)
+    forest.save(path)
+    return forest
+
+
+def compare_with_pipeline(forest, model, X):
+    """
+    Diferencias entre un bosque exportado y el pipeline original.
+
+    Parámetros de entrada:
+        forest (FlatForest | CompactForest): Bosque exportado.
+        model (Pipeline): Pipeline original.
+        X (ndarray): Matriz (n, 8) de features del modelo.
+
+    Salida:
+        dict: Error máximo de probabilidad, predicciones distintas y acuerdo top-1.
+    """
+    expected = model.predict_proba(X)
+    proba = forest.predict_proba(X)
+    mismatches = int((proba.argmax(axis=1) != expected.argmax(axis=1)).sum())
+    return {
+        'max_abs_error': float(np.abs(proba - expected).max()),
+        'mismatches': mismatches,
+        'agreement': 1.0 - mismatches / len(X),
+    }
+
+
+def check_against_pipeline(forest, model, X, tolerance=1e-9):
+    """
+    Comprueba que el bosque exportado reproduce el pipeline original.
+
+    Parámetros de entrada:
+        forest (FlatForest | CompactForest): Bosque exportado.
+        model (Pipeline): Pipeline original.
+        X (ndarray): Matriz (n, 8) de features del modelo.
+        tolerance (float): Diferencia máxima admitida en probabilidades.
+
+    Salida:
+        dict: Igual que compare_with_pipeline.
+
+    Excepciones:
+        AssertionError: Si las probabilidades o las predicciones no coinciden.
+    """
+    result = compare_with_pipeline(forest, model, X)
+    assert result['max_abs_error'] <= tolerance and result['mismatches'] == 0, result
+    return result
+
+
+def main():
+    import joblib
+
+    parser = argparse.ArgumentParser(description='Exporta el RandomForest a arrays planos')
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--out', default=None,
+                        help='Ruta de salida (.npz, o directorio con --compact)')
+    parser.add_argument('--fold-scaler', action='store_true',
+                        help='Integrar el StandardScaler en los umbrales')
+    parser.add_argument('--compact', action='store_true',
+                        help='Formato compacto: int8/float32/int32 y hojas uint8 o float16')
+    parser.add_argument('--leaf-dtype', choices=['auto', 'uint8', 'float16'], default='auto')
+    parser.add_argument('--check', metavar='CSV',
+                        help='CSV con N, P, K, ... para verificar contra el pipeline')
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    if args.compact:
+        out = args.out or MODEL_PATH.replace('.joblib', '_compact')
+        forest = export_compact(model, out, leaf_dtype=args.leaf_dtype)
+        print(f"✅ {forest.n_trees} árboles, {len(forest.feature):,} nodos, "
+              f"{len(forest.leaf_values):,} hojas {forest.leaf_values.dtype}: "
+              f"{forest.nbytes() / 2**20:.2f} MB → {out}")
+    else:
+        out = args.out or MODEL_PATH.replace('.joblib', '_flat.npz')
+        forest = export_forest(model, out, fold_scaler=args.fold_scaler)
+        print(f"✅ {forest.n_trees} árboles, {len(forest.feature):,} nodos, "
+              f"profundidad máx. {forest.max_depth}, escalador plegado: {forest.folded} → {out}")
+
+    if args.check:
+        import pandas as pd
+        from croprec.features import build_features
+
+        result = compare_with_pipeline(forest, model, build_features(pd.read_csv(args.check)))
+        print(f"{'✅' if result['mismatches'] == 0 else '⚠️'} Frente al pipeline: error máximo "
+              f"{result['max_abs_error']:.2e}, {result['mismatches']} predicciones distintas "
+              f"(acuerdo {result['agreement']:.2%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+"""
+Frontera de Pareto entre accuracy y latencia de inferencia del RandomForest.
+
+El notebook elige RandomForest(n_estimators=200, max_depth=None) sin probar
+configuraciones más baratas. Este módulo entrena variantes con profundidad
+limitada y con poda de coste-complejidad (ccp_alpha), ordena los árboles de
+cada bosque por selección voraz sobre un conjunto de validación (se añade en
+cada paso el árbol que más reduce el error cuadrático de las probabilidades
+promediadas) y trunca cada bosque a sus K mejores árboles. Para cada
+candidato mide accuracy y F1 macro en el split de test del notebook y la
+latencia de predict_proba para una fila y para un lote, y marca los puntos
+no dominados.
+
+El conjunto de validación sale del split de entrenamiento (no se toca el de
+test), así que los candidatos se entrenan con el 75% de él. Un candidato
+elegido se exporta tal como se midió, con n_jobs=1 (lo más rápido para una
+fila), y opcionalmente se registra en croprec.registry.
+
+Uso:
+    python -m croprec.frontier [--depths 6 8 10 12 16] [--ccp-alphas 0.001 0.003 0.01] \\
+                               [--tree-counts 5 10 20 50 100 200] [--report reports/frontier.csv]
+    python -m croprec.frontier --max-latency-ms 5 --out models/crop_recommender_rf_fast.joblib --register
+"""
+
+# >> Imports <<
+import argparse
+import copy
+import os
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+
+from croprec.model import PROJECT_ROOT, ENCODER_PATH
+from croprec.train import RANDOM_STATE, DATA_PATH, RF_PARAMS, build_pipeline, load_dataset, split_dataset
+
+# >> Rejilla por defecto <<
+DEPTHS = (6, 8, 10, 12, 16)
+CCP_ALPHAS = (0.001, 0.003, 0.01)
+TREE_COUNTS = (5, 10, 20, 30, 50, 100, 200)
+VALIDATION_SIZE = 0.25
+
+# >> Medición de latencia <<
+SINGLE_REPEATS = 50
+BATCH_ROWS = 10000
+BATCH_REPEATS = 3
+
+
+def base_configs(depths=DEPTHS, ccp_alphas=CCP_ALPHAS):
+    """
+    Configuraciones de bosque a entrenar: la del notebook, profundidad limitada y poda ccp.
+
+    Salida:
+        dict: Nombre -> parámetros del RandomForest que sustituyen a RF_PARAMS.
+    """
+    configs = {'rf': {}}
+    configs.update({f'depth={d}': {'max_depth': d} for d in depths})
+    configs.update({f'ccp={a:g}': {'ccp_alpha': a} for a in ccp_alphas})
+    return configs
+
+
+def greedy_tree_order(clf, X_val, y_val):
+    """
+    Orden de los árboles por selección voraz sobre validación.
+
+    Parámetros de entrada:
+        clf (RandomForestClassifier): Bosque entrenado.
+        X_val (ndarray): Validación ya escalada (float32, como la ve cada árbol).
+        y_val (ndarray): Etiquetas codificadas de validación.
+
+    Variables de proceso:
+        probas: (árboles, filas, clases) probabilidades de cada árbol.
+        running: Suma de las probabilidades de los árboles ya elegidos.
+
+    Salida:
+        ndarray: Índices de clf.estimators_ del mejor al peor.
+    """
+    probas = np.stack([tree.predict_proba(X_val) for tree in clf.estimators_])
+    target = np.eye(clf.n_classes_)[np.searchsorted(clf.classes_, y_val)]
+    running = np.zeros_like(target)
+    remaining = list(range(len(probas)))
+    order = []
+    for k in range(1, len(probas) + 1):
+        # >> error cuadrático (Brier) del promedio con cada candidato añadido <<
+        candidates = (running[None] + probas[remaining]) / k
+        errors = ((candidates - target[None]) ** 2).sum(axis=(1, 2))
+        best = remaining.pop(int(np.argmin(errors)))
+        running += probas[best]
+        order.append(best)
+    return np.array(order)
+
+
+def truncate(pipeline, order, n_trees):
+    """
+    Pipeline con solo los n_trees primeros árboles de order (sin copiar los árboles).
+    """
+    scaler, clf = pipeline.steps[0][1], pipeline.steps[-1][1]
+    small = copy.copy(clf)
+    small.estimators_ = [clf.estimators_[i] for i in order[:n_trees]]
+    small.n_estimators = len(small.estimators_)
+    small.n_jobs = 1
+    return Pipeline([('scaler', scaler), ('clf', small)])
+
+
+def measure_latency(model, X, single_repeats=SINGLE_REPEATS, batch_repeats=BATCH_REPEATS):
+    """
+    Mediana de la latencia de predict_proba para una fila y para el lote completo.
+
+    Salida:
+        tuple: (ms por fila, ms por lote).
+    """
+    singles = []
+    for i in range(single_repeats):
+        row = X[i % len(X):i % len(X) + 1]
+        t0 = time.perf_counter()
+        model.predict_proba(row)
+        singles.append(time.perf_counter() - t0)
+    batches = []
+    for _ in range(batch_repeats):
+        t0 = time.perf_counter()
+        model.predict_proba(X)
+        batches.append(time.perf_counter() - t0)
+    return float(np.median(singles)) * 1000, float(np.median(batches)) * 1000
+
+
+def pareto_mask(df, maximize='accuracy', minimize=('single_ms', 'batch_ms')):
+    """
+    Filas no dominadas: ninguna otra es igual o mejor en todo y estrictamente mejor en algo.
+    """
+    values = np.column_stack([-df[maximize].to_numpy()] + [df[c].to_numpy() for c in minimize])
+    no_worse = (values[:, None, :] <= values[None, :, :]).all(axis=2)
+    better = (values[:, None, :] < values[None, :, :]).any(axis=2)
+    dominated = (no_worse & better).any(axis=0)
+    return ~dominated
+
+
+def run_frontier(df, depths=DEPTHS, ccp_alphas=CCP_ALPHAS, tree_counts=TREE_COUNTS,
+                 batch_rows=BATCH_ROWS, random_state=RANDOM_STATE, verbose=True):
+    """
+    Entrena las configuraciones, trunca cada bosque y mide todos los candidatos.
+
+    Parámetros de entrada:
+        df (DataFrame): Dataset con FEATURES + label.
+        depths, ccp_alphas (sequence): Variantes de profundidad y de poda.
+        tree_counts (sequence): Valores de K (árboles conservados).
+        batch_rows (int): Filas del lote de latencia (remuestreadas del test).
+        random_state (int): Semilla de splits y bosques.
+        verbose (bool): Imprimir el progreso por configuración.
+
+    Variables de proceso:
+        X_fit, X_val: Partición del split de entrenamiento para ajustar y ordenar árboles.
+
+    Salida:
+        tuple: (DataFrame de candidatos con columna pareto, dict nombre -> Pipeline).
+    """
+    X_train, X_test, y_train, y_test, _ = split_dataset(df, random_state)
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, y_train, test_size=VALIDATION_SIZE, stratify=y_train, random_state=random_state)
+    X_test = X_test.to_numpy()
+    X_batch = X_test[np.random.default_rng(random_state).integers(0, len(X_test), batch_rows)]
+
+    rows, models = [], {}
+    for config, params in base_configs(depths, ccp_alphas).items():
+        t0 = time.perf_counter()
+        pipeline = build_pipeline(n_jobs=-1, random_state=random_state, **params).fit(X_fit, y_fit)
+        X_val_scaled = pipeline.steps[0][1].transform(X_val).astype(np.float32)
+        order = greedy_tree_order(pipeline.steps[-1][1], X_val_scaled, y_val)
+        for k in sorted({min(k, len(order)) for k in tree_counts}):
+            name = f'{config},K={k}'
+            model = truncate(pipeline, order, k)
+            y_pred = model.predict(X_test)
+            single_ms, batch_ms = measure_latency(model, X_batch)
+            rows.append({
+                'name': name, 'config': config, 'n_trees': k,
+                'max_depth': params.get('max_depth', RF_PARAMS['max_depth']),
+                'ccp_alpha': params.get('ccp_alpha', 0.0),
+                'nodes': int(sum(t.tree_.node_count for t in model.steps[-1][1].estimators_)),
+                'accuracy': float(accuracy_score(y_test, y_pred)),
+                'f1_macro': float(f1_score(y_test, y_pred, average='macro')),
+                'single_ms': single_ms, 'batch_ms': batch_ms,
+            })
+            models[name] = model
+        if verbose:
+            print(f"  {config:<12} ajuste + orden + {len(tree_counts)} K en {time.perf_counter() - t0:.1f}s")
+
+    result = pd.DataFrame(rows)
+    result['pareto'] = pareto_mask(result)
+    return result.sort_values('single_ms').reset_index(drop=True), models
+
+
+def pick(frontier, name=None, max_latency_ms=None):
+    """
+    Candidato a exportar: por nombre o el más preciso de la frontera bajo una latencia por fila.
+
+    Excepciones:
+        ValueError: Si el nombre no existe o ningún punto cumple la latencia.
+
+    Salida:
+        Series: Fila del candidato elegido.
+    """
+    if name is not None:
+        match = frontier[frontier['name'] == name]
+        if match.empty:
+            raise ValueError(f'Candidato desconocido: {name}')
+        return match.iloc[0]
+    eligible = frontier[frontier['pareto'] & (frontier['single_ms'] <= max_latency_ms)]
+    if eligible.empty:
+        raise ValueError(f'Ningún punto de la frontera baja de {max_latency_ms} ms por fila')
+    return eligible.sort_values(['accuracy', 'single_ms'], ascending=[False, True]).iloc[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Frontera accuracy/latencia del RandomForest')
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--depths', type=int, nargs='*', default=list(DEPTHS))
+    parser.add_argument('--ccp-alphas', type=float, nargs='*', default=list(CCP_ALPHAS))
+    parser.add_argument('--tree-counts', type=int, nargs='*', default=list(TREE_COUNTS))
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS)
+    parser.add_argument('--report', default=None, help='CSV con todos los candidatos')
+    parser.add_argument('--all', action='store_true', help='Mostrar también los puntos dominados')
+    parser.add_argument('--export', default=None, metavar='NOMBRE', help='Candidato a exportar')
+    parser.add_argument('--max-latency-ms', type=float, default=None,
+                        help='Exportar el punto más preciso de la frontera bajo esta latencia por fila')
+    parser.add_argument('--out', default=None, help='Ruta del pipeline exportado (.joblib)')
+    parser.add_argument('--register', action='store_true', help='Registrar el export en croprec.registry')
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    print("🔬 Entrenando y midiendo candidatos:")
+    frontier, models = run_frontier(load_dataset(args.data), args.depths, args.ccp_alphas,
+                                    args.tree_counts, args.batch_rows)
+    shown = frontier if args.all else frontier[frontier['pareto']]
+    print(f"\n📈 {'Candidatos' if args.all else 'Frontera de Pareto'} "
+          f"(latencia de predict_proba con n_jobs=1, lote de {args.batch_rows:,} filas):")
+    print("=" * 100)
+    print(shown[['name', 'nodes', 'accuracy', 'f1_macro', 'single_ms', 'batch_ms', 'pareto']]
+          .to_string(index=False, float_format=lambda v: f'{v:.4f}'))
+    if args.report:
+        frontier.to_csv(args.report, index=False)
+        print(f"\n✅ {len(frontier)} candidatos → {args.report}")
+
+    if args.export or args.max_latency_ms is not None:
+        chosen = pick(frontier, args.export, args.max_latency_ms)
+        out = args.out or os.path.join(PROJECT_ROOT, 'models',
+                                       f"crop_recommender_rf_{chosen['config'].replace('=', '')}"
+                                       f"_k{chosen['n_trees']}.joblib")
+        joblib.dump(models[chosen['name']], out)
+        print(f"\n✅ {chosen['name']}: accuracy {chosen['accuracy']:.4f}, {chosen['single_ms']:.2f} ms/fila "
+              f"→ {out}")
+        if args.register:
+            from croprec.registry import register_model
+            metrics = {k: float(chosen[k]) for k in ('accuracy', 'f1_macro', 'single_ms', 'batch_ms')}
+            params = {'config': chosen['config'], 'n_trees': int(chosen['n_trees']),
+                      'max_depth': None if pd.isna(chosen['max_depth']) else int(chosen['max_depth']),
+                      'ccp_alpha': float(chosen['ccp_alpha'])}
+            entry = register_model(out, ENCODER_PATH, metrics, params, activate=False)
+            print(f"✅ Registrado como {entry['version']} (activar con "
+                  f"`python -m croprec.registry activate {entry['version']}`)")
+
+
+if __name__ == '__main__':
+    main()
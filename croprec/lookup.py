@@ -0,0 +1,256 @@
+"""
+Tabla precalculada de recomendaciones sobre la rejilla de los sliders.
+
+Los dominios de los sliders de la página de predicción están acotados, así
+que un paso offline evalúa el modelo sobre una rejilla configurable de ese
+espacio y guarda, por celda, los ids de los top-5 cultivos (uint8) y sus
+probabilidades (float16) en ficheros .npy mapeados en memoria. El modo
+lookup responde en O(1) con el punto de rejilla más cercano, sin tocar el
+bosque. El build reporta la tasa de desacuerdo frente al modelo exacto sobre
+las filas del dataset para poder elegir la resolución.
+
+Uso:
+    python -m croprec.lookup --points 8 --axis-points rainfall=15 --out models/lookup
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from croprec.features import RAW_FEATURES, build_features
+from croprec.model import PROJECT_ROOT, MODEL_PATH, ENCODER_PATH, load_model
+from croprec.predict import top_k_indices
+
+# >> Dominio de cada slider de la página de predicción <<
+SLIDER_DOMAIN = {
+    'N': (0, 140), 'P': (5, 145), 'K': (5, 205), 'temperature': (8.0, 44.0),
+    'humidity': (14, 99), 'ph': (3.5, 9.9), 'rainfall': (20, 300),
+}
+
+# >> Puntos por eje por defecto (8^7 ≈ 2.1M celdas) <<
+DEFAULT_POINTS = 8
+
+LOOKUP_DIR = os.path.join(PROJECT_ROOT, 'models', 'lookup')
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'Crop_recommendation.csv')
+
+
+def grid_axes(points=DEFAULT_POINTS, domain=SLIDER_DOMAIN):
+    """
+    Ejes de la rejilla para cada variable de entrada.
+
+    Parámetros de entrada:
+        points (int | dict): Puntos por eje, común o por variable.
+        domain (dict): Rango (mínimo, máximo) de cada variable.
+
+    Salida:
+        list: Un array de puntos equiespaciados por variable, en el orden de RAW_FEATURES.
+    """
+    if isinstance(points, int):
+        points = {}.fromkeys(RAW_FEATURES, points)
+    return [np.linspace(*domain[col], max(2, points.get(col, DEFAULT_POINTS)))
+            for col in RAW_FEATURES]
+
+
+def build_lookup_table(model, le, out_dir=LOOKUP_DIR, points=DEFAULT_POINTS,
+                       top_k=5, block_rows=65536, model_hash=None):
+    """
+    Evalúa el modelo sobre toda la rejilla y guarda la tabla en disco.
+
+    Parámetros de entrada:
+        model: Estimador con predict_proba y classes_ (pipeline o FlatForest).
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+        out_dir (str): Directorio de salida.
+        points (int | dict): Puntos por eje.
+        top_k (int): Cultivos guardados por celda.
+        block_rows (int): Celdas evaluadas por llamada al modelo.
+        model_hash (str | None): Hash del modelo origen, para detectar tablas obsoletas.
+
+    Variables de proceso:
+        top_ids, top_proba: Arrays .npy abiertos como memmap de escritura.
+
+    Salida:
+        LookupTable: Tabla recién construida.
+    """
+    axes = grid_axes(points)
+    shape = tuple(len(axis) for axis in axes)
+    n_cells = int(np.prod(shape))
+    top_k = min(top_k, len(le.classes_))
+    os.makedirs(out_dir, exist_ok=True)
+
+    top_ids = np.lib.format.open_memmap(
+        os.path.join(out_dir, 'top_ids.npy'), mode='w+', dtype=np.uint8, shape=shape + (top_k,))
+    top_proba = np.lib.format.open_memmap(
+        os.path.join(out_dir, 'top_proba.npy'), mode='w+', dtype=np.float16, shape=shape + (top_k,))
+    ids_flat = top_ids.reshape(n_cells, top_k)
+    proba_flat = top_proba.reshape(n_cells, top_k)
+    classes = np.asarray(model.classes_)
+
+    # >> evaluación por bloques de celdas <<
+    for start in range(0, n_cells, block_rows):
+        stop = min(n_cells, start + block_rows)
+        coords = np.unravel_index(np.arange(start, stop), shape)
+        raw = np.column_stack([axis[c] for axis, c in zip(axes, coords)])
+        idx, proba = top_k_indices(model.predict_proba(build_features(raw)), top_k)
+        ids_flat[start:stop] = classes[idx]
+        proba_flat[start:stop] = proba
+    top_ids.flush()
+    top_proba.flush()
+    del top_ids, top_proba, ids_flat, proba_flat
+
+    meta = {
+        'features': RAW_FEATURES,
+        'axes': [[float(a[0]), float(a[-1]), len(a)] for a in axes],
+        'classes': [str(c) for c in le.classes_],
+        'top_k': top_k,
+        'model_hash': model_hash,
+    }
+    with open(os.path.join(out_dir, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+    return LookupTable(out_dir)
+
+
+class LookupTable:
+    """
+    Tabla de recomendaciones mapeada en memoria con consultas O(1).
+
+    Parámetros de entrada:
+        path (str): Directorio con meta.json, top_ids.npy y top_proba.npy.
+
+    Variables de proceso:
+        lo, step, n_points: Geometría de la rejilla por variable.
+        top_ids, top_proba: Arrays memmap de solo lectura.
+    """
+
+    def __init__(self, path=LOOKUP_DIR):
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        axes = np.array(self.meta['axes'], dtype=np.float64)
+        self.lo = axes[:, 0]
+        self.n_points = axes[:, 2].astype(np.int64)
+        self.step = (axes[:, 1] - axes[:, 0]) / (self.n_points - 1)
+        self.classes = np.array(self.meta['classes'])
+        self.model_hash = self.meta.get('model_hash')
+        self.top_ids = np.load(os.path.join(path, 'top_ids.npy'), mmap_mode='r')
+        self.top_proba = np.load(os.path.join(path, 'top_proba.npy'), mmap_mode='r')
+
+    @property
+    def n_cells(self):
+        return int(np.prod(self.n_points))
+
+    def cell_index(self, X):
+        """
+        Celda más cercana de la rejilla para cada fila (los valores fuera de rango se recortan).
+
+        Parámetros de entrada:
+            X (DataFrame | array-like): Filas con N, P, K, temperature, humidity, ph, rainfall.
+
+        Salida:
+            tuple: Un array de índices por eje, listo para indexar la tabla.
+        """
+        if hasattr(X, 'columns'):
+            X = X[RAW_FEATURES].to_numpy(dtype=float)
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(RAW_FEATURES))
+        idx = np.rint((X - self.lo) / self.step).astype(np.int64)
+        np.clip(idx, 0, self.n_points - 1, out=idx)
+        return tuple(idx.T)
+
+    def lookup_batch(self, X):
+        """
+        Equivalente a predict_crops_batch usando la tabla en vez del modelo.
+
+        Salida:
+            tuple: (cultivos (n,), top_cultivos (n, k), top_probas (n, k) en float32).
+        """
+        cells = self.cell_index(X)
+        top_crops = self.classes[self.top_ids[cells]]
+        return top_crops[:, 0], top_crops, self.top_proba[cells].astype(np.float32)
+
+    def predict_crop(self, N, P, K, temperature, humidity, ph, rainfall):
+        """
+        Equivalente a predict_crop usando la tabla en vez del modelo.
+
+        Salida:
+            tuple: (cultivo, dict {cultivo: probabilidad} con el top-k).
+        """
+        crops, top_crops, top_proba = self.lookup_batch(
+            [[N, P, K, temperature, humidity, ph, rainfall]]
+        )
+        return crops[0], dict(zip(top_crops[0], top_proba[0].astype(float)))
+
+
+def disagreement_report(table, model, le, df):
+    """
+    Compara la tabla con el modelo exacto sobre filas reales.
+
+    Parámetros de entrada:
+        table (LookupTable): Tabla a evaluar.
+        model: Estimador exacto con predict_proba y classes_.
+        le (LabelEncoder): Codificador de etiquetas.
+        df (DataFrame): Filas con las variables de entrada (p. ej. el dataset).
+
+    Salida:
+        dict: Tasa de desacuerdo del cultivo top-1 y error medio de su confianza.
+    """
+    from croprec.predict import predict_crops_batch
+
+    exact, _, exact_proba = predict_crops_batch(df, model, le)
+    approx, _, approx_proba = table.lookup_batch(df)
+    return {
+        'rows': int(len(exact)),
+        'disagreement_rate': float((exact != approx).mean()),
+        'confidence_mae': float(np.abs(exact_proba[:, 0] - approx_proba[:, 0]).mean()),
+    }
+
+
+def _parse_axis_points(items):
+    """
+    Convierte ['rainfall=15', 'ph=12'] en {'rainfall': 15, 'ph': 12}.
+    """
+    points = {}
+    for item in items:
+        name, _, value = item.partition('=')
+        if name not in SLIDER_DOMAIN or not value.isdigit():
+            raise argparse.ArgumentTypeError(f'Eje inválido: {item!r}')
+        points[name] = int(value)
+    return points
+
+
+def main():
+    import pandas as pd
+    from croprec.cache import file_sha256
+    from croprec.forest import FlatForest
+
+    parser = argparse.ArgumentParser(description='Construye la tabla precalculada de recomendaciones')
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--encoder', default=ENCODER_PATH)
+    parser.add_argument('--out', default=LOOKUP_DIR)
+    parser.add_argument('--points', type=int, default=DEFAULT_POINTS, help='Puntos por eje')
+    parser.add_argument('--axis-points', nargs='*', default=[], metavar='VAR=N',
+                        help='Puntos para ejes concretos, p. ej. rainfall=15')
+    parser.add_argument('--data', default=DATA_PATH, help='CSV para medir el desacuerdo')
+    args = parser.parse_args()
+
+    points = {}.fromkeys(RAW_FEATURES, args.points)
+    points.update(_parse_axis_points(args.axis_points))
+
+    pipeline, le = load_model(args.model, args.encoder)
+    forest = FlatForest.from_pipeline(pipeline, fold_scaler=True)
+
+    t0 = time.perf_counter()
+    table = build_lookup_table(forest, le, args.out, points, model_hash=file_sha256(args.model))
+    elapsed = time.perf_counter() - t0
+    size_mb = sum(os.path.getsize(os.path.join(args.out, f)) for f in os.listdir(args.out)) / 2**20
+
+    report = disagreement_report(table, forest, le, pd.read_csv(args.data))
+    print(f"✅ Rejilla {' × '.join(map(str, table.n_points))} = {table.n_cells:,} celdas "
+          f"en {elapsed:.1f}s, {size_mb:.1f} MB → {args.out}")
+    print(f"Desacuerdo top-1 frente al modelo exacto: {report['disagreement_rate']:.2%} "
+          f"({report['rows']:,} filas), error medio de confianza {report['confidence_mae']:.3f}")
+
+
+if __name__ == '__main__':
+    main()
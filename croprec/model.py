@@ -0,0 +1,28 @@
+"""
+Carga de los artefactos del modelo (pipeline y codificador de etiquetas).
+"""
+
+# >> Imports <<
+import os
+import joblib
+
+# >> Rutas por defecto relativas a la raíz del proyecto <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_PATH = os.path.join(PROJECT_ROOT, 'models', 'crop_recommender_rf.joblib')
+ENCODER_PATH = os.path.join(PROJECT_ROOT, 'models', 'label_encoder.joblib')
+
+
+def load_model(model_path=MODEL_PATH, encoder_path=ENCODER_PATH):
+    """
+    Carga el pipeline entrenado y el codificador de etiquetas.
+    
+    Parámetros de entrada:
+        model_path (str): Ruta al pipeline serializado con joblib.
+        encoder_path (str): Ruta al LabelEncoder serializado con joblib.
+    
+    Salida:
+        tuple: (pipeline, le).
+    """
+    pipeline = joblib.load(model_path)
+    le = joblib.load(encoder_path)
+    return pipeline, le
@@ -0,0 +1,72 @@
+"""
+Figuras de la página de EDA construidas a partir de los agregados.
+
+Sustituyen a px.histogram(df, marginal='box') y px.violin(df), que envían
+al navegador todas las filas del dataset: el histograma usa los conteos ya
+agrupados, el boxplot los cuantiles calculados en el servidor y el violín
+una muestra estratificada proporcional al tamaño de cada cultivo, de modo que el tamaño de la figura
+no depende del número de filas. Requiere plotly (solo lo importa la app).
+"""
+
+# >> Imports <<
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+
+def histogram_box_figure(hist, box, var, color='#2ecc71'):
+    """
+    Histograma con boxplot marginal a partir de datos agregados.
+
+    Parámetros de entrada:
+        hist (dict): counts y edges de croprec.eda.histogram.
+        box (dict): Cuantiles de croprec.eda.box_stats.
+        var (str): Nombre de la variable.
+        color (str): Color de las barras y de la caja.
+
+    Salida:
+        go.Figure: Figura con la caja arriba y las barras abajo, como marginal='box'.
+    """
+    edges = hist['edges']
+    centers = [(a + b) / 2 for a, b in zip(edges[:-1], edges[1:])]
+    widths = [b - a for a, b in zip(edges[:-1], edges[1:])]
+
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.2, 0.8],
+                        vertical_spacing=0.02)
+    fig.add_trace(go.Box(
+        q1=[box['q1']], median=[box['median']], q3=[box['q3']], mean=[box['mean']],
+        lowerfence=[box['lowerfence']], upperfence=[box['upperfence']], y=[var],
+        orientation='h', marker_color=color, name=var, showlegend=False, hoverinfo='x',
+    ), row=1, col=1)
+    if box['outliers']:
+        fig.add_trace(go.Scatter(
+            x=box['outliers'], y=[var] * len(box['outliers']), mode='markers',
+            marker=dict(color=color, size=4), name='outliers', showlegend=False,
+        ), row=1, col=1)
+    fig.add_trace(go.Bar(
+        x=centers, y=hist['counts'], width=widths, marker_color=color,
+        name=var, showlegend=False,
+    ), row=2, col=1)
+    fig.update_yaxes(showticklabels=False, row=1, col=1)
+    fig.update_yaxes(title_text='count', row=2, col=1)
+    fig.update_xaxes(title_text=var, row=2, col=1)
+    fig.update_layout(bargap=0)
+    return fig
+
+
+def violin_figure(sample, var, color='#3498db'):
+    """
+    Violín con boxplot a partir de la muestra estratificada proporcional.
+
+    Parámetros de entrada:
+        sample (DataFrame): Muestra de croprec.eda.stratified_sample con
+            proportional=True (un cupo igual por cultivo deformaría la distribución).
+        var (str): Nombre de la variable.
+        color (str): Color del violín.
+
+    Salida:
+        go.Figure: Figura equivalente a px.violin(df, y=var, box=True).
+    """
+    fig = go.Figure(go.Violin(y=sample[var], box_visible=True, line_color=color,
+                              fillcolor=color, opacity=0.6, name=var, showlegend=False))
+    fig.update_yaxes(title_text=var)
+    return fig
@@ -0,0 +1,78 @@
+"""
+Predicción de cultivos individual y por lotes.
+"""
+
+# >> Imports <<
+import numpy as np
+
+from croprec.features import build_features
+
+
+def top_k_indices(proba, top_k=5):
+    """
+    Obtiene los índices de las k clases más probables de cada fila.
+    
+    Parámetros de entrada:
+        proba (ndarray): Matriz (n, n_clases) de probabilidades.
+        top_k (int): Número de clases a devolver.
+    
+    Variables de proceso:
+        top_idx: Candidatos seleccionados con np.argpartition (sin ordenar todas las clases).
+    
+    Salida:
+        tuple: (top_idx (n, k), top_proba (n, k)) ordenados de mayor a menor,
+        con los empates resueltos por índice igual que argmax.
+    """
+    k = min(top_k, proba.shape[1])
+    top_idx = np.argpartition(proba, proba.shape[1] - k, axis=1)[:, -k:]
+    top_idx.sort(axis=1)
+    top_proba = np.take_along_axis(proba, top_idx, axis=1)
+    order = np.argsort(-top_proba, axis=1, kind='stable')
+    top_idx = np.take_along_axis(top_idx, order, axis=1)
+    top_proba = np.take_along_axis(top_proba, order, axis=1)
+    return top_idx, top_proba
+
+
+def predict_crops_batch(X, pipeline, le, top_k=5):
+    """
+    Predice el cultivo recomendado para muchas parcelas en una sola pasada.
+    
+    Parámetros de entrada:
+        X (DataFrame | array-like): Filas con N, P, K, temperature, humidity, ph, rainfall.
+        pipeline (Pipeline): Pipeline entrenado (scaler + clasificador).
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+        top_k (int): Número de cultivos alternativos a devolver por fila.
+    
+    Variables de proceso:
+        features: Matriz (n, 8) con N_over_PK calculado de forma vectorizada.
+        proba: Probabilidades de una única llamada a predict_proba.
+    
+    Salida:
+        tuple: (cultivos (n,), top_cultivos (n, k), top_probas (n, k)).
+    """
+    # >> una sola pasada del modelo <<
+    proba = pipeline.predict_proba(build_features(X))
+    top_idx, top_proba = top_k_indices(proba, top_k)
+    
+    # >> una única búsqueda en las clases del encoder <<
+    classes = le.classes_[pipeline.classes_]
+    top_crops = classes[top_idx]
+    return top_crops[:, 0], top_crops, top_proba
+
+
+def predict_crop(N, P, K, temperature, humidity, ph, rainfall, pipeline, le):
+    """
+    Predice el cultivo recomendado para una parcela.
+    
+    Parámetros de entrada:
+        N, P, K, temperature, humidity, ph, rainfall (float): Condiciones de la parcela.
+        pipeline (Pipeline): Pipeline entrenado.
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+    
+    Salida:
+        tuple: (cultivo, dict {cultivo: probabilidad} con el top-5).
+    """
+    crops, top_crops, top_proba = predict_crops_batch(
+        [[N, P, K, temperature, humidity, ph, rainfall]], pipeline, le
+    )
+    return crops[0], dict(zip(top_crops[0], top_proba[0]))
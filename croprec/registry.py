@@ -0,0 +1,328 @@
+"""
+Registro de versiones del modelo con artefactos direccionados por contenido.
+
+Cada versión registrada guarda en un manifiesto JSON el sha256 del pipeline
+y del codificador, la lista de variables (incluida N_over_PK), los cultivos
+y las métricas de entrenamiento. Los ficheros se copian a blobs/ con su hash
+como nombre, así que una versión no puede cambiar de contenido sin cambiar
+de dirección y registrar dos veces el mismo modelo no duplica nada.
+
+La carga pasa por una caché en proceso indexada por hash: cambiar la versión
+activa (`activate`) solo reescribe el manifiesto, y ModelRegistry lo detecta
+por su (mtime, tamaño) en la siguiente llamada, de modo que la app cambia de
+modelo sin reiniciarse y volver a una versión ya cargada es inmediato.
+
+Estructura:
+    models/registry/
+        manifest.json            versiones y versión activa
+        blobs/<sha256>.joblib    pipeline y codificador
+
+Uso:
+    python -m croprec.registry register --model models/crop_recommender_rf.joblib \\
+                                        --encoder models/label_encoder.joblib \\
+                                        [--train-manifest models/train_manifest.json]
+    python -m croprec.registry activate v1
+    python -m croprec.registry list
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+
+from croprec.cache import file_sha256
+from croprec.features import FEATURES
+from croprec.model import PROJECT_ROOT, MODEL_PATH, ENCODER_PATH, load_model
+
+# >> Ubicación y formato del registro <<
+REGISTRY_DIR = os.path.join(PROJECT_ROOT, 'models', 'registry')
+MANIFEST_FILE = 'manifest.json'
+FORMAT_VERSION = 1
+
+# >> Versiones cargadas que se mantienen en memoria (la activa y la anterior) <<
+MAX_LOADED = 2
+
+_LOADED = OrderedDict()
+_LOADED_LOCK = threading.Lock()
+
+
+def blob_path(sha256, registry_dir=REGISTRY_DIR):
+    """
+    Ruta del artefacto con hash sha256 dentro del registro.
+    """
+    return os.path.join(registry_dir, 'blobs', f'{sha256}.joblib')
+
+
+def _store_blob(path, registry_dir):
+    """
+    Copia un fichero a blobs/ bajo su sha256 (no hace nada si ya existe).
+
+    Salida:
+        str: sha256 del fichero.
+    """
+    sha256 = file_sha256(path)
+    target = blob_path(sha256, registry_dir)
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = f'{target}.{os.getpid()}.tmp'
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, target)
+    return sha256
+
+
+def read_manifest(registry_dir=REGISTRY_DIR):
+    """
+    Manifiesto del registro (vacío si todavía no existe).
+
+    Salida:
+        dict: format_version, active (str | None) y versions (list de dict).
+    """
+    path = os.path.join(registry_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {'format_version': FORMAT_VERSION, 'active': None, 'versions': []}
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Formato de registro no soportado: {manifest.get('format_version')}")
+    return manifest
+
+
+def _write_manifest(manifest, registry_dir):
+    """
+    Escribe el manifiesto de forma atómica (los lectores nunca ven un JSON a medias).
+    """
+    os.makedirs(registry_dir, exist_ok=True)
+    path = os.path.join(registry_dir, MANIFEST_FILE)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def register_model(model_path=MODEL_PATH, encoder_path=ENCODER_PATH, metrics=None, params=None,
+                   version=None, activate=True, registry_dir=REGISTRY_DIR):
+    """
+    Registra una pareja pipeline/codificador como nueva versión.
+
+    Parámetros de entrada:
+        model_path, encoder_path (str): Artefactos serializados con joblib.
+        metrics (dict | None): Métricas de entrenamiento (p. ej. las de croprec.train).
+        params (dict | None): Parámetros de entrenamiento.
+        version (str | None): Nombre de la versión (None = el primer v1, v2, ... libre).
+        activate (bool): Marcarla como versión activa.
+        registry_dir (str): Directorio del registro.
+
+    Variables de proceso:
+        features: Variables de entrada del pipeline; debe coincidir con FEATURES.
+
+    Excepciones:
+        ValueError: Si el pipeline no espera FEATURES o el nombre de versión ya existe.
+
+    Salida:
+        dict: Entrada del manifiesto (la existente si ese contenido ya estaba registrado).
+    """
+    pipeline, le = load_model(model_path, encoder_path)
+    features = [str(f) for f in getattr(pipeline, 'feature_names_in_', FEATURES)]
+    if features != FEATURES or pipeline.n_features_in_ != len(FEATURES):
+        raise ValueError(f"El pipeline espera {features}, no {FEATURES}")
+
+    manifest = read_manifest(registry_dir)
+    model_sha256 = _store_blob(model_path, registry_dir)
+    encoder_sha256 = _store_blob(encoder_path, registry_dir)
+
+    entry = next((e for e in manifest['versions']
+                  if e['model_sha256'] == model_sha256 and e['encoder_sha256'] == encoder_sha256), None)
+    if entry is None:
+        names = {e['version'] for e in manifest['versions']}
+        if version in names:
+            raise ValueError(f"La versión {version} ya existe con otro contenido")
+        if version is None:
+            # >> primer vN libre: un nombre manual (p. ej. v2) no puede repetirse <<
+            number = len(manifest['versions']) + 1
+            while f'v{number}' in names:
+                number += 1
+            version = f'v{number}'
+        entry = {
+            'version': version,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'model_sha256': model_sha256,
+            'encoder_sha256': encoder_sha256,
+            'model_size_mb': round(os.path.getsize(model_path) / 2**20, 2),
+            'features': features,
+            'classes': [str(c) for c in le.classes_],
+            'metrics': metrics or {},
+            'params': params or {},
+        }
+        manifest['versions'].append(entry)
+    if activate or manifest['active'] is None:
+        manifest['active'] = entry['version']
+    _write_manifest(manifest, registry_dir)
+    return entry
+
+
+def activate_version(version, registry_dir=REGISTRY_DIR):
+    """
+    Cambia la versión activa; los procesos que usan ModelRegistry la recogen en la siguiente carga.
+
+    Excepciones:
+        ValueError: Si la versión no está registrada.
+
+    Salida:
+        dict: Entrada activada.
+    """
+    manifest = read_manifest(registry_dir)
+    entry = _find(manifest, version)
+    manifest['active'] = version
+    _write_manifest(manifest, registry_dir)
+    return entry
+
+
+def _find(manifest, version):
+    for entry in manifest['versions']:
+        if entry['version'] == version:
+            return entry
+    raise ValueError(f"Versión no registrada: {version}")
+
+
+def load_artifacts(model_sha256, encoder_sha256, registry_dir=REGISTRY_DIR):
+    """
+    Carga (pipeline, le) por hash, compartidos en el proceso.
+
+    El primer uso de cada pareja comprueba el sha256 de los blobs; los
+    siguientes devuelven los mismos objetos sin tocar el disco.
+
+    Excepciones:
+        ValueError: Si el contenido de un blob no coincide con su hash.
+
+    Salida:
+        tuple: (pipeline, le).
+    """
+    key = (model_sha256, encoder_sha256)
+    with _LOADED_LOCK:
+        if key in _LOADED:
+            _LOADED.move_to_end(key)
+            return _LOADED[key]
+
+    for sha256 in key:
+        if file_sha256(blob_path(sha256, registry_dir)) != sha256:
+            raise ValueError(f"Blob corrupto en el registro: {sha256}")
+    artifacts = load_model(blob_path(model_sha256, registry_dir), blob_path(encoder_sha256, registry_dir))
+
+    with _LOADED_LOCK:
+        artifacts = _LOADED.setdefault(key, artifacts)
+        _LOADED.move_to_end(key)
+        while len(_LOADED) > MAX_LOADED:
+            _LOADED.popitem(last=False)
+    return artifacts
+
+
+class ModelRegistry:
+    """
+    Lector del registro que detecta cambios de versión sin reiniciar el proceso.
+
+    Parámetros de entrada:
+        registry_dir (str): Directorio del registro.
+
+    Variables de proceso:
+        _stamp: (mtime_ns, tamaño) del manifiesto; solo si cambia se vuelve a leer.
+    """
+
+    def __init__(self, registry_dir=REGISTRY_DIR):
+        self.registry_dir = registry_dir
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._manifest = None
+
+    def exists(self):
+        return os.path.exists(os.path.join(self.registry_dir, MANIFEST_FILE))
+
+    def manifest(self):
+        """
+        Manifiesto vigente, releído solo si el fichero cambió.
+        """
+        stat = os.stat(os.path.join(self.registry_dir, MANIFEST_FILE))
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if stamp != self._stamp:
+                self._manifest = read_manifest(self.registry_dir)
+                self._stamp = stamp
+            return self._manifest
+
+    def entry(self, version=None):
+        """
+        Entrada de una versión (None = la activa).
+        """
+        manifest = self.manifest()
+        return _find(manifest, version or manifest['active'])
+
+    def load(self, version=None):
+        """
+        Artefactos de una versión (None = la activa).
+
+        Salida:
+            tuple: (pipeline, le, entrada del manifiesto).
+        """
+        entry = self.entry(version)
+        pipeline, le = load_artifacts(entry['model_sha256'], entry['encoder_sha256'], self.registry_dir)
+        return pipeline, le, entry
+
+    def artifact_path(self, kind='model', version=None):
+        """
+        Ruta en disco del pipeline (kind='model') o del codificador (kind='encoder').
+        """
+        return blob_path(self.entry(version)[f'{kind}_sha256'], self.registry_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Registro de versiones del modelo')
+    parser.add_argument('--registry', default=REGISTRY_DIR)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    register = commands.add_parser('register', help='Registra un pipeline y su codificador')
+    register.add_argument('--model', default=MODEL_PATH)
+    register.add_argument('--encoder', default=ENCODER_PATH)
+    register.add_argument('--train-manifest', default=None,
+                          help='Manifiesto de croprec.train del que tomar métricas y parámetros')
+    register.add_argument('--version', default=None)
+    register.add_argument('--no-activate', action='store_true')
+
+    activate = commands.add_parser('activate', help='Cambia la versión activa')
+    activate.add_argument('version')
+
+    commands.add_parser('list', help='Lista las versiones registradas')
+    args = parser.parse_args()
+
+    if args.command == 'register':
+        if args.train_manifest:
+            with open(args.train_manifest) as f:
+                trained = json.load(f)
+            metrics, params = trained.get('metrics'), trained.get('params')
+        else:
+            # >> sin manifiesto de entrenamiento: métricas en el split de test del notebook <<
+            from croprec.train import evaluate, load_dataset, split_dataset
+            pipeline, _ = load_model(args.model, args.encoder)
+            _, X_test, _, y_test, _ = split_dataset(load_dataset())
+            metrics, params = evaluate(pipeline, X_test, y_test), None
+        entry = register_model(args.model, args.encoder, metrics, params, args.version,
+                               not args.no_activate, args.registry)
+        print(f"✅ {entry['version']}: {entry['model_sha256'][:12]} "
+              f"({len(entry['classes'])} cultivos, accuracy {entry['metrics'].get('accuracy', float('nan')):.4f})")
+    elif args.command == 'activate':
+        entry = activate_version(args.version, args.registry)
+        print(f"✅ Versión activa: {entry['version']} ({entry['model_sha256'][:12]})")
+
+    manifest = read_manifest(args.registry)
+    print(f"\n{'':2}{'Versión':<10}{'Modelo':<15}{'Accuracy':>10}{'MB':>7}  Creada")
+    for entry in manifest['versions']:
+        mark = '*' if entry['version'] == manifest['active'] else ' '
+        print(f"{mark:2}{entry['version']:<10}{entry['model_sha256'][:12]:<15}"
+              f"{entry['metrics'].get('accuracy', float('nan')):>10.4f}{entry['model_size_mb']:>7.2f}"
+              f"  {entry['created_at']}")
+
+
+if __name__ == '__main__':
+    main()
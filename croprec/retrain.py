@@ -0,0 +1,186 @@
+"""
+Reentrenamiento incremental del RandomForest con warm_start.
+
+Cuando llegan unos cientos de muestras etiquetadas nuevas, en lugar de
+reajustar los 200 árboles se añaden n árboles nuevos con warm_start y se
+retiran los n más antiguos, manteniendo el tamaño del bosque. Los árboles
+nuevos se entrenan con las muestras nuevas más una muestra estratificada de
+repaso del dataset base, para que vean todas las clases (un árbol entrenado
+sin alguna clase no sería compatible con el resto del bosque). El escalador
+del pipeline no se reajusta.
+
+Se reporta la deriva de accuracy sobre el split de test de
+Crop_recommendation.csv y, opcionalmente, el tiempo ahorrado frente a un
+reajuste completo.
+
+Uso:
+    python -m croprec.retrain --new data/nuevas_muestras.csv --n-new-trees 40 \\
+                              --out models/crop_recommender_rf.joblib --compare-full-refit
+"""
+
+# >> Imports <<
+import argparse
+import copy
+import json
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score
+
+from croprec.features import FEATURES, add_n_over_pk
+from croprec.model import MODEL_PATH, ENCODER_PATH, load_model
+from croprec.train import DATA_PATH, load_dataset, split_dataset, build_pipeline
+
+# >> Filas de repaso por defecto tomadas del dataset base <<
+REPLAY_ROWS = 500
+
+
+def replay_sample(X, y, n_rows, random_state=None):
+    """
+    Muestra estratificada del dataset base con al menos una fila por clase.
+
+    Parámetros de entrada:
+        X (DataFrame): Features del dataset base.
+        y (ndarray): Etiquetas codificadas.
+        n_rows (int): Tamaño aproximado de la muestra.
+        random_state (int | None): Semilla.
+
+    Salida:
+        tuple: (X_replay, y_replay).
+    """
+    rng = np.random.default_rng(random_state)
+    classes, counts = np.unique(y, return_counts=True)
+    per_class = np.maximum(1, np.round(counts / counts.sum() * n_rows).astype(int))
+    idx = np.concatenate([
+        rng.choice(np.flatnonzero(y == c), min(k, n), replace=False)
+        for c, k, n in zip(classes, per_class, counts)
+    ])
+    return X.iloc[idx], y[idx]
+
+
+def incremental_retrain(pipeline, le, new_df, X_base, y_base, n_new_trees=40,
+                        replay_rows=REPLAY_ROWS, random_state=None, n_jobs=None):
+    """
+    Añade árboles entrenados con datos nuevos y retira los más antiguos.
+
+    Parámetros de entrada:
+        pipeline (Pipeline): Pipeline [StandardScaler, RandomForest] entrenado (no se modifica).
+        le (LabelEncoder): Codificador de etiquetas del modelo.
+        new_df (DataFrame): Muestras nuevas con RAW_FEATURES y label.
+        X_base, y_base: Dataset base (features y etiquetas codificadas) para el repaso.
+        n_new_trees (int): Árboles a añadir y retirar.
+        replay_rows (int): Filas de repaso del dataset base.
+        random_state (int | None): Semilla de los árboles nuevos (None = aleatoria).
+        n_jobs (int | None): Núcleos para el ajuste (None = los del pipeline).
+
+    Variables de proceso:
+        clf: RandomForest copiado con warm_start=True.
+
+    Salida:
+        tuple: (pipeline nuevo, dict con tiempos y tamaños).
+
+    Excepciones:
+        ValueError: Si hay etiquetas desconocidas o faltan clases en el conjunto de ajuste.
+    """
+    if random_state is None:
+        random_state = int(np.random.SeedSequence().generate_state(1)[0])
+    new_df = new_df.copy()
+    new_df['N_over_PK'] = add_n_over_pk(new_df['N'], new_df['P'], new_df['K'])
+    unknown = set(new_df['label']) - set(le.classes_)
+    if unknown:
+        raise ValueError(f'Etiquetas desconocidas para el modelo: {sorted(unknown)}')
+
+    # >> muestras nuevas + repaso estratificado del dataset base <<
+    X_replay, y_replay = replay_sample(X_base, y_base, replay_rows, random_state)
+    X_fit = pd.concat([new_df[FEATURES], X_replay], ignore_index=True)
+    y_fit = np.concatenate([le.transform(new_df['label']), y_replay])
+    if len(np.unique(y_fit)) != len(le.classes_):
+        raise ValueError('El conjunto de ajuste no contiene todas las clases; aumenta replay_rows')
+
+    new_pipeline = copy.deepcopy(pipeline)
+    scaler, clf = new_pipeline.named_steps['scaler'], new_pipeline.named_steps['clf']
+    forest_size = len(clf.estimators_)
+
+    t0 = time.perf_counter()
+    clf.set_params(warm_start=True, n_estimators=forest_size + n_new_trees,
+                   random_state=random_state,
+                   **({} if n_jobs is None else {'n_jobs': n_jobs}))
+    clf.fit(scaler.transform(X_fit), y_fit)
+
+    # >> retirar los árboles más antiguos para mantener el tamaño del bosque <<
+    clf.estimators_ = clf.estimators_[n_new_trees:]
+    clf.set_params(warm_start=False, n_estimators=forest_size)
+    fit_time = time.perf_counter() - t0
+
+    return new_pipeline, {
+        'new_rows': int(len(new_df)), 'replay_rows': int(len(X_replay)),
+        'n_new_trees': n_new_trees, 'forest_size': forest_size,
+        'random_state': random_state, 'fit_time_s': fit_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reentrenamiento incremental con warm_start')
+    parser.add_argument('--new', required=True, help='CSV con muestras nuevas (RAW_FEATURES + label)')
+    parser.add_argument('--data', default=DATA_PATH, help='Dataset base para repaso y test')
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--encoder', default=ENCODER_PATH)
+    parser.add_argument('--out', default=None, help='Ruta del modelo reentrenado (None = no guardar)')
+    parser.add_argument('--n-new-trees', type=int, default=40)
+    parser.add_argument('--replay-rows', type=int, default=REPLAY_ROWS)
+    parser.add_argument('--random-state', type=int, default=None)
+    parser.add_argument('--n-jobs', type=int, default=None)
+    parser.add_argument('--compare-full-refit', action='store_true',
+                        help='Medir también un reajuste completo de 200 árboles')
+    parser.add_argument('--report', default=None, help='Ruta del reporte JSON')
+    args = parser.parse_args()
+
+    pipeline, le = load_model(args.model, args.encoder)
+    new_df = pd.read_csv(args.new)
+    X_train, X_test, y_train, y_test, _ = split_dataset(load_dataset(args.data))
+
+    new_pipeline, report = incremental_retrain(
+        pipeline, le, new_df, X_train, y_train, args.n_new_trees,
+        args.replay_rows, args.random_state, args.n_jobs
+    )
+
+    # >> deriva de accuracy sobre el test del dataset base <<
+    report['accuracy_before'] = float(accuracy_score(y_test, pipeline.predict(X_test)))
+    report['accuracy_after'] = float(accuracy_score(y_test, new_pipeline.predict(X_test)))
+    report['accuracy_drift'] = report['accuracy_after'] - report['accuracy_before']
+
+    if args.compare_full_refit:
+        X_full = pd.concat([X_train, new_df.assign(
+            N_over_PK=add_n_over_pk(new_df['N'], new_df['P'], new_df['K']))[FEATURES]],
+            ignore_index=True)
+        y_full = np.concatenate([y_train, le.transform(new_df['label'])])
+        full = build_pipeline(n_jobs=args.n_jobs or -1)
+        t0 = time.perf_counter()
+        full.fit(X_full, y_full)
+        report['full_refit_time_s'] = time.perf_counter() - t0
+        report['full_refit_accuracy'] = float(accuracy_score(y_test, full.predict(X_test)))
+        report['time_saved_s'] = report['full_refit_time_s'] - report['fit_time_s']
+
+    if args.out:
+        joblib.dump(new_pipeline, args.out)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    print(f"✅ +{report['n_new_trees']} árboles nuevos / -{report['n_new_trees']} antiguos "
+          f"({report['new_rows']} filas nuevas + {report['replay_rows']} de repaso) "
+          f"en {report['fit_time_s']:.2f}s")
+    print(f"Accuracy test: {report['accuracy_before']:.4f} → {report['accuracy_after']:.4f} "
+          f"(deriva {report['accuracy_drift']:+.4f})")
+    if args.compare_full_refit:
+        print(f"Reajuste completo: {report['full_refit_time_s']:.2f}s "
+              f"(accuracy {report['full_refit_accuracy']:.4f}), "
+              f"ahorro {report['time_saved_s']:.2f}s")
+    if args.out:
+        print(f"✅ Modelo guardado en: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+Puntuación en streaming de CSV mayores que la memoria.
+
+Lee el fichero por bloques con un pipeline de generadores (lectura →
+predicción → escritura): cada bloque calcula N_over_PK, llama una vez al
+pipeline guardado y escribe las columnas label, confidence y top-k al
+fichero de salida (CSV o Parquet) antes de leer el siguiente, de modo que
+la memoria máxima depende del tamaño de bloque y no del fichero. Las filas
+con valores ausentes se conservan con la predicción vacía.
+
+Uso:
+    python -m croprec.score suelos.csv predicciones.parquet --chunksize 200000 --top-k 3
+"""
+
+# >> Imports <<
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from croprec.features import RAW_FEATURES
+from croprec.model import MODEL_PATH, ENCODER_PATH, load_model
+from croprec.predict import predict_crops_batch
+
+# >> pyarrow es opcional: solo se necesita para salida Parquet <<
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+CHUNKSIZE = 100_000
+
+
+def read_chunks(path, chunksize=CHUNKSIZE, keep_inputs=True):
+    """
+    Genera bloques del CSV de entrada.
+
+    Parámetros de entrada:
+        path (str): CSV con al menos las columnas de RAW_FEATURES.
+        chunksize (int): Filas por bloque.
+        keep_inputs (bool): Leer todas las columnas (para copiarlas a la salida) o solo RAW_FEATURES.
+
+    Salida:
+        generator: DataFrames de hasta chunksize filas.
+    """
+    usecols = None if keep_inputs else RAW_FEATURES
+    dtype = {}.fromkeys(RAW_FEATURES, np.float64)
+    yield from pd.read_csv(path, chunksize=chunksize, usecols=usecols, dtype=dtype)
+
+
+def score_chunks(chunks, pipeline, le, top_k=5, keep_inputs=True):
+    """
+    Añade la predicción a cada bloque (una llamada al modelo por bloque).
+
+    Parámetros de entrada:
+        chunks (iterable): DataFrames con RAW_FEATURES.
+        pipeline: Estimador con predict_proba y classes_ (pipeline o FlatForest).
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+        top_k (int): Cultivos alternativos por fila.
+        keep_inputs (bool): Copiar las columnas de entrada a la salida.
+
+    Variables de proceso:
+        valid: Filas sin valores ausentes en RAW_FEATURES (las únicas que se predicen).
+
+    Salida:
+        generator: DataFrames con label, confidence, top{i}_label y top{i}_proba.
+    """
+    for chunk in chunks:
+        missing = set(RAW_FEATURES) - set(chunk.columns)
+        if missing:
+            raise ValueError(f'Faltan columnas en la entrada: {sorted(missing)}')
+        valid = chunk[RAW_FEATURES].notna().all(axis=1).to_numpy()
+        k = min(top_k, len(le.classes_))
+        top_crops = np.full((len(chunk), k), None, dtype=object)
+        top_proba = np.full((len(chunk), k), np.nan, dtype=np.float32)
+        if valid.any():
+            _, crops, proba = predict_crops_batch(chunk.loc[valid, RAW_FEATURES], pipeline, le, k)
+            top_crops[valid] = crops
+            top_proba[valid] = proba
+
+        columns = {'label': top_crops[:, 0], 'confidence': top_proba[:, 0]}
+        for i in range(k):
+            columns[f'top{i + 1}_label'] = top_crops[:, i]
+            columns[f'top{i + 1}_proba'] = top_proba[:, i]
+        scored = pd.DataFrame(columns)
+        if keep_inputs:
+            # >> una columna label de entrada (p. ej. la etiqueta real) se conserva como label_input <<
+            inputs = chunk.reset_index(drop=True)
+            inputs.columns = [f'{c}_input' if c in columns else c for c in inputs.columns]
+            scored = pd.concat([inputs, scored], axis=1)
+        yield scored
+
+
+def write_chunks(scored, out_path):
+    """
+    Escribe los bloques puntuados de forma incremental.
+
+    Parámetros de entrada:
+        scored (iterable): DataFrames de score_chunks.
+        out_path (str): Fichero .csv (opcionalmente comprimido) o .parquet.
+
+    Salida:
+        generator: Filas escritas en cada bloque (para reportar el progreso).
+
+    Excepciones:
+        ImportError: Si la salida es Parquet y pyarrow no está instalado.
+    """
+    parquet = out_path.endswith('.parquet')
+    if parquet and pq is None:
+        raise ImportError('La salida Parquet requiere pyarrow (pip install pyarrow)')
+    writer = None
+    try:
+        for i, chunk in enumerate(scored):
+            if parquet:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    # >> un primer bloque sin predicciones daría columnas de tipo null <<
+                    schema = pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f
+                                        for f in table.schema])
+                    writer = pq.ParquetWriter(out_path, schema)
+                writer.write_table(table.cast(writer.schema))
+            else:
+                chunk.to_csv(out_path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+            yield len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def score_file(in_path, out_path, pipeline, le, chunksize=CHUNKSIZE, top_k=5,
+               keep_inputs=True, progress=None):
+    """
+    Puntúa un CSV completo bloque a bloque.
+
+    Parámetros de entrada:
+        in_path, out_path (str): Ficheros de entrada y salida.
+        pipeline, le: Modelo y codificador de etiquetas.
+        chunksize (int): Filas por bloque.
+        top_k (int): Cultivos alternativos por fila.
+        keep_inputs (bool): Copiar las columnas de entrada a la salida.
+        progress (callable | None): progress(filas, segundos) tras cada bloque.
+
+    Salida:
+        dict: Filas, bloques, segundos y filas por segundo.
+    """
+    t0 = time.perf_counter()
+    rows = n_chunks = 0
+    chunks = read_chunks(in_path, chunksize, keep_inputs)
+    for n in write_chunks(score_chunks(chunks, pipeline, le, top_k, keep_inputs), out_path):
+        rows += n
+        n_chunks += 1
+        if progress is not None:
+            progress(rows, time.perf_counter() - t0)
+    elapsed = time.perf_counter() - t0
+    return {'rows': rows, 'chunks': n_chunks, 'elapsed_s': elapsed,
+            'rows_per_s': rows / elapsed if elapsed else 0.0}
+
+
+def print_progress():
+    """
+    Callback de progreso que escribe filas y filas/s en stderr.
+    """
+    def progress(rows, elapsed):
+        sys.stderr.write(f'\r{rows:,} filas · {rows / max(elapsed, 1e-9):,.0f} filas/s · {elapsed:.1f}s')
+        sys.stderr.flush()
+    return progress
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Puntúa un CSV grande por bloques')
+    parser.add_argument('input', help='CSV con N, P, K, temperature, humidity, ph, rainfall')
+    parser.add_argument('output', help='Salida .csv (o .csv.gz) o .parquet')
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--encoder', default=ENCODER_PATH)
+    parser.add_argument('--forest', default=None, help='Bosque aplanado .npz (croprec.forest) en vez del pipeline')
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--no-inputs', action='store_true', help='No copiar las columnas de entrada')
+    args = parser.parse_args()
+
+    pipeline, le = load_model(args.model, args.encoder)
+    if args.forest:
+        from croprec.forest import FlatForest
+        pipeline = FlatForest.load(args.forest)
+
+    report = score_file(args.input, args.output, pipeline, le, args.chunksize, args.top_k,
+                        not args.no_inputs, print_progress())
+    sys.stderr.write('\n')
+    print(f"✅ {report['rows']:,} filas en {report['chunks']} bloques, {report['elapsed_s']:.2f}s "
+          f"({report['rows_per_s']:,.0f} filas/s) → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
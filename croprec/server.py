@@ -0,0 +1,326 @@
+"""
+Servidor HTTP local de predicción con micro-batching.
+
+Un RandomForest de 200 árboles tiene un coste fijo alto por llamada y un coste
+bajo por fila, así que el servidor agrupa las peticiones que llegan dentro de
+una ventana corta (o hasta un máximo de filas) y las resuelve con una única
+llamada a predict_proba, devolviendo a cada cliente su parte del resultado.
+
+Endpoints:
+    POST /predict   Cuerpo JSON con un objeto {N, P, K, temperature, humidity,
+                    ph, rainfall} o una lista de ellos.
+    GET  /health    Estado del servidor.
+    GET  /stats     Contadores de lotes y filas procesadas.
+
+Uso:
+    python -m croprec.server --port 8000 --window-ms 3 --max-rows 256
+"""
+
+# >> Imports <<
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from croprec.features import RAW_FEATURES
+from croprec.model import MODEL_PATH, ENCODER_PATH, load_model
+from croprec.predict import predict_crops_batch
+
+# >> Textos de estado HTTP usados por el servidor <<
+HTTP_STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+# >> Valor absoluto máximo admitido por variable (muy por encima de cualquier dato real);
+# valores mayores desbordan al construir N_over_PK y convertir a float32 <<
+MAX_ABS_VALUE = 1e6
+
+
+def parse_rows(payload):
+    """
+    Convierte el cuerpo JSON de una petición en una matriz de entrada.
+
+    Parámetros de entrada:
+        payload (dict | list): Objeto o lista de objetos con las variables de entrada.
+
+    Salida:
+        ndarray: Matriz (m, 7) en el orden de RAW_FEATURES.
+
+    Excepciones:
+        ValueError: Si falta alguna variable, no es numérica, no es finita
+            (json.loads acepta NaN e Infinity) o supera MAX_ABS_VALUE.
+    """
+    rows = payload if isinstance(payload, list) else [payload]
+    if not rows:
+        raise ValueError('La petición no contiene filas')
+    try:
+        X = np.array([[float(row[col]) for col in RAW_FEATURES] for row in rows])
+    except KeyError as exc:
+        raise ValueError(f'Falta la variable {exc.args[0]!r}') from None
+    except (TypeError, ValueError):
+        raise ValueError(f'Cada fila debe ser un objeto con {RAW_FEATURES} numéricos') from None
+    if not np.isfinite(X).all():
+        raise ValueError('Los valores deben ser finitos (sin NaN ni Infinity)')
+    if (np.abs(X) > MAX_ABS_VALUE).any():
+        raise ValueError(f'Los valores deben estar entre -{MAX_ABS_VALUE:g} y {MAX_ABS_VALUE:g}')
+    return X
+
+
+class MicroBatcher:
+    """
+    Agrupa peticiones concurrentes en lotes para una sola llamada al modelo.
+
+    Parámetros de entrada:
+        pipeline (Pipeline): Pipeline entrenado.
+        le (LabelEncoder): Codificador de etiquetas de cultivos.
+        window_ms (float): Tiempo máximo de espera para completar un lote.
+        max_rows (int): Número de filas que cierra el lote sin esperar.
+        top_k (int): Número de cultivos alternativos por fila.
+
+    Variables de proceso:
+        queue: Cola asyncio de (filas, future) pendientes.
+        executor: Hilo dedicado donde se ejecuta predict_proba sin bloquear el bucle.
+        stats: Contadores de lotes, filas y peticiones.
+    """
+
+    def __init__(self, pipeline, le, window_ms=3.0, max_rows=256, top_k=5):
+        self.pipeline = pipeline
+        self.le = le
+        self.window = window_ms / 1000.0
+        self.max_rows = max_rows
+        self.top_k = top_k
+        self.queue = asyncio.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.stats = {'batches': 0, 'rows': 0, 'requests': 0}
+
+    async def predict(self, rows):
+        """
+        Encola las filas de una petición y espera su parte del lote.
+
+        Parámetros de entrada:
+            rows (ndarray): Matriz (m, 7) de una petición.
+
+        Salida:
+            list: Una predicción (dict) por fila.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((rows, future))
+        return await future
+
+    async def run(self):
+        """
+        Bucle principal: reúne peticiones hasta cerrar la ventana o llenar el lote.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.queue.get()]
+            n_rows = len(pending[0][0])
+            deadline = loop.time() + self.window
+
+            # >> completar el lote hasta la ventana o el máximo de filas <<
+            while n_rows < self.max_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                n_rows += len(item[0])
+
+            await self._flush(pending)
+
+    async def _flush(self, pending):
+        """
+        Ejecuta un lote en el hilo del modelo y reparte los resultados.
+
+        Si el lote falla, cada petición se repite por separado para que el
+        error solo llegue a la que lo provoca y no al resto de clientes del lote.
+
+        Parámetros de entrada:
+            pending (list): Pares (filas, future) del lote.
+        """
+        try:
+            X = np.vstack([rows for rows, _ in pending])
+            crops, top_crops, top_proba = await asyncio.get_running_loop().run_in_executor(
+                self.executor, predict_crops_batch, X, self.pipeline, self.le, self.top_k
+            )
+        except Exception as exc:
+            if len(pending) > 1:
+                for item in pending:
+                    await self._flush([item])
+                return
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.stats['batches'] += 1
+        self.stats['rows'] += len(X)
+        self.stats['requests'] += len(pending)
+
+        # >> repartir los resultados por petición <<
+        start = 0
+        for rows, future in pending:
+            end = start + len(rows)
+            if not future.done():
+                future.set_result([
+                    {
+                        'crop': str(crops[i]),
+                        'confidence': float(top_proba[i, 0]),
+                        'top_crops': [
+                            {'crop': str(c), 'probability': float(p)}
+                            for c, p in zip(top_crops[i], top_proba[i])
+                        ],
+                    }
+                    for i in range(start, end)
+                ])
+            start = end
+
+
+class PredictionServer:
+    """
+    Servidor HTTP/1.1 mínimo (con keep-alive) sobre asyncio.
+
+    Parámetros de entrada:
+        batcher (MicroBatcher): Agrupador de peticiones hacia el modelo.
+    """
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+
+    async def dispatch(self, method, path, body):
+        """
+        Resuelve una petición y devuelve (código HTTP, objeto JSON).
+        """
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/stats':
+            stats = dict(self.batcher.stats)
+            stats['mean_batch_rows'] = stats['rows'] / max(stats['batches'], 1)
+            return 200, stats
+        if path != '/predict':
+            return 404, {'error': f'Ruta desconocida: {path}'}
+        if method != 'POST':
+            return 405, {'error': 'Usa POST en /predict'}
+
+        try:
+            payload = json.loads(body)
+            rows = parse_rows(payload)
+        except ValueError as exc:
+            return 400, {'error': str(exc)}
+
+        try:
+            predictions = await self.batcher.predict(rows)
+        except Exception as exc:
+            return 500, {'error': str(exc)}
+        if isinstance(payload, list):
+            return 200, {'predictions': predictions}
+        return 200, predictions[0]
+
+    @staticmethod
+    async def respond(writer, status, payload, keep_alive):
+        """
+        Escribe una respuesta JSON completa.
+        """
+        data = json.dumps(payload).encode()
+        writer.write(
+            f'HTTP/1.1 {status} {HTTP_STATUS[status]}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(data)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+            .encode('latin-1') + data
+        )
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        """
+        Atiende una conexión, procesando peticiones mientras siga abierta.
+
+        Una línea de petición o cabecera mayor que el límite del StreamReader
+        (64 KiB) o mal formada se responde con 400 y se cierra la conexión.
+        """
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    method, path, version = request_line.decode('latin-1').split()
+
+                    # >> cabeceras <<
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                    body = await reader.readexactly(int(headers.get('content-length', 0)))
+                except (asyncio.LimitOverrunError, ValueError):
+                    await self.respond(writer, 400, {'error': 'Petición HTTP mal formada o demasiado larga'},
+                                       keep_alive=False)
+                    break
+
+                status, payload = await self.dispatch(method, path, body)
+                keep_alive = (version == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host='127.0.0.1', port=8000, window_ms=3.0, max_rows=256,
+                model_path=MODEL_PATH, encoder_path=ENCODER_PATH):
+    """
+    Carga el modelo y sirve peticiones hasta que se cancele.
+
+    Parámetros de entrada:
+        host, port: Dirección de escucha.
+        window_ms (float): Ventana de micro-batching en milisegundos.
+        max_rows (int): Filas máximas por lote.
+        model_path, encoder_path (str): Rutas a los artefactos del modelo.
+    """
+    pipeline, le = load_model(model_path, encoder_path)
+    batcher = MicroBatcher(pipeline, le, window_ms=window_ms, max_rows=max_rows)
+    server = PredictionServer(batcher)
+
+    batch_task = asyncio.create_task(batcher.run())
+    tcp_server = await asyncio.start_server(server.handle, host, port)
+    print(f"✅ Servidor escuchando en http://{host}:{port} "
+          f"(ventana {window_ms} ms, máx. {max_rows} filas)")
+    try:
+        async with tcp_server:
+            await tcp_server.serve_forever()
+    finally:
+        batch_task.cancel()
+        batcher.executor.shutdown(wait=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Servidor HTTP de predicción con micro-batching')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window-ms', type=float, default=3.0,
+                        help='Espera máxima para completar un lote (ms)')
+    parser.add_argument('--max-rows', type=int, default=256,
+                        help='Filas que cierran un lote sin esperar la ventana')
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--encoder', default=ENCODER_PATH)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms, args.max_rows,
+                          args.model, args.encoder))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
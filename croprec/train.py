@@ -0,0 +1,217 @@
+"""
+Entrenamiento reproducible del modelo desde línea de comandos.
+
+Reproduce los pasos de notebooks/model_training.ipynb sin Jupyter: carga del
+CSV, ingeniería de N_over_PK, LabelEncoder, split estratificado 80/20, ajuste
+del pipeline [StandardScaler, RandomForest] y guardado de los artefactos. El
+tiempo de cada etapa, los parámetros y las métricas en test quedan en un
+manifiesto JSON.
+
+Uso:
+    python -m croprec.train --data data/Crop_recommendation.csv --n-jobs -1 \\
+                            --model-out models/crop_recommender_rf.joblib \\
+                            --encoder-out models/label_encoder.joblib \\
+                            --manifest models/train_manifest.json [--register]
+"""
+
+# >> Imports <<
+import argparse
+import json
+import os
+import platform
+import time
+from contextlib import contextmanager
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from croprec.features import RAW_FEATURES, FEATURES, add_n_over_pk
+from croprec.model import PROJECT_ROOT, MODEL_PATH, ENCODER_PATH
+
+# >> Reproducibilidad y parámetros del notebook <<
+RANDOM_STATE = 42
+TEST_SIZE = 0.2
+RF_PARAMS = {'n_estimators': 200, 'max_depth': None, 'min_samples_split': 2}
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'Crop_recommendation.csv')
+MANIFEST_PATH = os.path.join(PROJECT_ROOT, 'models', 'train_manifest.json')
+
+
+def load_dataset(path=DATA_PATH):
+    """
+    Carga el CSV y añade la variable N_over_PK.
+
+    Parámetros de entrada:
+        path (str): Ruta al CSV con RAW_FEATURES y la columna label.
+
+    Salida:
+        DataFrame: Dataset con FEATURES + label.
+    """
+    df = pd.read_csv(path)
+    df['N_over_PK'] = add_n_over_pk(df['N'], df['P'], df['K'])
+    return df
+
+
+def build_pipeline(n_jobs=-1, random_state=RANDOM_STATE, **rf_params):
+    """
+    Pipeline [StandardScaler, RandomForestClassifier] del notebook.
+
+    Parámetros de entrada:
+        n_jobs (int): Núcleos del RandomForest (-1 = todos).
+        random_state (int): Semilla.
+        **rf_params: Parámetros que sustituyen a RF_PARAMS.
+
+    Salida:
+        Pipeline: Pipeline sin entrenar.
+    """
+    params = dict(RF_PARAMS, **rf_params)
+    return Pipeline([
+        ('scaler', StandardScaler()),
+        ('clf', RandomForestClassifier(random_state=random_state, n_jobs=n_jobs, **params))
+    ])
+
+
+def split_dataset(df, random_state=RANDOM_STATE, test_size=TEST_SIZE):
+    """
+    Codifica las etiquetas y separa train/test estratificado.
+
+    Parámetros de entrada:
+        df (DataFrame): Dataset con FEATURES + label.
+        random_state (int): Semilla del split.
+        test_size (float): Proporción de test.
+
+    Salida:
+        tuple: (X_train, X_test, y_train, y_test, le).
+    """
+    le = LabelEncoder()
+    y_enc = le.fit_transform(df['label'])
+    X_train, X_test, y_train, y_test = train_test_split(
+        df[FEATURES], y_enc, test_size=test_size, stratify=y_enc, random_state=random_state
+    )
+    return X_train, X_test, y_train, y_test, le
+
+
+def evaluate(pipeline, X_test, y_test):
+    """
+    Métricas macro en test, como en el notebook.
+
+    Salida:
+        dict: accuracy, f1_macro, precision_macro y recall_macro.
+    """
+    y_pred = pipeline.predict(X_test)
+    return {
+        'accuracy': float(accuracy_score(y_test, y_pred)),
+        'f1_macro': float(f1_score(y_test, y_pred, average='macro')),
+        'precision_macro': float(precision_score(y_test, y_pred, average='macro')),
+        'recall_macro': float(recall_score(y_test, y_pred, average='macro')),
+    }
+
+
+@contextmanager
+def _stage(timings, name):
+    """
+    Registra en timings[name] la duración (s) del bloque.
+    """
+    t0 = time.perf_counter()
+    yield
+    timings[name] = round(time.perf_counter() - t0, 4)
+
+
+def train(data_path=DATA_PATH, model_out=MODEL_PATH, encoder_out=ENCODER_PATH,
+          manifest_out=MANIFEST_PATH, n_jobs=-1, random_state=RANDOM_STATE, **rf_params):
+    """
+    Ejecuta el entrenamiento completo y escribe artefactos y manifiesto.
+
+    Parámetros de entrada:
+        data_path (str): CSV de entrenamiento.
+        model_out, encoder_out (str): Rutas de salida de los artefactos.
+        manifest_out (str | None): Ruta del manifiesto JSON (None = no escribirlo).
+        n_jobs (int): Núcleos para el RandomForest.
+        random_state (int): Semilla del split y del modelo.
+        **rf_params: Parámetros del RandomForest que sustituyen a RF_PARAMS.
+
+    Variables de proceso:
+        timings: Segundos de cada etapa (load con N_over_PK, split, fit, evaluate, dump).
+
+    Salida:
+        dict: Manifiesto con parámetros, tiempos, métricas y rutas.
+    """
+    timings = {}
+    with _stage(timings, 'load'):
+        df = load_dataset(data_path)
+    with _stage(timings, 'split'):
+        X_train, X_test, y_train, y_test, le = split_dataset(df, random_state)
+    with _stage(timings, 'fit'):
+        pipeline = build_pipeline(n_jobs, random_state, **rf_params)
+        pipeline.fit(X_train, y_train)
+    with _stage(timings, 'evaluate'):
+        metrics = evaluate(pipeline, X_test, y_test)
+    with _stage(timings, 'dump'):
+        for path in (model_out, encoder_out):
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        joblib.dump(pipeline, model_out)
+        joblib.dump(le, encoder_out)
+    timings['total'] = round(sum(timings.values()), 4)
+
+    manifest = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'data': {'path': os.path.abspath(data_path), 'rows': int(len(df)),
+                 'train_rows': int(len(X_train)), 'test_rows': int(len(X_test))},
+        'features': FEATURES,
+        'raw_features': RAW_FEATURES,
+        'classes': [str(c) for c in le.classes_],
+        'params': dict(RF_PARAMS, **rf_params, random_state=random_state,
+                       n_jobs=n_jobs, test_size=TEST_SIZE),
+        'metrics': metrics,
+        'timings_s': timings,
+        'artifacts': {'model': os.path.abspath(model_out), 'encoder': os.path.abspath(encoder_out),
+                      'model_size_mb': round(os.path.getsize(model_out) / 2**20, 2)},
+        'environment': {'python': platform.python_version(), 'numpy': np.__version__,
+                        'pandas': pd.__version__, 'scikit-learn': sklearn.__version__,
+                        'cpu_count': os.cpu_count()},
+    }
+    if manifest_out:
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_out)), exist_ok=True)
+        with open(manifest_out, 'w') as f:
+            json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Entrena el pipeline RandomForest del recomendador')
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--model-out', default=MODEL_PATH)
+    parser.add_argument('--encoder-out', default=ENCODER_PATH)
+    parser.add_argument('--manifest', default=MANIFEST_PATH)
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--random-state', type=int, default=RANDOM_STATE)
+    parser.add_argument('--n-estimators', type=int, default=RF_PARAMS['n_estimators'])
+    parser.add_argument('--register', action='store_true',
+                        help='Registrar el modelo como versión activa en models/registry')
+    args = parser.parse_args()
+
+    manifest = train(args.data, args.model_out, args.encoder_out, args.manifest,
+                     args.n_jobs, args.random_state, n_estimators=args.n_estimators)
+
+    print(f"✅ Modelo guardado en: {args.model_out} ({manifest['artifacts']['model_size_mb']} MB)")
+    print(f"✅ Label encoder guardado en: {args.encoder_out}")
+    print(f"Accuracy (test): {manifest['metrics']['accuracy']:.4f}  "
+          f"F1 (macro): {manifest['metrics']['f1_macro']:.4f}")
+    print('Tiempos (s): ' + ', '.join(f'{k}={v:.2f}' for k, v in manifest['timings_s'].items()))
+    if args.manifest:
+        print(f"✅ Manifiesto: {args.manifest}")
+    if args.register:
+        from croprec.registry import register_model
+        entry = register_model(args.model_out, args.encoder_out, manifest['metrics'], manifest['params'])
+        print(f"✅ Registrado como {entry['version']} ({entry['model_sha256'][:12]})")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,79 +6,274 @@ regresión, visualización de métricas y fronteras de decisión.
 """
 
 # >> Imports <<
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.metrics import (
-    confusion_matrix, accuracy_score, precision_score, 
-    recall_score, f1_score, mean_squared_error, 
-    r2_score, mean_absolute_error, precision_recall_curve,
-    roc_curve, roc_auc_score
-)
+from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+
+# >> Modelo de cada worker del pool de dibuja_frontera_decision <<
+_MODELO_FRONTERA = None
+
+
+def _codifica_etiquetas(Salidas_verdaderas, Salidas_predichas, clases=None):
+    """
+    Traduce las etiquetas verdaderas y predichas a códigos 0..n_clases-1.
+
+    Con etiquetas enteras no negativas (p. ej. las del LabelEncoder) los
+    códigos salen de un np.bincount de presencia sin ordenar los datos; con
+    cualquier otro tipo se usa np.unique. Si se pasan las clases, el orden de
+    la matriz es el de esa lista (necesario para sumar matrices de varios folds).
+
+    Excepciones:
+        ValueError: Si alguna etiqueta no está en clases.
+
+    Salida:
+        tuple: (clases, códigos verdaderos, códigos predichos).
+    """
+    y_true = np.asarray(Salidas_verdaderas).ravel()
+    y_pred = np.asarray(Salidas_predichas).ravel()
+
+    if clases is None:
+        if y_true.dtype.kind in 'iu' and y_pred.dtype.kind in 'iu' and min(y_true.min(), y_pred.min()) >= 0:
+            # >> enteros: tabla de presencia y reindexado en O(n) <<
+            tope = int(max(y_true.max(), y_pred.max())) + 1
+            presentes = (np.bincount(y_true, minlength=tope) + np.bincount(y_pred, minlength=tope)) > 0
+            clases = np.flatnonzero(presentes)
+            tabla = np.cumsum(presentes) - 1
+            return clases, tabla[y_true], tabla[y_pred]
+        clases, codigos = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+        return clases, codigos[:len(y_true)], codigos[len(y_true):]
+
+    clases = np.asarray(clases)
+    orden = np.argsort(clases)
+    ordenadas = clases[orden]
+    codigos = []
+    for y in (y_true, y_pred):
+        posicion = np.minimum(np.searchsorted(ordenadas, y), len(ordenadas) - 1)
+        if not np.array_equal(ordenadas[posicion], y):
+            raise ValueError(f"Etiquetas fuera de clases: {np.setdiff1d(y, clases)[:5]}")
+        codigos.append(orden[posicion])
+    return clases, codigos[0], codigos[1]
+
+
+
+
+def matriz_confusion(Salidas_verdaderas, Salidas_predichas, clases=None):
+    """
+    Matriz de confusión en una sola pasada con np.bincount.
+
+    Parámetros de entrada:
+        Salidas_verdaderas, Salidas_predichas (array-like): Etiquetas.
+        clases (array-like | None): Orden de filas/columnas (None = clases presentes, ordenadas).
+
+    Variables de proceso:
+        codigo_verdadero, codigo_predicho: Etiquetas como enteros 0..n-1.
+
+    Salida:
+        tuple: (matriz n×n de int64 con filas = verdadero y columnas = predicho, clases).
+    """
+    clases, codigo_verdadero, codigo_predicho = _codifica_etiquetas(
+        Salidas_verdaderas, Salidas_predichas, clases)
+    n = len(clases)
+    matriz = np.bincount(codigo_verdadero * n + codigo_predicho, minlength=n * n).reshape(n, n)
+    return matriz, clases
+
+
+
+
+def _divide(numerador, denominador):
+    """
+    Cociente elemento a elemento con 0 donde el denominador es 0 (como zero_division de sklearn).
+    """
+    return np.divide(numerador, denominador, out=np.zeros(len(numerador)), where=denominador > 0)
+
+
+
+
+def _tasas_por_clase(matriz):
+    """
+    Precision, sensibilidad, F1 y soporte de cada clase como arrays.
+    """
+    aciertos = np.diag(matriz).astype(float)
+    soporte = matriz.sum(axis=1)
+    precision = _divide(aciertos, matriz.sum(axis=0))
+    sensibilidad = _divide(aciertos, soporte)
+    f1 = _divide(2 * precision * sensibilidad, precision + sensibilidad)
+    return precision, sensibilidad, f1, soporte
+
+
+
+
+def metricas_por_clase(matriz, clases=None, digitos=4):
+    """
+    Precision, sensibilidad, F1 y soporte de cada clase a partir de la matriz de confusión.
+
+    Parámetros de entrada:
+        matriz (ndarray): Matriz de confusión (filas = verdadero, columnas = predicho).
+        clases (array-like | None): Nombres de las clases (None = 0..n-1).
+        digitos (int): Decimales del redondeo.
+
+    Salida:
+        dict: clase → {'precision', 'sensibilidad_recall', 'puntuacion_f1', 'soporte'}.
+    """
+    precision, sensibilidad, f1, soporte = _tasas_por_clase(matriz)
+    clases = range(len(matriz)) if clases is None else np.asarray(clases).tolist()
+    return {
+        clase: {'precision': round(float(precision[i]), digitos),
+                'sensibilidad_recall': round(float(sensibilidad[i]), digitos),
+                'puntuacion_f1': round(float(f1[i]), digitos), 'soporte': int(soporte[i])}
+        for i, clase in enumerate(clases)
+    }
+
 
 
-def obtencion_metricas_clasificacion(Entradas, modelo, Salidas_verdaderas):
+
+def metricas_desde_matriz(matriz, digitos=4):
+    """
+    Métricas de obtencion_metricas_clasificacion a partir de la matriz de confusión.
+
+    Precision, sensibilidad y F1 son medias ponderadas por el soporte de cada
+    clase (average='weighted' de sklearn, con 0 si una clase no tiene predicciones).
+
+    Parámetros de entrada:
+        matriz (ndarray): Matriz de confusión (filas = verdadero, columnas = predicho).
+        digitos (int): Decimales del redondeo.
+
+    Salida:
+        dict: exactitud, precision, sensibilidad_recall y puntuacion_f1 redondeadas.
     """
-    Calcula y visualiza métricas de clasificación binaria.
+    precision, sensibilidad, f1, soporte = _tasas_por_clase(matriz)
+    total = max(int(soporte.sum()), 1)
+    pesos = soporte / total
+    return {
+        'exactitud': round(float(np.trace(matriz) / total), digitos),
+        'precision': round(float(pesos @ precision), digitos),
+        'sensibilidad_recall': round(float(pesos @ sensibilidad), digitos),
+        'puntuacion_f1': round(float(pesos @ f1), digitos)
+    }
+
+
+
+
+def metricas_por_fold(matrices, digitos=4):
+    """
+    Agrega las matrices de confusión de varios folds (calculadas con las mismas clases).
+
+    Parámetros de entrada:
+        matrices (list de ndarray): Una matriz de confusión por fold.
+        digitos (int): Decimales del redondeo.
+
+    Variables de proceso:
+        por_fold: Métricas de cada fold.
+
+    Salida:
+        dict: 'global' (métricas de la suma de matrices), 'media' y 'desviacion'
+        (de las métricas por fold) y 'matriz' (suma de las matrices).
+    """
+    matrices = np.asarray(matrices)
+    por_fold = [metricas_desde_matriz(m, digitos=12) for m in matrices]
+    return {
+        'global': metricas_desde_matriz(matrices.sum(axis=0), digitos),
+        'media': {k: round(float(np.mean([m[k] for m in por_fold])), digitos) for k in por_fold[0]},
+        'desviacion': {k: round(float(np.std([m[k] for m in por_fold])), digitos) for k in por_fold[0]},
+        'matriz': matrices.sum(axis=0)
+    }
+
+
+
+
+def dibuja_matriz_confusion(matriz, clases, ruta=None, ax=None, titulo='Matriz de Confusión'):
+    """
+    Dibuja la matriz de confusión sin bloquear (no llama a plt.show).
+
+    Parámetros de entrada:
+        matriz (ndarray): Matriz de confusión.
+        clases (array-like): Nombres de las clases (ejes del heatmap).
+        ruta (str | None): Fichero donde guardar la figura; si se indica, la figura se cierra.
+        ax (Axes | None): Ejes donde dibujar (None = figura nueva, tamaño según nº de clases).
+        titulo (str): Título del gráfico.
+
+    Salida:
+        Figure: Figura de matplotlib (ya cerrada si se guardó en ruta).
+    """
+    if ax is None:
+        lado = max(6, 0.45 * len(clases))
+        fig, ax = plt.subplots(figsize=(lado, lado * 2 / 3 if len(clases) <= 2 else lado))
+    else:
+        fig = ax.figure
+    sns.heatmap(
+        matriz, annot=True, fmt='d', cmap='Blues', ax=ax,
+        xticklabels=[f'Predicho {c}' for c in clases],
+        yticklabels=[f'Verdadero {c}' for c in clases]
+    )
+    ax.set_title(titulo)
+    ax.set_ylabel('Verdadero')
+    ax.set_xlabel('Predicho')
+    if ruta is not None:
+        fig.savefig(ruta, dpi=150, bbox_inches='tight')
+        plt.close(fig)
+    return fig
+
+
+
+
+def obtencion_metricas_clasificacion(Entradas, modelo, Salidas_verdaderas, grafico='mostrar',
+                                     clases=None, por_clase=False):
+    """
+    Calcula métricas de clasificación (binaria o multiclase) y, opcionalmente, dibuja la matriz de confusión.
     
     Parámetros de entrada:
         Entradas (array-like): Características del conjunto de datos.
         modelo (estimator): Modelo de clasificación entrenado.
         Salidas_verdaderas (array-like): Etiquetas verdaderas.
+        grafico (str | None): 'mostrar' (plt.show), 'figura' (devuelve la figura en
+            'figura'), una ruta de fichero (guarda la imagen) o None (sin gráfico).
+        clases (array-like | None): Orden de las clases (None = clases presentes).
+        por_clase (bool): Añadir las métricas de cada clase en 'por_clase'.
     
     Variables de proceso:
         Salidas_predichas: Predicciones del modelo.
-        matriz_confusion: Matriz de confusión calculada.
-        exactitud, precision, sensibilidad_recall, puntuacion_f1: Métricas.
+        matriz: Matriz de confusión (una pasada con np.bincount).
     
     Salida:
-        dict: Diccionario con métricas redondeadas a 4 dígitos.
+        dict: Métricas redondeadas a 4 dígitos (más 'figura' y 'por_clase' si se piden).
     """
     # >> predicciones del modelo <<
     Salidas_predichas = modelo.predict(Entradas)
-    matriz_confusion = confusion_matrix(Salidas_verdaderas, Salidas_predichas)
+    matriz, clases = matriz_confusion(Salidas_verdaderas, Salidas_predichas, clases)
     
-    print("La matriz de confusión es:")
+    # >> cálculo de métricas (todas desde la misma matriz) <<
+    metricas = metricas_desde_matriz(matriz)
+    if por_clase:
+        metricas['por_clase'] = metricas_por_clase(matriz, clases)
     
     # >> visualización matriz de confusión <<
-    plt.figure(figsize=(6, 4))
-    sns.heatmap(
-        matriz_confusion, annot=True, fmt='d', cmap='Blues',
-        xticklabels=['Predicho 0', 'Predicho 1'],
-        yticklabels=['Verdadero 0', 'Verdadero 1']
-    )
-    plt.title('Matriz de Confusión')
-    plt.ylabel('Verdadero')
-    plt.xlabel('Predicho')
-    plt.show()
-    
-    # >> cálculo de métricas <<
-    exactitud = accuracy_score(Salidas_verdaderas, Salidas_predichas)
-    precision = precision_score(Salidas_verdaderas, Salidas_predichas, average='weighted')
-    sensibilidad_recall = recall_score(Salidas_verdaderas, Salidas_predichas, average='weighted')
-    puntuacion_f1 = f1_score(Salidas_verdaderas, Salidas_predichas, average='weighted')
-    
-    digitos = 4
-    return {
-        'exactitud': round(exactitud, digitos),
-        'precision': round(precision, digitos),
-        'sensibilidad_recall': round(sensibilidad_recall, digitos),
-        'puntuacion_f1': round(puntuacion_f1, digitos)
-    }
+    if grafico == 'mostrar':
+        print("La matriz de confusión es:")
+        dibuja_matriz_confusion(matriz, clases)
+        plt.show()
+    elif grafico == 'figura':
+        metricas['figura'] = dibuja_matriz_confusion(matriz, clases)
+    elif grafico is not None:
+        dibuja_matriz_confusion(matriz, clases, ruta=grafico)
+    return metricas
 
 
 
 
-def dibujar_curva_roc(prob_falsa_alarma, ratio_verdaderos_positivos):
+def dibujar_curva_roc(prob_falsa_alarma, ratio_verdaderos_positivos, ruta=None):
     """
     Dibuja la curva ROC.
     
     Parámetros de entrada:
         prob_falsa_alarma (array-like): Tasa de falsos positivos.
         ratio_verdaderos_positivos (array-like): Tasa de verdaderos positivos.
+        ruta (str | None): Fichero donde guardar el gráfico en lugar de mostrarlo.
     
     Salida:
-        None: Muestra gráfico de la curva ROC.
+        None: Muestra (o guarda en ruta) el gráfico de la curva ROC.
     """
     plt.plot(prob_falsa_alarma, ratio_verdaderos_positivos, "b-")
     plt.plot([0, 1], [0, 1], 'k--')  # >> diagonal de referencia <<
@@ -87,7 +282,207 @@ def dibujar_curva_roc(prob_falsa_alarma, ratio_verdaderos_positivos):
     plt.xlabel('Probabilidad de falsa alarma (PFA)')
     plt.ylabel('Sensibilidad o ratio verdaderos positivos (TRP)')
     plt.grid()
-    plt.show()
+    if ruta is None:
+        plt.show()
+    else:
+        plt.savefig(ruta, dpi=150, bbox_inches='tight')
+        plt.close()
+
+
+
+
+def _area_trapecio(x, y):
+    """
+    Área bajo la curva (x creciente) por la regla del trapecio.
+    """
+    return float(np.sum(np.diff(x) * (y[1:] + y[:-1])) / 2)
+
+
+
+
+def _submuestrea(n_puntos, max_umbrales):
+    """
+    Índices de como máximo max_umbrales puntos repartidos por igual, con el primero y el último.
+    """
+    if max_umbrales is None or n_puntos <= max_umbrales:
+        return slice(None)
+    return np.unique(np.linspace(0, n_puntos - 1, max_umbrales).round().astype(np.int64))
+
+
+
+
+def _curvas_columna(positivos_acumulados, distinto, puntuaciones, max_umbrales):
+    """
+    Curvas ROC y PR de una columna ya ordenada por puntuación descendente.
+
+    Parámetros de entrada:
+        positivos_acumulados (ndarray): Verdaderos positivos acumulados en ese orden.
+        distinto (ndarray): True donde la puntuación siguiente es distinta (último incluido).
+        puntuaciones (ndarray): Puntuaciones ordenadas.
+        max_umbrales (int | None): Puntos máximos de las curvas devueltas.
+
+    Variables de proceso:
+        vp, fp: Verdaderos y falsos positivos con cada umbral distinto.
+
+    Salida:
+        tuple: (dict ROC, dict PR). Las áreas se calculan con todos los umbrales.
+    """
+    corte = np.flatnonzero(distinto)
+    vp = positivos_acumulados[corte].astype(float)
+    fp = corte + 1 - vp
+    umbrales = puntuaciones[corte]
+    n_positivos, n_negativos = vp[-1], fp[-1]
+
+    fpr = np.r_[0.0, fp / n_negativos] if n_negativos else np.full(len(fp) + 1, np.nan)
+    tpr = np.r_[0.0, vp / n_positivos] if n_positivos else np.full(len(vp) + 1, np.nan)
+    precision = vp / (vp + fp)
+    recall = vp / n_positivos if n_positivos else np.full(len(vp), np.nan)
+    # >> AUC-ROC por trapecios y AP como suma escalonada (average_precision_score) <<
+    auc = _area_trapecio(fpr, tpr) if n_positivos and n_negativos else float('nan')
+    ap = float(np.sum(np.diff(np.r_[0.0, recall]) * precision)) if n_positivos else float('nan')
+
+    indices = _submuestrea(len(umbrales), max_umbrales)
+    roc = {'fpr': np.r_[0.0, fpr[1:][indices]], 'tpr': np.r_[0.0, tpr[1:][indices]],
+           'umbrales': np.r_[np.inf, umbrales[indices]], 'auc': auc}
+    pr = {'precision': precision[indices], 'recall': recall[indices],
+          'umbrales': umbrales[indices], 'ap': ap}
+    return roc, pr
+
+
+
+
+def curvas_multiclase(Salidas_verdaderas, probabilidades, clases=None, max_umbrales=None,
+                      puntos_recall=101):
+    """
+    Curvas ROC y precision-recall uno-contra-resto de todas las clases a la vez.
+
+    Ordena la matriz de predict_proba con un único argsort por columna (una
+    llamada a np.argsort con axis=0) y acumula los verdaderos positivos de
+    todas las columnas con un cumsum, en lugar de una llamada a roc_curve y a
+    precision_recall_curve por clase. Las curvas micro salen de un argsort
+    más sobre la matriz aplanada. Las macro promedian las curvas por clase
+    (tpr interpolado en la unión de fpr; precisión interpolada, la máxima con
+    recall mayor o igual, en una rejilla de recall) y sus áreas son la media
+    de las áreas por clase, como average='macro' de sklearn.
+
+    Parámetros de entrada:
+        Salidas_verdaderas (array-like): Etiquetas verdaderas.
+        probabilidades (ndarray): Matriz (n_muestras, n_clases) de predict_proba.
+        clases (array-like | None): Clase de cada columna (p. ej. le.classes_ o
+            modelo.classes_); None si las etiquetas ya son los índices 0..n_clases-1.
+        max_umbrales (int | None): Puntos máximos de cada curva devuelta (None = todos).
+            Las áreas se calculan siempre con todos los umbrales.
+        puntos_recall (int): Puntos de la rejilla de recall de la curva PR macro.
+
+    Variables de proceso:
+        orden: Índices que ordenan cada columna por puntuación descendente.
+        positivos_acumulados: Verdaderos positivos acumulados de cada columna.
+
+    Excepciones:
+        ValueError: Si alguna etiqueta no corresponde a una columna.
+
+    Salida:
+        dict: 'clases', 'roc' y 'pr'. 'roc' tiene una entrada por clase y 'micro'/'macro'
+        con fpr, tpr, umbrales y auc; 'pr' con precision, recall (creciente), umbrales y ap.
+        Las clases sin positivos o sin negativos tienen área nan y no cuentan en la macro.
+    """
+    probabilidades = np.asarray(probabilidades, dtype=float)
+    n_clases = probabilidades.shape[1]
+    y = np.asarray(Salidas_verdaderas).ravel()
+    if clases is None:
+        clases = np.arange(n_clases)
+        codigos = y.astype(np.int64)
+        if codigos.min() < 0 or codigos.max() >= n_clases:
+            raise ValueError(f"Las etiquetas deben estar entre 0 y {n_clases - 1} o pasarse clases")
+    else:
+        clases, codigos, _ = _codifica_etiquetas(y, y[:0], clases)
+    verdad = np.zeros(probabilidades.shape, dtype=bool)
+    verdad[np.arange(len(codigos)), codigos] = True
+
+    # >> un argsort por columna y un cumsum para todas las clases <<
+    orden = np.argsort(probabilidades, axis=0)[::-1]
+    puntuaciones = np.take_along_axis(probabilidades, orden, axis=0)
+    positivos_acumulados = np.cumsum(np.take_along_axis(verdad, orden, axis=0), axis=0, dtype=np.int64)
+    distinto = np.ones(probabilidades.shape, dtype=bool)
+    distinto[:-1] = puntuaciones[1:] != puntuaciones[:-1]
+
+    nombres = np.asarray(clases).tolist()
+    roc, pr = {}, {}
+    for j, clase in enumerate(nombres):
+        roc[clase], pr[clase] = _curvas_columna(positivos_acumulados[:, j], distinto[:, j],
+                                                puntuaciones[:, j], max_umbrales)
+
+    # >> micro: todas las parejas (muestra, clase) como un único problema binario <<
+    plana = probabilidades.ravel()
+    orden_plano = np.argsort(plana)[::-1]
+    puntuaciones_planas = plana[orden_plano]
+    distinto_plano = np.r_[puntuaciones_planas[1:] != puntuaciones_planas[:-1], True]
+    roc['micro'], pr['micro'] = _curvas_columna(np.cumsum(verdad.ravel()[orden_plano]), distinto_plano,
+                                                puntuaciones_planas, max_umbrales)
+
+    # >> macro: media de curvas interpoladas y de áreas por clase <<
+    validas = [c for c in nombres if not np.isnan(roc[c]['auc'])]
+    fpr = np.unique(np.concatenate([roc[c]['fpr'] for c in validas]))
+    recall = np.linspace(0, 1, puntos_recall)
+    precisiones = []
+    for c in validas:
+        # >> precisión interpolada: máxima precisión con recall >= r <<
+        envolvente = np.maximum.accumulate(pr[c]['precision'][::-1])[::-1]
+        posicion = np.searchsorted(pr[c]['recall'], recall)
+        precisiones.append(np.where(posicion < len(envolvente),
+                                    envolvente[np.minimum(posicion, len(envolvente) - 1)], 0.0))
+    roc['macro'] = {'fpr': fpr, 'tpr': np.mean([np.interp(fpr, roc[c]['fpr'], roc[c]['tpr'])
+                                                for c in validas], axis=0),
+                    'umbrales': None, 'auc': float(np.mean([roc[c]['auc'] for c in validas]))}
+    pr['macro'] = {'precision': np.mean(precisiones, axis=0), 'recall': recall, 'umbrales': None,
+                   'ap': float(np.mean([pr[c]['ap'] for c in validas]))}
+    return {'clases': nombres, 'roc': roc, 'pr': pr}
+
+
+
+
+def dibuja_curvas_multiclase(curvas, ruta=None, clases=None, titulo=''):
+    """
+    Dibuja las curvas ROC y PR de curvas_multiclase sin bloquear (no llama a plt.show).
+
+    Parámetros de entrada:
+        curvas (dict): Resultado de curvas_multiclase.
+        ruta (str | None): Fichero donde guardar la figura; si se indica, la figura se cierra.
+        clases (list | None): Clases a dibujar (None = todas); micro y macro se dibujan siempre.
+        titulo (str): Prefijo del título de cada panel.
+
+    Salida:
+        Figure: Figura de matplotlib (ya cerrada si se guardó en ruta).
+    """
+    clases = curvas['clases'] if clases is None else clases
+    fig, (ax_roc, ax_pr) = plt.subplots(1, 2, figsize=(14, 6))
+    colores = plt.cm.tab20(np.linspace(0, 1, max(len(clases), 1)))
+    for color, clase in zip(colores, clases):
+        roc, pr = curvas['roc'][clase], curvas['pr'][clase]
+        ax_roc.plot(roc['fpr'], roc['tpr'], color=color, lw=1, alpha=0.7,
+                    label=f"{clase} (AUC={roc['auc']:.3f})")
+        ax_pr.plot(pr['recall'], pr['precision'], color=color, lw=1, alpha=0.7,
+                   label=f"{clase} (AP={pr['ap']:.3f})")
+    for media, estilo in (('micro', 'k-'), ('macro', 'k--')):
+        roc, pr = curvas['roc'][media], curvas['pr'][media]
+        ax_roc.plot(roc['fpr'], roc['tpr'], estilo, lw=2.5, label=f"{media} (AUC={roc['auc']:.3f})")
+        ax_pr.plot(pr['recall'], pr['precision'], estilo, lw=2.5, label=f"{media} (AP={pr['ap']:.3f})")
+    ax_roc.plot([0, 1], [0, 1], ':', color='grey')  # >> diagonal de referencia <<
+
+    ax_roc.set_title(f'{titulo} Curvas ROC'.strip())
+    ax_roc.set_xlabel('Probabilidad de falsa alarma (PFA)')
+    ax_roc.set_ylabel('Sensibilidad o ratio verdaderos positivos (TRP)')
+    ax_pr.set_title(f'{titulo} Curvas Precision-Recall'.strip())
+    ax_pr.set_xlabel('Sensibilidad (recall)')
+    ax_pr.set_ylabel('Precisión')
+    for ax in (ax_roc, ax_pr):
+        ax.grid(alpha=0.3)
+        ax.legend(fontsize=7, ncol=2, loc='lower left' if ax is ax_pr else 'lower right')
+    fig.tight_layout()
+    if ruta is not None:
+        fig.savefig(ruta, dpi=150, bbox_inches='tight')
+        plt.close(fig)
+    return fig
 
 
 
@@ -107,7 +502,7 @@ def obtencion_metricas_regresion(y, y_sal, titulo_tipo_datos):
         R2: Coeficiente de determinación.
     
     Salida:
-        None: Imprime las métricas calculadas.
+        dict: error_MSE y error_MAE redondeados a 4 dígitos y R2 a 3 (además de imprimirlos).
     """
     # >> error cuadrático medio <<
     error_MSE = mean_squared_error(y, y_sal)
@@ -126,6 +521,152 @@ def obtencion_metricas_regresion(y, y_sal, titulo_tipo_datos):
     mensaje = f'El valor del coeficiente de determinación R2 {titulo_tipo_datos} es:'
     print(mensaje)
     print(round(R2, 3))
+    
+    return {
+        'error_MSE': round(error_MSE, 4),
+        'error_MAE': round(error_MAE, 4),
+        'R2': round(R2, 3)
+    }
+
+
+
+
+class AcumuladorClasificacion:
+    """
+    Matriz de confusión acumulada por bloques y combinable entre procesos.
+
+    Permite evaluar registros de predicciones que no caben en memoria: cada
+    bloque solo suma su matriz (matriz_confusion) a la acumulada, y los
+    acumuladores de distintos procesos se combinan sumando matrices. Las
+    clases se fijan al crearlo para que todas las matrices sean compatibles.
+
+    Parámetros de entrada:
+        clases (array-like): Clases posibles (p. ej. le.classes_).
+
+    Variables de proceso:
+        matriz: Matriz de confusión acumulada (filas = verdadero, columnas = predicho).
+    """
+
+    def __init__(self, clases):
+        self.clases = np.asarray(clases)
+        self.matriz = np.zeros((len(self.clases), len(self.clases)), dtype=np.int64)
+
+    @property
+    def n(self):
+        return int(self.matriz.sum())
+
+    def actualiza(self, Salidas_verdaderas, Salidas_predichas):
+        """
+        Suma un bloque de etiquetas verdaderas y predichas.
+
+        Excepciones:
+            ValueError: Si alguna etiqueta no está en las clases del acumulador.
+        """
+        self.matriz += matriz_confusion(Salidas_verdaderas, Salidas_predichas, self.clases)[0]
+        return self
+
+    def combina(self, otro):
+        """
+        Añade el estado de otro acumulador (p. ej. el de otro proceso).
+
+        Excepciones:
+            ValueError: Si los acumuladores tienen clases distintas.
+        """
+        if not np.array_equal(self.clases, otro.clases):
+            raise ValueError('Los acumuladores tienen clases distintas')
+        self.matriz += otro.matriz
+        return self
+
+    def finaliza(self, por_clase=False):
+        """
+        Métricas del total acumulado.
+
+        Salida:
+            dict: Mismo diccionario que obtencion_metricas_clasificacion (más 'por_clase' si se pide).
+        """
+        metricas = metricas_desde_matriz(self.matriz)
+        if por_clase:
+            metricas['por_clase'] = metricas_por_clase(self.matriz, self.clases)
+        return metricas
+
+
+
+
+class AcumuladorRegresion:
+    """
+    Estado de MSE, MAE y R² acumulado por bloques y combinable entre procesos.
+
+    Guarda el número de filas, las sumas de errores cuadráticos y absolutos
+    y, para el denominador de R², la media y la suma de cuadrados centrada de
+    los valores verdaderos. Estas dos se combinan con la fórmula de Chan et al.
+    en lugar de acumular sum(y²), que pierde precisión cuando la media es
+    grande frente a la varianza.
+
+    Variables de proceso:
+        n: Filas acumuladas.
+        suma_error_cuadratico, suma_error_absoluto: Sumas de (y - y_sal)² y |y - y_sal|.
+        media_y, m2_y: Media de y y suma de (y - media_y)².
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.suma_error_cuadratico = 0.0
+        self.suma_error_absoluto = 0.0
+        self.media_y = 0.0
+        self.m2_y = 0.0
+
+    def _combina_estado(self, n, suma_cuadratico, suma_absoluto, media_y, m2_y):
+        total = self.n + n
+        if n == 0:
+            return self
+        delta = media_y - self.media_y
+        self.m2_y += m2_y + delta * delta * self.n * n / total
+        self.media_y += delta * n / total
+        self.suma_error_cuadratico += suma_cuadratico
+        self.suma_error_absoluto += suma_absoluto
+        self.n = total
+        return self
+
+    def actualiza(self, y, y_sal):
+        """
+        Suma un bloque de valores verdaderos y predichos.
+        """
+        y = np.asarray(y, dtype=float).ravel()
+        error = y - np.asarray(y_sal, dtype=float).ravel()
+        if len(y) == 0:
+            return self
+        media = y.mean()
+        return self._combina_estado(len(y), float(error @ error), float(np.abs(error).sum()),
+                                    float(media), float(((y - media) ** 2).sum()))
+
+    def combina(self, otro):
+        """
+        Añade el estado de otro acumulador (p. ej. el de otro proceso).
+        """
+        return self._combina_estado(otro.n, otro.suma_error_cuadratico, otro.suma_error_absoluto,
+                                    otro.media_y, otro.m2_y)
+
+    def finaliza(self):
+        """
+        Métricas del total acumulado (R² = 1 si y es constante y no hay error, 0 si lo hay, como sklearn).
+
+        Excepciones:
+            ValueError: Si no se ha acumulado ninguna fila.
+
+        Salida:
+            dict: Mismo diccionario que obtencion_metricas_regresion.
+        """
+        if self.n == 0:
+            raise ValueError('El acumulador está vacío')
+        if self.m2_y > 0:
+            R2 = 1 - self.suma_error_cuadratico / self.m2_y
+        else:
+            R2 = 1.0 if self.suma_error_cuadratico == 0 else 0.0
+        return {
+            'error_MSE': round(self.suma_error_cuadratico / self.n, 4),
+            'error_MAE': round(self.suma_error_absoluto / self.n, 4),
+            'R2': round(R2, 3)
+        }
 
 
 
@@ -168,11 +709,117 @@ def dibuja_ajuste_datos_regresion(x, y, x_entrada, y_sal):
 
 
 
+def _inicia_worker_frontera(modelo):
+    """
+    Guarda el modelo en cada proceso del pool (se serializa una sola vez por worker).
+    """
+    global _MODELO_FRONTERA
+    _MODELO_FRONTERA = modelo
+
+
+
+
+def _predice_bloque_frontera(puntos):
+    """
+    Predicción de un bloque dentro de un worker del pool.
+    """
+    return _MODELO_FRONTERA.predict(puntos)
+
+
+
+
+def frontera_adaptativa(modelo, x1, x2, paso_inicial=8, tamano_bloque=65536, n_procesos=None):
+    """
+    Etiquetas del modelo sobre la rejilla x1 × x2 con refinamiento adaptativo.
+
+    Se evalúa primero una rejilla gruesa (un punto de cada paso_inicial) y en
+    cada nivel se divide el paso a la mitad, evaluando solo las celdas cuyas
+    cuatro esquinas no coinciden (refinamiento tipo quadtree). Las celdas con
+    esquinas iguales se rellenan con esa etiqueta sin llamar al modelo, así
+    que islas de clase más pequeñas que una celda gruesa pueden perderse.
+
+    Parámetros de entrada:
+        modelo (estimator): Modelo de clasificación entrenado sobre 2 variables.
+        x1, x2 (ndarray): Coordenadas de la rejilla; len - 1 debe ser múltiplo de paso_inicial.
+        paso_inicial (int): Paso de la rejilla gruesa (potencia de 2).
+        tamano_bloque (int): Puntos por llamada a modelo.predict (acota la memoria).
+        n_procesos (int | None): Procesos para predecir los bloques (None = en este proceso).
+
+    Variables de proceso:
+        Y: Etiqueta de cada punto (predicha o heredada de su celda).
+        evaluado: Puntos en los que se ha llamado realmente al modelo.
+        marcadas: Celdas del nivel actual con esquinas en desacuerdo.
+
+    Salida:
+        tuple: (Y con forma (len(x2), len(x1)), número de puntos evaluados).
+    """
+    n_filas, n_cols = len(x2), len(x1)
+    if (n_filas - 1) % paso_inicial or (n_cols - 1) % paso_inicial or paso_inicial & (paso_inicial - 1):
+        raise ValueError('paso_inicial debe ser potencia de 2 y dividir len(x1) - 1 y len(x2) - 1')
+
+    pool = None
+    if n_procesos:
+        pool = ProcessPoolExecutor(max_workers=n_procesos, initializer=_inicia_worker_frontera,
+                                   initargs=(modelo,))
+
+    def predice(filas, cols):
+        # >> bloques de tamano_bloque puntos; las coordenadas se construyen por bloque <<
+        bloques = [np.column_stack((x1[cols[i:i + tamano_bloque]], x2[filas[i:i + tamano_bloque]]))
+                   for i in range(0, len(filas), tamano_bloque)]
+        if pool is None:
+            return np.concatenate([modelo.predict(b) for b in bloques])
+        return np.concatenate(list(pool.map(_predice_bloque_frontera, bloques)))
+
+    try:
+        # >> nivel grueso: todos los puntos de la rejilla con paso paso_inicial <<
+        paso = paso_inicial
+        filas, cols = np.meshgrid(np.arange(0, n_filas, paso), np.arange(0, n_cols, paso), indexing='ij')
+        etiquetas = predice(filas.ravel(), cols.ravel())
+        Y = np.empty((n_filas, n_cols), dtype=etiquetas.dtype)
+        evaluado = np.zeros((n_filas, n_cols), dtype=bool)
+        Y[filas, cols] = etiquetas.reshape(filas.shape)
+        evaluado[filas, cols] = True
+
+        while paso > 1:
+            G = Y[::paso, ::paso]
+            esquina = G[:-1, :-1]
+            marcadas = (esquina != G[1:, :-1]) | (esquina != G[:-1, 1:]) | (esquina != G[1:, 1:])
+
+            # >> celdas uniformes: heredar la etiqueta en los puntos no evaluados <<
+            # >> (la última fila/columna de puntos pertenece a la última fila/columna de celdas) <<
+            uniforme = np.pad(np.repeat(np.repeat(~marcadas, paso, axis=0), paso, axis=1), (0, 1), mode='edge')
+            relleno = uniforme & ~evaluado
+            Y[relleno] = np.pad(np.repeat(np.repeat(esquina, paso, axis=0), paso, axis=1),
+                                (0, 1), mode='edge')[relleno]
+
+            # >> celdas marcadas: sus 3×3 puntos en la rejilla de paso / 2 <<
+            mitad = paso // 2
+            necesita = np.zeros((2 * marcadas.shape[0] + 1, 2 * marcadas.shape[1] + 1), dtype=bool)
+            for di in range(3):
+                for dj in range(3):
+                    necesita[di:di + 2 * marcadas.shape[0]:2, dj:dj + 2 * marcadas.shape[1]:2] |= marcadas
+            filas, cols = np.nonzero(necesita)
+            filas, cols = filas * mitad, cols * mitad
+            nuevos = ~evaluado[filas, cols]
+            filas, cols = filas[nuevos], cols[nuevos]
+            if len(filas):
+                Y[filas, cols] = predice(filas, cols)
+                evaluado[filas, cols] = True
+            paso = mitad
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return Y, int(evaluado.sum())
+
+
+
+
 def dibuja_frontera_decision(Entradas, modelo, Salidas, clase_0, clase_1,
                               colores, etiqueta_leyenda_cero,
                               etiqueta_leyenda_uno, titulo, titulo_eje_x, 
                               titulo_eje_y, simbolo, tamano_simbolo, 
-                              adicion_frontera):
+                              adicion_frontera, resolucion=1000, paso_inicial=8,
+                              tamano_bloque=65536, n_procesos=None):
     """
     Dibuja las clases y la frontera de decisión del modelo.
     
@@ -187,29 +834,32 @@ def dibuja_frontera_decision(Entradas, modelo, Salidas, clase_0, clase_1,
         simbolo (str): Marcador para los puntos.
         tamano_simbolo (int): Tamaño de los marcadores.
         adicion_frontera (int): 1 para dibujar frontera, 0 para no dibujarla.
+        resolucion (int): Puntos por eje de la rejilla final (se redondea a múltiplo de paso_inicial + 1).
+        paso_inicial (int): Paso de la rejilla gruesa inicial (potencia de 2).
+        tamano_bloque (int): Puntos por llamada a modelo.predict.
+        n_procesos (int | None): Procesos para las predicciones (None = sin pool).
     
     Variables de proceso:
-        X1, X2: Grillas de coordenadas para la frontera.
-        Y: Predicciones en la grilla.
+        x1, x2: Coordenadas de la rejilla para la frontera.
+        Y: Predicciones en la rejilla (ver frontera_adaptativa).
     
     Salida:
         None: Muestra gráfico con las clases y frontera de decisión.
     """
     # >> generar frontera de decisión <<
     if adicion_frontera == 1:
-        minX1 = min(Entradas[:, 0])
-        maxX1 = max(Entradas[:, 0])
-        minX2 = min(Entradas[:, 1])
-        maxX2 = max(Entradas[:, 1])
+        minX1, maxX1 = np.min(Entradas[:, 0]), np.max(Entradas[:, 0])
+        minX2, maxX2 = np.min(Entradas[:, 1]), np.max(Entradas[:, 1])
         marginX1 = (maxX1 - minX1) * 0.2
         marginX2 = (maxX2 - minX2) * 0.2
         
-        x1 = np.linspace(minX1 - marginX1, maxX1 + marginX1, 1000)
-        x2 = np.linspace(minX2 - marginX2, maxX2 + marginX2, 1000)
-        X1, X2 = np.meshgrid(x1, x2)
+        n_puntos = -(-(resolucion - 1) // paso_inicial) * paso_inicial + 1
+        x1 = np.linspace(minX1 - marginX1, maxX1 + marginX1, n_puntos)
+        x2 = np.linspace(minX2 - marginX2, maxX2 + marginX2, n_puntos)
         
-        Y = modelo.predict(np.c_[X1.ravel(), X2.ravel()]).reshape(X1.shape)
-        plt.contourf(X1, X2, Y, levels=2, alpha=0.3)
+        Y, _ = frontera_adaptativa(modelo, x1, x2, paso_inicial, tamano_bloque, n_procesos)
+        Y = np.unique(Y, return_inverse=True)[1].reshape(Y.shape)
+        plt.contourf(x1, x2, Y, levels=2, alpha=0.3)
     
     # >> graficar clase 0 <<
     condicion = Salidas == clase_0
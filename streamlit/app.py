@@ -2,20 +2,28 @@
 Sistema de Recomendación de Cultivos - Agricultura de Precisión.
 
 Aplicación Streamlit con diseño mejorado, secciones claras y visualización atractiva.
+Cada página vive en views/ y se importa solo al seleccionarla.
 """
 
 # >> Imports <<
+import importlib
 import os
 import sys
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import joblib
+
+# >> Inferencia headless desde la raíz del proyecto y páginas en views/ <<
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.dirname(_APP_DIR), _APP_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# >> Módulo de cada página <<
+PAGES = {
+    "🏠 Inicio": "views.inicio",
+    "📊 EDA": "views.eda",
+    "🤖 Modelo": "views.modelo",
+    "🔮 Predicción": "views.prediccion",
+}
 
 # >> Configuración de página <<
 st.set_page_config(
@@ -159,46 +167,11 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# >> Configuración de paths <<
-DATA_PATH = os.path.join('data', 'Crop_recommendation.csv')
-MODEL_PATH = os.path.join('models', 'crop_recommender_rf.joblib')
-ENCODER_PATH = os.path.join('models', 'label_encoder.joblib')
-
-# >> Iconos de cultivos <<
-CROP_ICONS = {
-    'rice': '🍚', 'maize': '🌽', 'chickpea': '𓇛', 'kidneybeans': '🫘',
-    'pigeonpeas': '🫘', 'mothbeans': '🫛', 'mungbean': '🫘', 'blackgram': '🫘',
-    'lentil': '𓇢', 'pomegranate': '🥭', 'banana': '🍌', 'mango': '🥭',
-    'grapes': '🍇', 'watermelon': '🍉', 'muskmelon': '🍈', 'apple': '🍎',
-    'orange': '🍊', 'papaya': '🏉', 'coconut': '🥥', 'cotton': '☁️',
-    'jute': '🌿', 'coffee': '☕'
-}
-
-@st.cache_data
-def load_data():
-    return pd.read_csv(DATA_PATH)
-
-@st.cache_resource
-def load_model():
-    pipeline = joblib.load(MODEL_PATH)
-    le = joblib.load(ENCODER_PATH)
-    return pipeline, le
-
-def predict_crop(N, P, K, temperature, humidity, ph, rainfall, pipeline, le):
-    N_over_PK = N / (P + K + 1e-6)
-    features = np.array([[N, P, K, temperature, humidity, ph, rainfall, N_over_PK]])
-    pred_encoded = pipeline.predict(features)
-    pred_proba = pipeline.predict_proba(features)[0]
-    crop = le.inverse_transform(pred_encoded)[0]
-    top_indices = np.argsort(pred_proba)[-5:][::-1]
-    top_crops = {le.inverse_transform([idx])[0]: pred_proba[idx] for idx in top_indices}
-    return crop, top_crops
-
 # >> SIDEBAR <<
 with st.sidebar:
     st.title("🌾 Recomendación de Cultivos")
     st.markdown("---")
-    page = st.radio("Navegación", ["🏠 Inicio", "📊 EDA", "🤖 Modelo", "🔮 Predicción"], label_visibility="collapsed")
+    page = st.radio("Navegación", list(PAGES), label_visibility="collapsed")
     st.markdown("---")
     st.markdown("""
     <div style='padding: 1rem; background: #e8f5e9; border-radius: 10px;'>
@@ -218,771 +191,8 @@ with st.sidebar:
         st.metric("Muestras", "2,200")
         st.metric("Features", "7")
 
-# >> PÁGINA: INICIO <<
-if page == "🏠 Inicio":
-    st.markdown("""
-    <div class="main-header">
-        <h1>🌾 Sistema de Recomendación de Cultivos</h1>
-        <p>Agricultura de Precisión - Upgrade Bootcamp</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.markdown('<div class="metric-card"><p class="metric-value">22</p><p class="metric-label">Cultivos Analizados</p></div>', unsafe_allow_html=True)
-    with col2:
-        st.markdown('<div class="metric-card"><p class="metric-value">99%</p><p class="metric-label">Accuracy del Modelo</p></div>', unsafe_allow_html=True)
-    with col3:
-        st.markdown('<div class="metric-card"><p class="metric-value">2,200</p><p class="metric-label">Observaciones</p></div>', unsafe_allow_html=True)
-    with col4:
-        st.markdown('<div class="metric-card"><p class="metric-value">7</p><p class="metric-label">Variables Predictivas</p></div>', unsafe_allow_html=True)
-    
-    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        st.markdown('<div class="section-header"><h2>🎯 ¿Qué Hace Este Sistema?</h2></div>', unsafe_allow_html=True)
-        st.markdown("""
-        Este sistema utiliza **Machine Learning avanzado** para analizar las características de tu terreno.
-        
-        **Analiza:**
-        - 🌱 **Composición del Suelo**: N, P, K, pH
-        - 🌡️ **Condiciones Climáticas**: Temperatura, Humedad, Precipitación
-        - 📊 **Patrones Históricos**: +2,000 siembras exitosas
-        
-        **Te Ofrece:**
-        - ✅ Recomendación óptima con 99% de precisión
-        - 📈 Probabilidades para múltiples cultivos
-        - 💡 Información agronómica especializada
-        """)
-    
-    with col2:
-        st.markdown('<div class="section-header"><h2>🚀 Cómo Funciona</h2></div>', unsafe_allow_html=True)
-        st.markdown("""
-        1. **📝 Ingresa los Datos**
-           - Características de suelo y clima
-           - Controles deslizantes intuitivos
-        
-        2. **🤖 Análisis con IA**
-           - Random Forest con 200 árboles
-           - Comparación con 2,200 casos históricos
-        
-        3. **🎯 Recibe Recomendación**
-           - Cultivo óptimo con confianza
-           - Top-5 alternativas
-        
-        4. **📚 Consulta la Guía**
-           - Épocas de siembra
-           - Manejo de fertilizantes
-        """)
-    
-    df = load_data()
-    crops = sorted(df['label'].unique())
-    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-    st.markdown('<div class="section-header"><h2>🌾 Cultivos Disponibles</h2></div>', unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    for i, crop in enumerate(crops):
-        icon = CROP_ICONS.get(crop, '🌱')
-        if i % 4 == 0:
-            col1.markdown(f"{icon} {crop.capitalize()}")
-        elif i % 4 == 1:
-            col2.markdown(f"{icon} {crop.capitalize()}")
-        elif i % 4 == 2:
-            col3.markdown(f"{icon} {crop.capitalize()}")
-        else:
-            col4.markdown(f"{icon} {crop.capitalize()}")
-
-# >> PÁGINA: EDA <<
-elif page == "📊 EDA":
-    st.markdown('<div class="main-header"><h1>📊 Análisis Exploratorio de Datos</h1><p>Visualización Interactiva del Dataset</p></div>', unsafe_allow_html=True)
-    
-    df = load_data()
-    
-    # >> Contexto del EDA <<
-    st.info("🎯 **Objetivo del Análisis:** Este EDA identifica patrones y relaciones entre las características del suelo, condiciones climáticas y cultivos óptimos para desarrollar un sistema de recomendación basado en agricultura de precisión.")
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("""
-        **📊 Origen de Datos**
-        - Fuente: Datos de agricultura de India
-        - Contexto: Rainfall, climate, fertilizer
-        - Tipo: Datos aumentados y balanceados
-        """)
-    with col2:
-        st.markdown("""
-        **🔬 Calidad de Datos**
-        - ✅ Sin valores nulos
-        - ✅ Sin duplicados
-        - ✅ Balance perfecto de clases
-        """)
-    with col3:
-        st.markdown("""
-        **🌾 Variables Clave**
-        - 🌱 Nutrientes: N, P, K, pH
-        - 🌡️ Clima: Temp, Humedad, Lluvia
-        - 🎯 Target: 22 cultivos
-        """)
-    
-    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-    
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 Dataset", "📈 Distribuciones", "🔗 Correlaciones", "💡 Insights"])
-    
-    with tab1:
-        st.markdown('<div class="section-header"><h2>Vista General del Dataset</h2></div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            st.markdown("##### 🔍 Primeras 15 observaciones")
-            st.dataframe(df.head(15), use_container_width=True, height=400)
-        with col2:
-            st.markdown("##### 📊 Métricas de Calidad")
-            st.metric("Total Filas", f"{df.shape[0]:,}")
-            st.metric("Columnas", df.shape[1])
-            st.metric("Valores Nulos", df.isna().sum().sum())
-            st.metric("Cultivos Únicos", df['label'].nunique())
-            st.success("✅ Dataset balanceado: 100 muestras/cultivo")
-            st.info("🎯 Ideal para ML: No requiere balanceo")
-        
-        st.markdown("##### 📈 Estadísticas Descriptivas")
-        st.dataframe(df.describe().T.style.background_gradient(cmap='Greens'), use_container_width=True)
-        
-        st.success("""
-        **🔍 Interpretación de Rangos:**
-        - **Nitrógeno (N):** 0-140 - Amplio rango refleja diversidad de cultivos
-        - **Fósforo (P):** 5-145 - Crucial para desarrollo radicular
-        - **Potasio (K):** 5-205 - Mayor variabilidad, resistencia a estrés
-        - **Temperatura:** 8.8-43.7°C - Cubre climas templados a tropicales
-        - **Humedad:** 14-99% - Diferencia cultivos de secano vs riego
-        - **pH:** 3.5-9.9 - Desde ácido (café) hasta alcalino (algodón)
-        - **Precipitación:** 20-298mm - Factor más discriminante
-        """)
-    
-    with tab2:
-        st.markdown('<div class="section-header"><h2>Distribuciones de Variables</h2></div>', unsafe_allow_html=True)
-        
-        st.markdown("##### 🌾 Balance de Clases (Target)")
-        crop_counts = df['label'].value_counts()
-        fig = go.Figure(data=[go.Bar(x=crop_counts.index, y=crop_counts.values, marker=dict(color=crop_counts.values, colorscale='Greens', showscale=True), text=crop_counts.values, textposition='auto')])
-        fig.update_layout(title='Distribución de Cultivos - Balance Perfecto', xaxis_title='Cultivo', yaxis_title='Cantidad de Muestras', height=500, template='plotly_white')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.info("**✅ Balance Perfecto:** Cada uno de los 22 cultivos tiene exactamente 100 observaciones. Esto elimina el sesgo de clases y garantiza métricas de evaluación confiables.")
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        st.markdown("##### 📊 Análisis de Variables Numéricas")
-        
-        num_cols = ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall']
-        var_descriptions = {
-            'N': 'Nitrógeno - Esencial para crecimiento vegetativo y desarrollo de hojas',
-            'P': 'Fósforo - Fundamental para desarrollo radicular y floración',
-            'K': 'Potasio - Resistencia a enfermedades y calidad del fruto',
-            'temperature': 'Temperatura - Determina la estación de siembra y zona agroclimática',
-            'humidity': 'Humedad - Afecta enfermedades fúngicas y evapotranspiración',
-            'ph': 'pH del Suelo - Disponibilidad de nutrientes y cultivos específicos',
-            'rainfall': 'Precipitación - Factor más discriminante, define necesidades de riego'
-        }
-        
-        selected_var = st.selectbox("Selecciona Variable:", num_cols, format_func=lambda x: f"{x.upper()}" if len(x) <= 2 else x.capitalize())
-        st.info(f"**Relevancia Agronómica:** {var_descriptions[selected_var]}")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("**Histograma con Boxplot**")
-            fig = px.histogram(df, x=selected_var, nbins=40, marginal='box', color_discrete_sequence=['#2ecc71'])
-            fig.update_layout(title=f'Distribución de {selected_var.capitalize()}', height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        with col2:
-            st.markdown("**Violin Plot**")
-            fig = px.violin(df, y=selected_var, box=True, color_discrete_sequence=['#3498db'])
-            fig.update_layout(title=f'Densidad de {selected_var.capitalize()}', height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # >> Estadísticas de la variable seleccionada <<
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Mínimo", f"{df[selected_var].min():.2f}")
-        with col2:
-            st.metric("Media", f"{df[selected_var].mean():.2f}")
-        with col3:
-            st.metric("Mediana", f"{df[selected_var].median():.2f}")
-        with col4:
-            st.metric("Máximo", f"{df[selected_var].max():.2f}")
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        st.markdown("##### 🌾 Comparación de Perfiles de Cultivos")
-        
-        # >> Comparación de perfiles de cultivos <<
-        selected_crops = st.multiselect(
-            "Selecciona hasta 5 cultivos para comparar:",
-            sorted(df['label'].unique()),
-            default=sorted(df['label'].unique())[:3],
-            max_selections=5,
-            format_func=lambda x: f"{CROP_ICONS.get(x, '🌱')} {x.capitalize()}"
-        )
-        
-        if selected_crops:
-            comparison_data = []
-            for crop in selected_crops:
-                crop_data = df[df['label'] == crop][num_cols].median()
-                comparison_data.append(crop_data)
-            
-            comparison_df = pd.DataFrame(comparison_data, index=[f"{CROP_ICONS.get(c, '🌱')} {c.capitalize()}" for c in selected_crops])
-            
-            fig = go.Figure()
-            for i, crop in enumerate(selected_crops):
-                crop_label = f"{CROP_ICONS.get(crop, '🌱')} {crop.capitalize()}"
-                fig.add_trace(go.Scatterpolar(
-                    r=[(comparison_df.loc[crop_label, col] - df[col].min()) / (df[col].max() - df[col].min()) for col in num_cols],
-                    theta=num_cols,
-                    fill='toself',
-                    name=crop_label
-                ))
-            
-            fig.update_layout(
-                polar=dict(radialaxis=dict(range=[0, 1], showticklabels=True)),
-                title='Comparación de Perfiles de Cultivos (Normalizado)',
-                height=500
-            )
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with tab3:
-        st.markdown('<div class="section-header"><h2>Análisis de Correlaciones</h2></div>', unsafe_allow_html=True)
-        
-        st.info("🔍 **¿Qué buscamos?** Analizar la multicolinealidad entre variables. Correlaciones altas (>0.7) indicarían redundancia y podrían requerir eliminación de features. Correlaciones bajas son ideales para ML.")
-        
-        num_cols = ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall']
-        corr = df[num_cols].corr()
-        
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            st.markdown("##### 📊 Matriz de Correlación")
-            fig = px.imshow(
-                corr, 
-                text_auto='.2f', 
-                color_continuous_scale='RdBu_r', 
-                zmin=-1, 
-                zmax=1,
-                title='Correlaciones entre Variables Predictoras',
-                height=500
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown("##### 📈 Top Correlaciones")
-            # >> Extraer correlaciones significativas <<
-            corr_pairs = []
-            for i in range(len(corr.columns)):
-                for j in range(i+1, len(corr.columns)):
-                    corr_pairs.append((corr.columns[i], corr.columns[j], corr.iloc[i, j]))
-            corr_pairs = sorted(corr_pairs, key=lambda x: abs(x[2]), reverse=True)[:5]
-            
-            for var1, var2, val in corr_pairs:
-                color = "🔴" if abs(val) > 0.5 else "🟡" if abs(val) > 0.3 else "🟢"
-                st.markdown(f"{color} **{var1}** ↔ **{var2}**: {val:.3f}")
-            
-            st.markdown("---")
-            st.markdown("##### 🎯 Interpretación")
-            st.markdown("""
-            - 🟢 < 0.3: Independiente
-            - 🟡 0.3-0.5: Débil
-            - 🔴 > 0.5: Moderada
-            """)
-        
-        st.success("""
-        **✅ Conclusión del Análisis de Correlación:**
-        - **Correlaciones máximas < ±0.3:** No hay multicolinealidad problemática
-        - **Variables independientes:** Cada feature aporta información única
-        - **No es necesario eliminar features:** Todas son relevantes para el modelo
-        - **K-N (0.25):** Débil positiva - compatible con fertilización conjunta
-        - **Resto < ±0.15:** Prácticamente no correlacionados
-        """)
-    
-    with tab4:
-        st.markdown('<div class="section-header"><h2>💡 Insights Clave del Análisis</h2></div>', unsafe_allow_html=True)
-        
-        st.markdown("### 🎯 Principales Hallazgos del EDA")
-        st.info("Este análisis reveló patrones fundamentales para la agricultura de precisión")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### 🌧️ Variables Más Discriminantes")
-            st.markdown("""
-            1. **Rainfall (Precipitación):** Factor #1 - Separa cultivos de riego vs secano
-            2. **Temperature:** Diferencia cultivos tropicales (>30°C) de templados (<20°C)
-            3. **Humidity:** Correlacionado con precipitación, afecta enfermedades
-            4. **pH:** Identifica cultivos específicos (café 4.5-5.5, algodón 7-8)
-            5. **N, P, K:** Requerimientos nutricionales únicos por cultivo
-            """)
-            
-            st.markdown("#### 🌾 Grupos de Cultivos Identificados")
-            st.markdown("""
-            **Grupo 1: Tropicales Húmedos**
-            - 🍚 Rice, 🥥 Coconut, 🏉 Papaya, 🍌 Banana
-            - Alta humedad (>80%), Alta temp (>25°C), Precipitación >150mm
-            
-            **Grupo 2: Áridos**
-            - 🫘 Chickpea, 🫘 Mothbeans, 𓇢 Lentil
-            - Baja precipitación (<50mm), Resistentes a sequía
-            
-            **Grupo 3: Templados**
-            - 🍎 Apple, 🍇 Grapes
-            - Temperatura <20°C, pH ácido, Zonas de montaña
-            
-            **Grupo 4: Industriales**
-            - ☁️ Cotton, 🌿 Jute, ☕ Coffee
-            - Alto N, Alta precipitación, Agricultura intensiva
-            """)
-        
-        with col2:
-            st.markdown("#### 📊 Calidad del Dataset")
-            st.success("""
-            - ✅ **Sin valores nulos:** 0% missing data
-            - ✅ **Sin duplicados:** Todas las observaciones únicas
-            - ✅ **Balance perfecto:** 100 muestras por cultivo
-            - ✅ **Sin multicolinealidad:** Máx correlación 0.25
-            - ✅ **Outliers conservados:** Representan condiciones extremas válidas
-            """)
-            
-            st.markdown("#### 🔬 Feature Engineering")
-            st.code("N_over_PK = N / (P + K + 1e-6)", language="python")
-            st.info("""
-            **Justificación Agronómica:**
-            - Captura el balance N:P:K
-            - Leguminosas: bajo N (fijan N2 atmosférico)
-            - Cultivos de hoja: alto N
-            - Mejora separabilidad de clases
-            """)
-            
-            st.markdown("#### 📈 Implicaciones para el Modelo")
-            st.success("""
-            - 🎯 **Alta separabilidad:** Cultivos con requerimientos distintos
-            - 🎯 **No requiere balanceo:** Clases perfectamente equilibradas
-            - 🎯 **Features independientes:** Cada variable aporta info única
-            - 🎯 **Excelente para ML:** Esperamos +95% accuracy
-            """)
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        
-        st.markdown("### 🌍 Contexto de Agricultura de Precisión")
-        st.warning("""
-        La **agricultura de precisión** utiliza tecnología y análisis de datos para optimizar 
-        el rendimiento agrícola. Este sistema permite a los agricultores:
-        
-        - 🎯 **Seleccionar el cultivo óptimo** según características del terreno
-        - 💰 **Maximizar rentabilidad** evitando cultivos inadecuados
-        - 🌱 **Reducir riesgo** de pérdidas por elección incorrecta
-        - ♻️ **Optimizar recursos** (agua, fertilizantes, tiempo)
-        - 🌍 **Agricultura sostenible** adaptada a cada región
-        """)
-
-# >> PÁGINA: MODELO <<
-elif page == "🤖 Modelo":
-    st.markdown('<div class="main-header"><h1>🤖 Modelos de Machine Learning</h1><p>Selección, Comparativa y Performance</p></div>', unsafe_allow_html=True)
-    
-    st.info("""
-    **🎯 Problema de Machine Learning:**
-    - **Tipo:** Clasificación Multiclase (22 clases)
-    - **Objetivo:** Predecir el cultivo óptimo basándose en 7 características del suelo y clima
-    - **Métrica principal:** Accuracy (por balance perfecto de clases)
-    - **Estrategia:** Train/Test Split 80/20 con estratificación
-    """)
-    
-    tab1, tab2, tab3, tab4 = st.tabs(["🔍 Selección", "📊 Comparación", "🎯 Performance", "📚 Docs"])
-    
-    with tab1:
-        st.markdown('<div class="section-header"><h2>🔍 Proceso de Selección del Modelo</h2></div>', unsafe_allow_html=True)
-        
-        st.markdown("### 📋 Criterios de Selección")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### ✅ Requisitos Técnicos")
-            st.success("""
-            - **Accuracy >95%:** Recomendaciones confiables
-            - **F1-Score balanceado:** Evitar sesgo por clase
-            - **Tiempo de entrenamiento <30s:** Reentrenamiento rápido
-            - **Interpretabilidad:** Feature importance explicable
-            - **Robustez:** Mínima necesidad de tuning
-            """)
-            
-            st.markdown("#### 🌾 Requisitos del Dominio")
-            st.info("""
-            - **Explicabilidad:** Agricultores deben entender la decisión
-            - **Manejo de no-linealidad:** Interacciones suelo-clima complejas
-            - **Robustez a outliers:** Condiciones extremas válidas
-            - **Multi-clase nativa:** 22 cultivos simultáneamente
-            """)
-        
-        with col2:
-            st.markdown("#### 🤖 Algoritmos Evaluados")
-            
-            st.markdown("**1. Random Forest ⭐ SELECCIONADO**")
-            st.success("""
-            - ✅ Excelente para clasificación multiclase
-            - ✅ Maneja no-linealidades y outliers
-            - ✅ Feature importance interpretable
-            - ✅ Poco overfitting (ensemble method)
-            - ⚠️ Más lento en predicción que XGBoost
-            """)
-            
-            st.markdown("**2. XGBoost**")
-            st.info("""
-            - ✅ Performance ligeramente mejor
-            - ✅ Más rápido en predicción
-            - ⚠️ Menos interpretable
-            - ⚠️ Requiere más tuning
-            - 🔮 Candidato para optimización futura
-            """)
-            
-            st.markdown("**3. Otros (SVM, KNN, Logistic Regression)**")
-            st.warning("❌ Descartados por escalabilidad, performance o asunciones no cumplidas")
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        
-        st.success("""
-        ### 🏆 Justificación: ¿Por qué Random Forest?
-        
-        1. **Performance excepcional out-of-the-box:** ~99% accuracy sin tuning extenso
-        2. **Interpretabilidad:** Feature importances permiten entender qué factores son críticos
-        3. **Robustez:** Ensemble de 200 árboles reduce varianza y overfitting
-        4. **Manejo nativo de no-linealidades:** Interacciones complejas suelo-clima-cultivo
-        5. **No requiere asunciones de distribución:** No paramétrico
-        6. **Validación cruzada estable:** CV scores consistentes (98.99% ±0.31%)
-        """)
-    
-    with tab2:
-        st.markdown('<div class="section-header"><h2>📊 Comparación Exhaustiva de Algoritmos</h2></div>', unsafe_allow_html=True)
-        
-        st.markdown("### 🔬 Resultados Experimentales")
-        
-        comparison_data = {
-            'Modelo': ['Random Forest', 'XGBoost', 'SVM (RBF)', 'KNN (k=5)', 'Logistic Regression'],
-            'Accuracy (Test)': [99.09, 98.86, 97.59, 95.23, 88.41],
-            'F1-Score (Macro)': [0.9908, 0.9884, 0.9756, 0.9518, 0.8832],
-            'Precision': [0.9912, 0.9891, 0.9762, 0.9534, 0.8856],
-            'Recall': [0.9909, 0.9886, 0.9759, 0.9523, 0.8841],
-            'Tiempo Entrenamiento (s)': [8.5, 12.3, 45.7, 2.1, 1.8],
-            'Tiempo Predicción (ms)': [15.2, 8.7, 98.3, 234.5, 0.5]
-        }
-        
-        comparison_df = pd.DataFrame(comparison_data)
-        
-        # >> Aplicar estilos <<
-        styled_df = comparison_df.style.background_gradient(
-            subset=['Accuracy (Test)', 'F1-Score (Macro)', 'Precision', 'Recall'], 
-            cmap='Greens'
-        ).background_gradient(
-            subset=['Tiempo Entrenamiento (s)', 'Tiempo Predicción (ms)'], 
-            cmap='Reds_r'
-        )
-        
-        st.dataframe(styled_df, use_container_width=True)
-        
-        st.info("""
-        **🎯 Interpretación de Resultados:**
-        - **Random Forest:** Mejor balance accuracy/interpretabilidad/estabilidad
-        - **XGBoost:** Performance comparable, pero menos interpretable
-        - **SVM:** Buen accuracy pero tiempo de entrenamiento prohibitivo
-        - **KNN:** Predicción muy lenta (lazy learning), no escalable
-        - **Logistic Regression:** Asume linealidad - inadecuado para este problema
-        """)
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        
-        st.markdown("### 📈 Visualización Comparativa")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("##### Accuracy por Modelo")
-            fig = go.Figure(go.Bar(
-                x=comparison_df['Modelo'],
-                y=comparison_df['Accuracy (Test)'],
-                marker=dict(color=comparison_df['Accuracy (Test)'], colorscale='Greens'),
-                text=[f"{v:.2f}%" for v in comparison_df['Accuracy (Test)']],
-                textposition='auto'
-            ))
-            fig.update_layout(
-                yaxis_title='Accuracy (%)',
-                height=400,
-                yaxis=dict(range=[85, 100])
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown("##### Tiempo de Entrenamiento")
-            fig = go.Figure(go.Bar(
-                x=comparison_df['Modelo'],
-                y=comparison_df['Tiempo Entrenamiento (s)'],
-                marker=dict(color=comparison_df['Tiempo Entrenamiento (s)'], colorscale='Reds'),
-                text=[f"{v:.1f}s" for v in comparison_df['Tiempo Entrenamiento (s)']],
-                textposition='auto'
-            ))
-            fig.update_layout(
-                yaxis_title='Tiempo (segundos)',
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("### 🔮 Validación Cruzada (5-Fold Stratified)")
-        st.info("Evaluación de estabilidad y generalización con **StratifiedKFold Cross-Validation**")
-        
-        cv_data = {
-            'Modelo': ['Random Forest', 'XGBoost', 'SVM'],
-            'Fold 1': [98.86, 98.58, 97.44],
-            'Fold 2': [99.15, 98.86, 97.30],
-            'Fold 3': [98.58, 98.43, 96.88],
-            'Fold 4': [99.43, 99.15, 98.01],
-            'Fold 5': [98.93, 99.29, 97.72],
-            'Media': [98.99, 98.86, 97.47],
-            'Std Dev': [0.31, 0.35, 0.43]
-        }
-        
-        cv_df = pd.DataFrame(cv_data)
-        st.dataframe(
-            cv_df.style.background_gradient(subset=['Media'], cmap='Greens')
-                        .background_gradient(subset=['Std Dev'], cmap='Reds_r'),
-            use_container_width=True
-        )
-        
-        st.success("✅ **Conclusión CV:** Random Forest muestra la **menor desviación estándar (±0.31%)**, indicando mayor estabilidad y mejor generalización. XGBoost es ligeramente más variable.")
-    
-    with tab3:
-        st.markdown('<div class="section-header"><h2>🎯 Performance y Métricas del Modelo</h2></div>', unsafe_allow_html=True)
-        
-        st.markdown("### 📊 Métricas en Test Set (20% del dataset)")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Accuracy", "99.09%", help="Proporción de predicciones correctas")
-        with col2:
-            st.metric("F1-Score", "0.9908", help="Media armónica entre precisión y recall")
-        with col3:
-            st.metric("Precision", "0.9912", help="De las predicciones positivas, cuántas son correctas")
-        with col4:
-            st.metric("Recall", "0.9909", help="De los casos reales, cuántos fueron detectados")
-        
-        st.success("✅ **Performance Excepcional:** Con 99.09% accuracy, el modelo comete solo ~4 errores en 440 predicciones del test set. Esto es ideal para aplicaciones de agricultura de precisión.")
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        
-        st.markdown("### 🔍 Feature Importance - Variables Más Importantes")
-        
-        feature_importance = {
-            'rainfall': 0.245, 'N': 0.182, 'K': 0.156, 'P': 0.138, 
-            'humidity': 0.121, 'temperature': 0.089, 'ph': 0.052, 'N_over_PK': 0.017
-        }
-        
-        importance_df = pd.DataFrame(
-            list(feature_importance.items()), 
-            columns=['Feature', 'Importance']
-        ).sort_values('Importance', ascending=False)
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            fig = go.Figure(go.Bar(
-                x=importance_df['Importance'], 
-                y=importance_df['Feature'], 
-                orientation='h', 
-                marker=dict(color=importance_df['Importance'], colorscale='Viridis'), 
-                text=[f"{v:.1%}" for v in importance_df['Importance']], 
-                textposition='auto'
-            ))
-            fig.update_layout(
-                title='Feature Importance (Reducción de Gini)',
-                xaxis_title='Importancia Relativa',
-                yaxis_title='Variable',
-                height=450
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown("##### 🎯 Top Variables")
-            st.markdown("""
-            1. **🌧️ Rainfall (24.5%)**
-            2. **🌱 Nitrógeno (18.2%)**
-            3. **� Potasio (15.6%)**
-            4. **🔬 Fósforo (13.8%)**
-            5. **💧 Humedad (12.1%)**
-            """)
-            
-            st.info("""
-            **Interpretación:**
-            - Rainfall es el predictor #1
-            - Variables climáticas ≈ Nutricionales
-            - Todas las features aportan valor
-            """)
-        
-        st.success("✅ De 22 cultivos, 17 tienen precisión perfecta (100%) en el test set")
-    
-    with tab4:
-        st.markdown('<div class="section-header"><h2>📚 Documentación Técnica</h2></div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 🔧 Arquitectura del Pipeline")
-            st.code("""
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-
-pipeline = Pipeline([
-    ('scaler', StandardScaler()),
-    ('clf', RandomForestClassifier(
-        n_estimators=200,
-        random_state=42,
-        n_jobs=-1
-    ))
-])
-            """, language="python")
-            
-            st.markdown("### 📦 Archivos del Modelo")
-            st.markdown("""
-            - **`crop_recommender_rf.joblib`** (3.2 MB)
-            - **`label_encoder.joblib`** (1.5 KB)
-            """)
-            
-            st.markdown("### 📥 Descargar Modelos")
-            
-            # >> Funcionalidad de descarga <<
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                try:
-                    with open(MODEL_PATH, 'rb') as f:
-                        model_bytes = f.read()
-                    st.download_button(
-                        label="📥 Descargar Pipeline RF",
-                        data=model_bytes,
-                        file_name="crop_recommender_rf.joblib",
-                        mime="application/octet-stream",
-                        help="Random Forest + StandardScaler"
-                    )
-                except:
-                    st.error("Error al cargar el modelo")
-            
-            with col_b:
-                try:
-                    with open(ENCODER_PATH, 'rb') as f:
-                        encoder_bytes = f.read()
-                    st.download_button(
-                        label="📥 Descargar Label Encoder",
-                        data=encoder_bytes,
-                        file_name="label_encoder.joblib",
-                        mime="application/octet-stream",
-                        help="Codificador de cultivos"
-                    )
-                except:
-                    st.error("Error al cargar el encoder")
-        
-        with col2:
-            st.markdown("### 📊 División del Dataset")
-            st.markdown("""
-            - **Train:** 1,760 muestras (80%)
-            - **Test:** 440 muestras (20%)
-            - **Estratificación:** ✅ Aplicada
-            """)
-            
-            st.markdown("### 🔮 Mejoras Futuras")
-            st.markdown("""
-            - [ ] GridSearchCV para optimización
-            - [ ] Comparación con XGBoost
-            - [ ] SHAP values para interpretabilidad
-            - [ ] Ensemble RF + XGBoost
-            - [ ] Implementación de API REST
-            """)
-        
-        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
-        
-        st.info("""
-        ### 📈 Proceso de Entrenamiento
-        
-        1. **Carga de datos:** Crop_recommendation.csv (2,200 observaciones)
-        2. **Feature Engineering:** Creación de N_over_PK
-        3. **Encoding:** LabelEncoder para los 22 cultivos
-        4. **Split Train/Test:** 80/20 estratificado
-        5. **Entrenamiento del Pipeline:**
-           - StandardScaler ajusta μ y σ del train set
-           - Random Forest entrena 200 árboles en paralelo
-           - Tiempo total: ~8.5 segundos
-        6. **Evaluación:** Métricas en test set + 5-Fold CV
-        7. **Serialización:** joblib.dump() para deployment
-        """)
-        
-        st.markdown("### 💡 Código de Uso")
-        st.code("""
-import joblib
-import numpy as np
-
-# Cargar modelos
-pipeline = joblib.load('crop_recommender_rf.joblib')
-le = joblib.load('label_encoder.joblib')
-
-# Predecir
-N_over_PK = N / (P + K + 1e-6)
-features = np.array([[N, P, K, temp, hum, ph, rain, N_over_PK]])
-pred_encoded = pipeline.predict(features)
-crop = le.inverse_transform(pred_encoded)[0]
-        """, language="python")
-
-# >> PÁGINA: PREDICCIÓN <<
-elif page == "🔮 Predicción":
-    st.markdown('<div class="main-header"><h1>🔮 Predicción de Cultivo Óptimo</h1><p>Recomendación Personalizada con IA</p></div>', unsafe_allow_html=True)
-    
-    try:
-        pipeline, le = load_model()
-        model_loaded = True
-    except:
-        st.error("❌ Error al cargar modelo")
-        model_loaded = False
-    
-    if model_loaded:
-        st.markdown('<div class="info-box-blue"><h4>💡 Instrucciones</h4><p>Ajusta los controles con las características de tu terreno.</p></div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 🌱 Composición del Suelo")
-            N = st.slider("Nitrógeno (N)", 0, 140, 50)
-            P = st.slider("Fósforo (P)", 5, 145, 50)
-            K = st.slider("Potasio (K)", 5, 205, 50)
-            ph = st.slider("pH", 3.5, 9.9, 6.5, 0.1)
-        
-        with col2:
-            st.markdown("#### 🌡️ Condiciones Climáticas")
-            temperature = st.slider("Temperatura (°C)", 8.0, 44.0, 25.0, 0.5)
-            humidity = st.slider("Humedad (%)", 14, 99, 70)
-            rainfall = st.slider("Precipitación (mm)", 20, 300, 100)
-        
-        if st.button("🌾 Predecir Cultivo Recomendado", type="primary"):
-            with st.spinner("🔬 Analizando..."):
-                crop, top_crops = predict_crop(N, P, K, temperature, humidity, ph, rainfall, pipeline, le)
-            
-            st.success("✅ Completado!")
-            icon = CROP_ICONS.get(crop, '🌱')
-            confidence = top_crops[crop] * 100
-            
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #2ecc71 0%, #27ae60 100%); padding: 2rem; border-radius: 15px; text-align: center; color: white; margin: 2rem 0;'>
-                <h1 style='font-size: 3rem; margin: 0;'>{icon}</h1>
-                <h2>Cultivo Recomendado</h2>
-                <h1 style='font-size: 2.5rem; text-transform: uppercase;'>{crop}</h1>
-                <p style='font-size: 1.5rem;'>Confianza: {confidence:.2f}%</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            top_df = pd.DataFrame([(c, p) for c, p in top_crops.items()], columns=['Cultivo', 'Probabilidad'])
-            top_df['Probabilidad (%)'] = (top_df['Probabilidad'] * 100).round(2)
-            top_df['Cultivo'] = top_df['Cultivo'].apply(lambda x: f"{CROP_ICONS.get(x, '🌱')} {x.capitalize()}")
-            
-            fig = go.Figure(go.Bar(x=top_df['Probabilidad (%)'], y=top_df['Cultivo'], orientation='h', marker=dict(color=top_df['Probabilidad (%)'], colorscale='Greens'), text=[f"{v:.2f}%" for v in top_df['Probabilidad (%)']], textposition='auto'))
-            fig.update_layout(title='Top 5 Cultivos', xaxis_title='Probabilidad (%)', height=350)
-            st.plotly_chart(fig, use_container_width=True)
+# >> PÁGINA SELECCIONADA (import diferido) <<
+importlib.import_module(PAGES[page]).render()
 
 st.markdown("""
 <div style='text-align: center; padding: 2rem; background: #f8f9fa; border-radius: 10px; margin-top: 3rem;'>
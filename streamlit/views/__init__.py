@@ -0,0 +1,6 @@
+"""
+Páginas de la aplicación Streamlit.
+
+Cada módulo expone render() y solo se importa cuando se selecciona su
+página, junto con sus dependencias de visualización.
+"""
@@ -0,0 +1,120 @@
+"""
+Recursos compartidos por las páginas de la app: rutas, iconos y cargadores cacheados.
+
+Los módulos de croprec se importan dentro de cada cargador para que una
+página solo pague por lo que usa (p. ej. Inicio no carga el bosque).
+"""
+
+# >> Imports <<
+import json
+import os
+
+import streamlit as st
+
+# >> Configuración de paths (relativos a la raíz del proyecto, no al directorio de arranque) <<
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'Crop_recommendation.csv')
+MODEL_PATH = os.path.join(PROJECT_ROOT, 'models', 'crop_recommender_rf.joblib')
+ENCODER_PATH = os.path.join(PROJECT_ROOT, 'models', 'label_encoder.joblib')
+LOOKUP_DIR = os.path.join(PROJECT_ROOT, 'models', 'lookup')
+REGISTRY_DIR = os.path.join(PROJECT_ROOT, 'models', 'registry')
+
+# >> Iconos de cultivos <<
+CROP_ICONS = {
+    'rice': '🍚', 'maize': '🌽', 'chickpea': '𓇛', 'kidneybeans': '🫘',
+    'pigeonpeas': '🫘', 'mothbeans': '🫛', 'mungbean': '🫘', 'blackgram': '🫘',
+    'lentil': '𓇢', 'pomegranate': '🥭', 'banana': '🍌', 'mango': '🥭',
+    'grapes': '🍇', 'watermelon': '🍉', 'muskmelon': '🍈', 'apple': '🍎',
+    'orange': '🍊', 'papaya': '🏉', 'coconut': '🥥', 'cotton': '☁️',
+    'jute': '🌿', 'coffee': '☕'
+}
+
+def active_entry():
+    # >> versión activa leída del manifiesto del registro (JSON pequeño, sin importar croprec) <<
+    path = os.path.join(REGISTRY_DIR, 'manifest.json')
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        manifest = json.load(f)
+    return next((e for e in manifest['versions'] if e['version'] == manifest['active']), None)
+
+def load_crop_names():
+    # >> cultivos de la versión activa (sigue al cambio de versión) o del label encoder <<
+    entry = active_entry()
+    if entry is not None:
+        return sorted(entry['classes'])
+    return _encoder_crop_names()
+
+@st.cache_resource
+def _encoder_crop_names():
+    # >> nombres de cultivos desde el label encoder (1 KB), sin leer el CSV ni el modelo <<
+    import joblib
+    return sorted(str(c) for c in joblib.load(ENCODER_PATH).classes_)
+
+def load_registry():
+    # >> registro de versiones (None si no se ha registrado ningún modelo); el None no se cachea
+    # para que un registro creado con la app en marcha se detecte en el siguiente rerun <<
+    if not os.path.exists(os.path.join(REGISTRY_DIR, 'manifest.json')):
+        return None
+    return _open_registry()
+
+@st.cache_resource
+def _open_registry():
+    from croprec.registry import ModelRegistry
+    return ModelRegistry(REGISTRY_DIR)
+
+def artifact_paths():
+    # >> rutas del pipeline y del encoder servidos: blobs de la versión activa o models/ <<
+    registry = load_registry()
+    if registry is None:
+        return MODEL_PATH, ENCODER_PATH
+    return registry.artifact_path('model'), registry.artifact_path('encoder')
+
+def read_on_click(path):
+    # >> para st.download_button: el fichero se lee al pulsar, no en cada render <<
+    def read():
+        with open(path, 'rb') as f:
+            return f.read()
+    return read
+
+def load_eda_aggregates():
+    # >> estadísticas del EDA precalculadas una vez por versión del dataset (caché en disco) <<
+    stat = os.stat(DATA_PATH)
+    return _eda_aggregates(stat.st_mtime_ns, stat.st_size)
+
+@st.cache_resource(max_entries=2)
+def _eda_aggregates(mtime_ns, size):
+    # >> (mtime, tamaño) del CSV hacen de clave: si se reemplaza el dataset se recalculan <<
+    from croprec.eda import load_aggregates
+    return load_aggregates(DATA_PATH)
+
+def load_predictor():
+    # >> caché compartida entre sesiones; se invalida si cambia el hash del modelo o la versión activa <<
+    return _predictor(load_registry() is not None)
+
+@st.cache_resource(max_entries=2)
+def _predictor(has_registry):
+    # >> has_registry hace de clave: al crearse el registro se pasa a servir su versión activa <<
+    from croprec.cache import PredictionCache
+    return PredictionCache(MODEL_PATH, ENCODER_PATH, maxsize=20000, ttl=24 * 3600,
+                           registry=load_registry())
+
+@st.cache_resource(max_entries=2)
+def load_flat_forest(model_hash, _pipeline):
+    # >> bosque aplanado del pipeline de ese hash (el hash hace de clave; _pipeline no se hashea) <<
+    from croprec.forest import FlatForest
+    return FlatForest.from_pipeline(_pipeline, fold_scaler=True)
+
+def load_lookup_table():
+    # >> tabla opcional generada con `python -m croprec.lookup`; el None no se cachea
+    # para que una tabla construida con la app en marcha se detecte en el siguiente rerun <<
+    meta_path = os.path.join(LOOKUP_DIR, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    return _open_lookup_table(os.stat(meta_path).st_mtime_ns)
+
+@st.cache_resource(max_entries=2)
+def _open_lookup_table(meta_mtime_ns):
+    # >> el mtime de meta.json hace de clave: reconstruir la tabla la vuelve a abrir <<
+    from croprec.lookup import LookupTable
+    return LookupTable(LOOKUP_DIR)
@@ -0,0 +1,289 @@
+"""
+Página de EDA: estadísticas y gráficas desde los agregados precalculados.
+"""
+
+# >> Imports <<
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from croprec.plots import histogram_box_figure, violin_figure
+from views.common import CROP_ICONS, load_eda_aggregates
+
+
+def render():
+    st.markdown('<div class="main-header"><h1>📊 Análisis Exploratorio de Datos</h1><p>Visualización Interactiva del Dataset</p></div>', unsafe_allow_html=True)
+    
+    agg = load_eda_aggregates()
+    
+    # >> Contexto del EDA <<
+    st.info("🎯 **Objetivo del Análisis:** Este EDA identifica patrones y relaciones entre las características del suelo, condiciones climáticas y cultivos óptimos para desarrollar un sistema de recomendación basado en agricultura de precisión.")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        **📊 Origen de Datos**
+        - Fuente: Datos de agricultura de India
+        - Contexto: Rainfall, climate, fertilizer
+        - Tipo: Datos aumentados y balanceados
+        """)
+    with col2:
+        st.markdown("""
+        **🔬 Calidad de Datos**
+        - ✅ Sin valores nulos
+        - ✅ Sin duplicados
+        - ✅ Balance perfecto de clases
+        """)
+    with col3:
+        st.markdown("""
+        **🌾 Variables Clave**
+        - 🌱 Nutrientes: N, P, K, pH
+        - 🌡️ Clima: Temp, Humedad, Lluvia
+        - 🎯 Target: 22 cultivos
+        """)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Dataset", "📈 Distribuciones", "🔗 Correlaciones", "💡 Insights"])
+    
+    with tab1:
+        st.markdown('<div class="section-header"><h2>Vista General del Dataset</h2></div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("##### 🔍 Primeras 15 observaciones")
+            st.dataframe(agg['head'], use_container_width=True, height=400)
+        with col2:
+            st.markdown("##### 📊 Métricas de Calidad")
+            st.metric("Total Filas", f"{agg['shape'][0]:,}")
+            st.metric("Columnas", agg['shape'][1])
+            st.metric("Valores Nulos", agg['null_count'])
+            st.metric("Cultivos Únicos", agg['n_labels'])
+            st.success("✅ Dataset balanceado: 100 muestras/cultivo")
+            st.info("🎯 Ideal para ML: No requiere balanceo")
+        
+        st.markdown("##### 📈 Estadísticas Descriptivas")
+        st.dataframe(agg['describe'].style.background_gradient(cmap='Greens'), use_container_width=True)
+        
+        st.success("""
+        **🔍 Interpretación de Rangos:**
+        - **Nitrógeno (N):** 0-140 - Amplio rango refleja diversidad de cultivos
+        - **Fósforo (P):** 5-145 - Crucial para desarrollo radicular
+        - **Potasio (K):** 5-205 - Mayor variabilidad, resistencia a estrés
+        - **Temperatura:** 8.8-43.7°C - Cubre climas templados a tropicales
+        - **Humedad:** 14-99% - Diferencia cultivos de secano vs riego
+        - **pH:** 3.5-9.9 - Desde ácido (café) hasta alcalino (algodón)
+        - **Precipitación:** 20-298mm - Factor más discriminante
+        """)
+    
+    with tab2:
+        st.markdown('<div class="section-header"><h2>Distribuciones de Variables</h2></div>', unsafe_allow_html=True)
+        
+        st.markdown("##### 🌾 Balance de Clases (Target)")
+        crop_counts = agg['crop_counts']
+        fig = go.Figure(data=[go.Bar(x=crop_counts.index, y=crop_counts.values, marker=dict(color=crop_counts.values, colorscale='Greens', showscale=True), text=crop_counts.values, textposition='auto')])
+        fig.update_layout(title='Distribución de Cultivos - Balance Perfecto', xaxis_title='Cultivo', yaxis_title='Cantidad de Muestras', height=500, template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.info("**✅ Balance Perfecto:** Cada uno de los 22 cultivos tiene exactamente 100 observaciones. Esto elimina el sesgo de clases y garantiza métricas de evaluación confiables.")
+        
+        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+        st.markdown("##### 📊 Análisis de Variables Numéricas")
+        
+        num_cols = ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall']
+        var_descriptions = {
+            'N': 'Nitrógeno - Esencial para crecimiento vegetativo y desarrollo de hojas',
+            'P': 'Fósforo - Fundamental para desarrollo radicular y floración',
+            'K': 'Potasio - Resistencia a enfermedades y calidad del fruto',
+            'temperature': 'Temperatura - Determina la estación de siembra y zona agroclimática',
+            'humidity': 'Humedad - Afecta enfermedades fúngicas y evapotranspiración',
+            'ph': 'pH del Suelo - Disponibilidad de nutrientes y cultivos específicos',
+            'rainfall': 'Precipitación - Factor más discriminante, define necesidades de riego'
+        }
+        
+        selected_var = st.selectbox("Selecciona Variable:", num_cols, format_func=lambda x: f"{x.upper()}" if len(x) <= 2 else x.capitalize())
+        st.info(f"**Relevancia Agronómica:** {var_descriptions[selected_var]}")
+        
+        # >> figuras desde los agregados: histograma agrupado, cuantiles y muestra estratificada <<
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Histograma con Boxplot**")
+            fig = histogram_box_figure(agg['histograms'][selected_var], agg['box_stats'][selected_var], selected_var, color='#2ecc71')
+            fig.update_layout(title=f'Distribución de {selected_var.capitalize()}', height=400)
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            st.markdown("**Violin Plot**")
+            fig = violin_figure(agg['sample'], selected_var, color='#3498db')
+            fig.update_layout(title=f'Densidad de {selected_var.capitalize()}', height=400)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # >> Estadísticas de la variable seleccionada <<
+        var_stats = agg['describe'].loc[selected_var]
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Mínimo", f"{var_stats['min']:.2f}")
+        with col2:
+            st.metric("Media", f"{var_stats['mean']:.2f}")
+        with col3:
+            st.metric("Mediana", f"{var_stats['50%']:.2f}")
+        with col4:
+            st.metric("Máximo", f"{var_stats['max']:.2f}")
+        
+        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+        st.markdown("##### 🌾 Comparación de Perfiles de Cultivos")
+        
+        # >> Comparación de perfiles de cultivos <<
+        selected_crops = st.multiselect(
+            "Selecciona hasta 5 cultivos para comparar:",
+            list(agg['crop_medians'].index),
+            default=list(agg['crop_medians'].index)[:3],
+            max_selections=5,
+            format_func=lambda x: f"{CROP_ICONS.get(x, '🌱')} {x.capitalize()}"
+        )
+        
+        if selected_crops:
+            # >> medianas por cultivo normalizadas con el mínimo/máximo global precalculados <<
+            col_min = agg['describe'].loc[num_cols, 'min']
+            col_max = agg['describe'].loc[num_cols, 'max']
+            normalized = (agg['crop_medians'].loc[selected_crops, num_cols] - col_min) / (col_max - col_min)
+            
+            fig = go.Figure()
+            for crop in selected_crops:
+                crop_label = f"{CROP_ICONS.get(crop, '🌱')} {crop.capitalize()}"
+                fig.add_trace(go.Scatterpolar(
+                    r=normalized.loc[crop].tolist(),
+                    theta=num_cols,
+                    fill='toself',
+                    name=crop_label
+                ))
+            
+            fig.update_layout(
+                polar=dict(radialaxis=dict(range=[0, 1], showticklabels=True)),
+                title='Comparación de Perfiles de Cultivos (Normalizado)',
+                height=500
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with tab3:
+        st.markdown('<div class="section-header"><h2>Análisis de Correlaciones</h2></div>', unsafe_allow_html=True)
+        
+        st.info("🔍 **¿Qué buscamos?** Analizar la multicolinealidad entre variables. Correlaciones altas (>0.7) indicarían redundancia y podrían requerir eliminación de features. Correlaciones bajas son ideales para ML.")
+        
+        corr = agg['corr']
+        
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("##### 📊 Matriz de Correlación")
+            fig = px.imshow(
+                corr, 
+                text_auto='.2f', 
+                color_continuous_scale='RdBu_r', 
+                zmin=-1, 
+                zmax=1,
+                title='Correlaciones entre Variables Predictoras',
+                height=500
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("##### 📈 Top Correlaciones")
+            # >> pares ya ordenados por |correlación| en los agregados <<
+            for var1, var2, val in agg['corr_pairs'][:5]:
+                color = "🔴" if abs(val) > 0.5 else "🟡" if abs(val) > 0.3 else "🟢"
+                st.markdown(f"{color} **{var1}** ↔ **{var2}**: {val:.3f}")
+            
+            st.markdown("---")
+            st.markdown("##### 🎯 Interpretación")
+            st.markdown("""
+            - 🟢 < 0.3: Independiente
+            - 🟡 0.3-0.5: Débil
+            - 🔴 > 0.5: Moderada
+            """)
+        
+        st.success("""
+        **✅ Conclusión del Análisis de Correlación:**
+        - **Correlaciones máximas < ±0.3:** No hay multicolinealidad problemática
+        - **Variables independientes:** Cada feature aporta información única
+        - **No es necesario eliminar features:** Todas son relevantes para el modelo
+        - **K-N (0.25):** Débil positiva - compatible con fertilización conjunta
+        - **Resto < ±0.15:** Prácticamente no correlacionados
+        """)
+    
+    with tab4:
+        st.markdown('<div class="section-header"><h2>💡 Insights Clave del Análisis</h2></div>', unsafe_allow_html=True)
+        
+        st.markdown("### 🎯 Principales Hallazgos del EDA")
+        st.info("Este análisis reveló patrones fundamentales para la agricultura de precisión")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🌧️ Variables Más Discriminantes")
+            st.markdown("""
+            1. **Rainfall (Precipitación):** Factor #1 - Separa cultivos de riego vs secano
+            2. **Temperature:** Diferencia cultivos tropicales (>30°C) de templados (<20°C)
+            3. **Humidity:** Correlacionado con precipitación, afecta enfermedades
+            4. **pH:** Identifica cultivos específicos (café 4.5-5.5, algodón 7-8)
+            5. **N, P, K:** Requerimientos nutricionales únicos por cultivo
+            """)
+            
+            st.markdown("#### 🌾 Grupos de Cultivos Identificados")
+            st.markdown("""
+            **Grupo 1: Tropicales Húmedos**
+            - 🍚 Rice, 🥥 Coconut, 🏉 Papaya, 🍌 Banana
+            - Alta humedad (>80%), Alta temp (>25°C), Precipitación >150mm
+            
+            **Grupo 2: Áridos**
+            - 🫘 Chickpea, 🫘 Mothbeans, 𓇢 Lentil
+            - Baja precipitación (<50mm), Resistentes a sequía
+            
+            **Grupo 3: Templados**
+            - 🍎 Apple, 🍇 Grapes
+            - Temperatura <20°C, pH ácido, Zonas de montaña
+            
+            **Grupo 4: Industriales**
+            - ☁️ Cotton, 🌿 Jute, ☕ Coffee
+            - Alto N, Alta precipitación, Agricultura intensiva
+            """)
+        
+        with col2:
+            st.markdown("#### 📊 Calidad del Dataset")
+            st.success("""
+            - ✅ **Sin valores nulos:** 0% missing data
+            - ✅ **Sin duplicados:** Todas las observaciones únicas
+            - ✅ **Balance perfecto:** 100 muestras por cultivo
+            - ✅ **Sin multicolinealidad:** Máx correlación 0.25
+            - ✅ **Outliers conservados:** Representan condiciones extremas válidas
+            """)
+            
+            st.markdown("#### 🔬 Feature Engineering")
+            st.code("N_over_PK = N / (P + K + 1e-6)", language="python")
+            st.info("""
+            **Justificación Agronómica:**
+            - Captura el balance N:P:K
+            - Leguminosas: bajo N (fijan N2 atmosférico)
+            - Cultivos de hoja: alto N
+            - Mejora separabilidad de clases
+            """)
+            
+            st.markdown("#### 📈 Implicaciones para el Modelo")
+            st.success("""
+            - 🎯 **Alta separabilidad:** Cultivos con requerimientos distintos
+            - 🎯 **No requiere balanceo:** Clases perfectamente equilibradas
+            - 🎯 **Features independientes:** Cada variable aporta info única
+            - 🎯 **Excelente para ML:** Esperamos +95% accuracy
+            """)
+        
+        st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+        
+        st.markdown("### 🌍 Contexto de Agricultura de Precisión")
+        st.warning("""
+        La **agricultura de precisión** utiliza tecnología y análisis de datos para optimizar 
+        el rendimiento agrícola. Este sistema permite a los agricultores:
+        
+        - 🎯 **Seleccionar el cultivo óptimo** según características del terreno
+        - 💰 **Maximizar rentabilidad** evitando cultivos inadecuados
+        - 🌱 **Reducir riesgo** de pérdidas por elección incorrecta
+        - ♻️ **Optimizar recursos** (agua, fertilizantes, tiempo)
+        - 🌍 **Agricultura sostenible** adaptada a cada región
+        """)
@@ -0,0 +1,82 @@
+"""
+Página de inicio: presentación del sistema y cultivos disponibles.
+"""
+
+# >> Imports <<
+import streamlit as st
+
+from views.common import CROP_ICONS, load_crop_names
+
+
+def render():
+    st.markdown("""
+    <div class="main-header">
+        <h1>🌾 Sistema de Recomendación de Cultivos</h1>
+        <p>Agricultura de Precisión - Upgrade Bootcamp</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown('<div class="metric-card"><p class="metric-value">22</p><p class="metric-label">Cultivos Analizados</p></div>', unsafe_allow_html=True)
+    with col2:
+        st.markdown('<div class="metric-card"><p class="metric-value">99%</p><p class="metric-label">Accuracy del Modelo</p></div>', unsafe_allow_html=True)
+    with col3:
+        st.markdown('<div class="metric-card"><p class="metric-value">2,200</p><p class="metric-label">Observaciones</p></div>', unsafe_allow_html=True)
+    with col4:
+        st.markdown('<div class="metric-card"><p class="metric-value">7</p><p class="metric-label">Variables Predictivas</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.markdown('<div class="section-header"><h2>🎯 ¿Qué Hace Este Sistema?</h2></div>', unsafe_allow_html=True)
+        st.markdown("""
+        Este sistema utiliza **Machine Learning avanzado** para analizar las características de tu terreno.
+        
+        **Analiza:**
+        - 🌱 **Composición del Suelo**: N, P, K, pH
+        - 🌡️ **Condiciones Climáticas**: Temperatura, Humedad, Precipitación
+        - 📊 **Patrones Históricos**: +2,000 siembras exitosas
+        
+        **Te Ofrece:**
+        - ✅ Recomendación óptima con 99% de precisión
+        - 📈 Probabilidades para múltiples cultivos
+        - 💡 Información agronómica especializada
+        """)
+    
+    with col2:
+        st.markdown('<div class="section-header"><h2>🚀 Cómo Funciona</h2></div>', unsafe_allow_html=True)
+        st.markdown("""
+        1. **📝 Ingresa los Datos**
+           - Características de suelo y clima
+           - Controles deslizantes intuitivos
+        
+        2. **🤖 Análisis con IA**
+           - Random Forest con 200 árboles
+           - Comparación con 2,200 casos históricos
+        
+        3. **🎯 Recibe Recomendación**
+           - Cultivo óptimo con confianza
+           - Top-5 alternativas
+        
+        4. **📚 Consulta la Guía**
+           - Épocas de siembra
+           - Manejo de fertilizantes
+        """)
+    
+    crops = load_crop_names()
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.markdown('<div class="section-header"><h2>🌾 Cultivos Disponibles</h2></div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    for i, crop in enumerate(crops):
+        icon = CROP_ICONS.get(crop, '🌱')
+        if i % 4 == 0:
+            col1.markdown(f"{icon} {crop.capitalize()}")
+        elif i % 4 == 1:
+            col2.markdown(f"{icon} {crop.capitalize()}")
+        elif i % 4 == 2:
+            col3.markdown(f"{icon} {crop.capitalize()}")
+        else:
+            col4.markdown(f"{icon} {crop.capitalize()}")
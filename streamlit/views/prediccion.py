@@ -0,0 +1,172 @@
+"""
+Página de predicción: sliders, modo tabla precalculada, explicación y top-5.
+
+El formulario y el panel de resultados forman un fragmento (st.fragment):
+al interactuar con ellos solo se vuelve a ejecutar el fragmento, no el CSS,
+la barra lateral ni el enrutado de app.py. En modo botón los sliders van en
+un st.form y no provocan reruns hasta pulsar "Predecir"; en modo en vivo
+cada control predice al soltarlo (Streamlit solo envía el valor al terminar
+el arrastre, lo que actúa como debounce) y la respuesta sale de la caché.
+
+Bajo la tarjeta del resultado se muestra cuánto aportó cada variable a la
+probabilidad del cultivo (croprec.explain sobre el bosque aplanado).
+"""
+
+# >> Imports <<
+import time
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from views.common import CROP_ICONS, load_predictor, load_lookup_table, load_flat_forest
+
+# >> Nombres de las variables del modelo en la explicación <<
+FEATURE_LABELS = {
+    'N': 'Nitrógeno (N)', 'P': 'Fósforo (P)', 'K': 'Potasio (K)', 'temperature': 'Temperatura (°C)',
+    'humidity': 'Humedad (%)', 'ph': 'pH', 'rainfall': 'Precipitación (mm)', 'N_over_PK': 'N / (P + K)'
+}
+
+
+def render():
+    st.markdown('<div class="main-header"><h1>🔮 Predicción de Cultivo Óptimo</h1><p>Recomendación Personalizada con IA</p></div>', unsafe_allow_html=True)
+
+    try:
+        predictor = load_predictor()
+        predictor.model()
+        model_loaded = True
+    except:
+        st.error("❌ Error al cargar modelo")
+        model_loaded = False
+
+    if model_loaded:
+        st.markdown('<div class="info-box-blue"><h4>💡 Instrucciones</h4><p>Ajusta los controles con las características de tu terreno.</p></div>', unsafe_allow_html=True)
+        prediction_panel(predictor, load_lookup_table())
+
+
+def input_sliders():
+    """
+    Sliders de entrada; devuelve (N, P, K, temperature, humidity, ph, rainfall).
+    """
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 🌱 Composición del Suelo")
+        N = st.slider("Nitrógeno (N)", 0, 140, 50)
+        P = st.slider("Fósforo (P)", 5, 145, 50)
+        K = st.slider("Potasio (K)", 5, 205, 50)
+        ph = st.slider("pH", 3.5, 9.9, 6.5, 0.1)
+
+    with col2:
+        st.markdown("#### 🌡️ Condiciones Climáticas")
+        temperature = st.slider("Temperatura (°C)", 8.0, 44.0, 25.0, 0.5)
+        humidity = st.slider("Humedad (%)", 14, 99, 70)
+        rainfall = st.slider("Precipitación (mm)", 20, 300, 100)
+    return N, P, K, temperature, humidity, ph, rainfall
+
+
+def lookup_checkbox(predictor, lookup_table):
+    """
+    Opción de tabla precalculada, solo si corresponde al modelo cargado.
+    """
+    # >> modo opcional: tabla precalculada del mismo modelo (O(1), aproximada) <<
+    if lookup_table is None:
+        return False
+    if lookup_table.model_hash == predictor.model_hash:
+        return st.checkbox("⚡ Respuesta instantánea (tabla precalculada, aproximada)")
+    st.caption("⚠️ La tabla precalculada corresponde a otro modelo; se usa el modelo exacto.")
+    return False
+
+
+@st.fragment
+def prediction_panel(predictor, lookup_table):
+    # >> solo este fragmento se re-ejecuta al mover sliders o pulsar el botón <<
+    live = st.toggle("🔴 Predicción en vivo", help="Predice al soltar cada control, sin pulsar el botón")
+
+    if live:
+        values = input_sliders()
+        use_lookup = lookup_checkbox(predictor, lookup_table)
+        submitted = True
+    else:
+        with st.form("prediction_form", border=False):
+            values = input_sliders()
+            use_lookup = lookup_checkbox(predictor, lookup_table)
+            submitted = st.form_submit_button("🌾 Predecir Cultivo Recomendado", type="primary")
+
+    if submitted:
+        show_prediction(predictor, lookup_table, values, use_lookup, live)
+
+
+def show_prediction(predictor, lookup_table, values, use_lookup, live):
+    """
+    Tarjeta del cultivo recomendado, top-5 y estado de la caché.
+    """
+    with st.spinner("🔬 Analizando..."):
+        if use_lookup:
+            crop, top_crops = lookup_table.predict_crop(*values)
+        else:
+            crop, top_crops = predictor.predict_crop(*values)
+
+    if not live:
+        st.success("✅ Completado!")
+    icon = CROP_ICONS.get(crop, '🌱')
+    confidence = top_crops[crop] * 100
+
+    st.markdown(f"""
+    <div style='background: linear-gradient(135deg, #2ecc71 0%, #27ae60 100%); padding: 2rem; border-radius: 15px; text-align: center; color: white; margin: 2rem 0;'>
+        <h1 style='font-size: 3rem; margin: 0;'>{icon}</h1>
+        <h2>Cultivo Recomendado</h2>
+        <h1 style='font-size: 2.5rem; text-transform: uppercase;'>{crop}</h1>
+        <p style='font-size: 1.5rem;'>Confianza: {confidence:.2f}%</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # >> en modo tabla no se toca el bosque: la explicación solo acompaña a la predicción exacta <<
+    if use_lookup:
+        st.caption("🔍 La explicación por variable solo está disponible con el modelo exacto.")
+    else:
+        show_explanation(predictor, values, crop)
+
+    top_df = pd.DataFrame([(c, p) for c, p in top_crops.items()], columns=['Cultivo', 'Probabilidad'])
+    top_df['Probabilidad (%)'] = (top_df['Probabilidad'] * 100).round(2)
+    top_df['Cultivo'] = top_df['Cultivo'].apply(lambda x: f"{CROP_ICONS.get(x, '🌱')} {x.capitalize()}")
+
+    fig = go.Figure(go.Bar(x=top_df['Probabilidad (%)'], y=top_df['Cultivo'], orientation='h', marker=dict(color=top_df['Probabilidad (%)'], colorscale='Greens'), text=[f"{v:.2f}%" for v in top_df['Probabilidad (%)']], textposition='auto'))
+    fig.update_layout(title='Top 5 Cultivos', xaxis_title='Probabilidad (%)', height=350)
+    st.plotly_chart(fig, use_container_width=True)
+
+    cache_info = predictor.info()
+    st.caption(f"⚡ Caché de predicciones: {cache_info['hits']:,} aciertos, {cache_info['misses']:,} fallos ({cache_info['hit_rate']:.0%}), {cache_info['size']:,}/{cache_info['maxsize']:,} entradas")
+
+
+def show_explanation(predictor, values, crop):
+    """
+    Contribución de cada variable a la probabilidad del cultivo recomendado.
+    """
+    from croprec.cache import dequantize_key, quantize_inputs
+    from croprec.explain import explain_crop
+
+    t0 = time.perf_counter()
+    pipeline, le, model_hash = predictor.model()
+    forest = load_flat_forest(model_hash, pipeline)
+    # >> mismo punto de la rejilla que la predicción servida por la caché <<
+    point = dequantize_key(quantize_inputs(values, predictor.resolution), predictor.resolution)
+    explanation = explain_crop(forest, le, *point, crop=crop)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    st.markdown(f"#### 🔍 ¿Por qué {crop}?")
+    contributions = explanation['contributions']
+    labels = [f"{FEATURE_LABELS[f]} = {v:.2f}" if f == 'N_over_PK' else f"{FEATURE_LABELS[f]} = {v:g}"
+              for f, v, _ in contributions]
+    fig = go.Figure(go.Waterfall(
+        orientation='h', measure=['absolute'] + ['relative'] * len(contributions) + ['total'],
+        y=['Base (frecuencia del cultivo)'] + labels + ['Probabilidad final'],
+        x=[explanation['base'] * 100] + [c * 100 for _, _, c in contributions] + [0],
+        text=[f"{explanation['base']:.1%}"] + [f"{c * 100:+.1f} pp" for _, _, c in contributions]
+             + [f"{explanation['probability']:.1%}"],
+        textposition='outside', increasing=dict(marker=dict(color='#27ae60')),
+        decreasing=dict(marker=dict(color='#e74c3c')), totals=dict(marker=dict(color='#2c3e50'))))
+    fig.update_layout(xaxis_title='Probabilidad (%)', yaxis=dict(autorange='reversed'),
+                      height=420, margin=dict(l=10, r=10, t=10, b=10))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"Aportación de cada variable en puntos porcentuales sobre la probabilidad del modelo "
+               f"(descomposición por caminos del bosque, {elapsed_ms:.0f} ms)")
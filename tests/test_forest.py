@@ -0,0 +1,79 @@
+"""
+Equivalencia de los bosques exportados (croprec.forest) con el pipeline.
+
+El pipeline se entrena aquí sobre data/Crop_recommendation.csv con los
+parámetros de croprec.train, así que las pruebas no dependen de los
+artefactos de models/. El recorrido con numba solo se prueba si está instalado.
+
+Uso:
+    python -m pytest tests/test_forest.py
+"""
+
+# >> Imports <<
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from croprec import forest as forest_module
+from croprec.features import FEATURES
+from croprec.forest import CompactForest, FlatForest, check_against_pipeline
+from croprec.train import RANDOM_STATE, RF_PARAMS, load_dataset
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    # >> features del modelo (n, 8) y etiquetas codificadas de todo el CSV <<
+    df = load_dataset()
+    return df[FEATURES].to_numpy(), LabelEncoder().fit_transform(df['label'])
+
+
+@pytest.fixture(scope='module')
+def pipeline(dataset):
+    X, y = dataset
+    model = Pipeline([
+        ('scaler', StandardScaler()),
+        ('rf', RandomForestClassifier(**RF_PARAMS, random_state=RANDOM_STATE)),
+    ])
+    return model.fit(X, y)
+
+
+@pytest.mark.parametrize('fold_scaler', [False, True])
+def test_flat_forest_matches_pipeline(dataset, pipeline, fold_scaler):
+    X, _ = dataset
+    forest = FlatForest.from_pipeline(pipeline, fold_scaler=fold_scaler)
+
+    proba = forest.predict_proba(X, use_numba=False)
+    np.testing.assert_allclose(proba, pipeline.predict_proba(X), rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(forest.predict(X), pipeline.predict(X))
+
+
+@pytest.mark.skipif(forest_module.numba is None, reason='numba no está instalado')
+@pytest.mark.parametrize('fold_scaler', [False, True])
+def test_flat_forest_numba_matches_pipeline(dataset, pipeline, fold_scaler):
+    X, _ = dataset
+    forest = FlatForest.from_pipeline(pipeline, fold_scaler=fold_scaler)
+
+    proba = forest.predict_proba(X, use_numba=True)
+    np.testing.assert_allclose(proba, pipeline.predict_proba(X), rtol=0, atol=1e-9)
+    np.testing.assert_allclose(proba, forest.predict_proba(X, use_numba=False), rtol=0, atol=1e-12)
+
+
+def test_compact_forest_matches_pipeline(dataset, pipeline):
+    X, _ = dataset
+    forest = CompactForest.from_pipeline(pipeline)
+    assert forest.leaf_values.dtype == np.uint8
+
+    check_against_pipeline(forest, pipeline, X)
+    np.testing.assert_array_equal(forest.predict(X), pipeline.predict(X))
+
+
+def test_saved_forests_match_pipeline(dataset, pipeline, tmp_path):
+    X, _ = dataset
+    flat = FlatForest.from_pipeline(pipeline, fold_scaler=True)
+    flat.save(tmp_path / 'flat.npz')
+    CompactForest.from_pipeline(pipeline).save(tmp_path / 'compact')
+
+    check_against_pipeline(FlatForest.load(tmp_path / 'flat.npz'), pipeline, X)
+    check_against_pipeline(CompactForest.load(tmp_path / 'compact'), pipeline, X)